@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""EPUB export time and peak memory: ebooklib versus the native streaming writer.
+
+Builds a combined book of synthetic transcript chapters with ``export_book``
+once per writer and reports wall time, Python peak allocation (tracemalloc)
+and output size. Requires ``ebooklib`` for the comparison.
+
+Usage: python scripts/bench_epub.py [--chapters 100] [--kb 400] [--workers N]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from podcast_transcriber.exporters.exporter import export_book  # noqa: E402
+
+WORDS = (
+    "so we talked about the launch window and why the <fuel> margins matter "
+    "when the orbit is low & the budget is tight, and then the guest explained "
+    "how small teams plan missions with very little hardware"
+).split()
+
+
+def make_chapters(n: int, kb: float, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    chapters = []
+    for i in range(n):
+        paras, size = [], 0
+        while size < kb * 1024:
+            para = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(40, 120)))
+            paras.append(para.capitalize() + ".")
+            size += len(para) + 2
+        chapters.append(
+            {
+                "title": f"Episode {i + 1}",
+                "text": "\n\n".join(paras),
+                "start": 0.0,
+                "end": 3600.0,
+            }
+        )
+    return chapters
+
+
+def run(
+    writer: str, chapters: list[dict], out: Path, workers: Optional[int] = None
+) -> tuple[float, int]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    export_book(
+        chapters,
+        str(out),
+        "epub",
+        title="Bench",
+        epub_writer=writer,
+        render_workers=workers,
+    )
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--chapters", type=int, default=100)
+    ap.add_argument("--kb", type=float, default=400, help="text per chapter in KiB")
+    ap.add_argument(
+        "--workers", type=int, default=None, help="chapter render processes"
+    )
+    args = ap.parse_args()
+    try:
+        import ebooklib  # noqa: F401
+    except Exception:
+        print("ebooklib is not installed; nothing to compare against")
+        return 1
+    chapters = make_chapters(args.chapters, args.kb)
+    mb = sum(len(c["text"]) for c in chapters) / (1024 * 1024)
+    print(f"book: {args.chapters} chapters, {mb:.1f} MiB of text")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for writer in ("ebooklib", "native"):
+            out = Path(tmp) / f"{writer}.epub"
+            elapsed, peak = run(writer, chapters, out, args.workers)
+            results[writer] = elapsed
+            print(
+                f"{writer:8}: {elapsed:6.2f}s  peak {peak / 2**20:7.1f} MiB  "
+                f"file {out.stat().st_size / 2**20:6.1f} MiB"
+            )
+    print(f"speedup: {results['ebooklib'] / results['native']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
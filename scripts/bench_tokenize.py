@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Throughput of the NLP text scans, before and after the fused tokenizer.
+
+"before" repeats the passes the NLP helpers used to make over a transcript:
+a sentence split each for summary and segmentation, a per-sentence word scan
+for TF-IDF terms and two full scans (capitalized phrases, words) for key
+takeaways. "after" is one sentence split plus one fused token scan.
+
+Usage: python scripts/bench_tokenize.py [--mb 4] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from podcast_transcriber.nlp.tokenize import split_sentences, tokenize  # noqa: E402
+
+WORDS = (
+    "the rocket launch was delayed because engineers found a fuel leak and "
+    "we talked with Anna Lindqvist from the European Space Agency about how "
+    "OpenAI models and Chat Completions could help Mission Control teams plan "
+    "orbit insertion burns while the market for small satellites keeps growing"
+).split()
+
+
+def make_text(mb: float, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    parts, size = [], 0
+    while size < mb * 1024 * 1024:
+        sent = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(6, 24)))
+        sent = sent[0].upper() + sent[1:] + rnd.choice(".?!")
+        if rnd.random() < 0.05:
+            sent += "\n\n"
+        parts.append(sent)
+        size += len(sent) + 1
+    return " ".join(parts)
+
+
+def before(text: str) -> int:
+    sentence_re = r"(?<=[.!?])\s+|\n\s*\n"
+    n = 0
+    for _ in range(2):  # summary and segmentation each split the text
+        n += len([s for s in re.split(sentence_re, text.strip()) if s.strip()])
+    for sent in re.split(sentence_re, text.strip()):
+        n += len(re.findall(r"[^\W\d_]{3,}", sent.lower()))
+    n += len(re.findall(r"(?:[A-Z][a-z]+(?: [A-Z][a-z]+){0,3})", text))
+    n += len(re.findall(r"[A-Za-zÅÄÖåäö0-9']+", text))
+    return n
+
+
+def after(text: str) -> int:
+    tokens = tokenize(text)
+    return len(split_sentences(text)) + len(tokens.words) + len(tokens.phrases)
+
+
+def bench(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--mb", type=float, default=4.0, help="transcript size in MiB")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    text = make_text(args.mb)
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    t_before = bench(before, text, args.repeat)
+    t_after = bench(after, text, args.repeat)
+    print(f"text: {mb:.2f} MiB")
+    print(f"before: {t_before:.3f}s  ({mb / t_before:.1f} MiB/s)")
+    print(f"after:  {t_after:.3f}s  ({mb / t_after:.1f} MiB/s)")
+    print(f"speedup: {t_before / t_after:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -74,6 +74,7 @@ def build_parser() -> argparse.ArgumentParser:
             "srt",
             "vtt",
             "json",
+            "jsonl",
             "md",
         ],
         help="Output format. If not provided, inferred from --output extension or defaults to txt.",
@@ -327,6 +328,70 @@ def _interactive_fill_args(args: argparse.Namespace) -> None:
         args.language = lang or None
 
 
+def _transcribe(service, local_path, args, source: Optional[str] = None) -> str:
+    """Transcribe through the transcript cache unless ``--no-cache`` is set."""
+    from .utils import cache as _cache
+
+    return _cache.transcribe_cached(
+        service,
+        local_path,
+        service_name=args.service,
+        source=source,
+        language=args.language,
+        model=args.whisper_model or getattr(service, "model_name", None),
+        translate=bool(args.translate),
+        speakers=args.speakers,
+        extra=(f"chunk={args.chunk_seconds or 0}",),
+        cache_dir=args.cache_dir,
+        enabled=not args.no_cache,
+    )
+
+
+def _cache_main(argv) -> int:
+    """``podcast-transcriber cache stats|prune``: inspect or trim the cache."""
+    import json
+
+    from .utils import cache as _cache
+    from .utils.cache_store import parse_duration, parse_size
+
+    p = argparse.ArgumentParser(
+        prog="podcast-transcriber cache",
+        description="Inspect or prune the transcript cache.",
+    )
+    sub = p.add_subparsers(dest="action", required=True)
+    st = sub.add_parser("stats", help="Show entries, size and hit/miss counters")
+    st.add_argument("--json", action="store_true", help="Print stats as JSON")
+    pr = sub.add_parser("prune", help="Drop expired entries and enforce the budget")
+    pr.add_argument("--max-bytes", default=None, help="Size budget, e.g. 500M or 2G")
+    pr.add_argument("--ttl", default=None, help="Maximum entry age, e.g. 30d or 12h")
+    for sp in (st, pr):
+        sp.add_argument(
+            "--cache-dir",
+            default=None,
+            help="Cache directory (default: ~/.cache/podcast_transcriber)",
+        )
+    args = p.parse_args(argv)
+    store = _cache.open_store(args.cache_dir)
+    if args.action == "prune":
+        try:
+            result = store.prune(
+                max_bytes=parse_size(args.max_bytes), ttl=parse_duration(args.ttl)
+            )
+        except ValueError as e:
+            raise SystemExit(str(e)) from e
+        print(
+            f"Pruned {result['expired']} expired, {result['evicted']} evicted, "
+            f"{result['missing']} missing entries"
+        )
+    stats = store.stats()
+    if getattr(args, "json", False):
+        print(json.dumps(stats, indent=2))
+    else:
+        for name, value in stats.items():
+            print(f"{name}: {value}")
+    return 0
+
+
 def main(argv=None) -> int:
     if argv is None:
         argv = sys.argv[1:]
@@ -336,6 +401,8 @@ def main(argv=None) -> int:
             "Podcast Transcription CLI Tool — Developed by Johan Caripson\n"
         )
         return 0
+    if argv and argv[0] == "cache":
+        return _cache_main(argv[1:])
     args = build_parser().parse_args(argv)
     # If interactive, collect essentials before validation
     if args.interactive:
@@ -476,7 +543,7 @@ def main(argv=None) -> int:
                 cover_bytes = None
                 for src in srcs:
                     lp = ensure_local_audio(src)
-                    txt = service.transcribe(lp, language=args.language)
+                    txt = _transcribe(service, lp, args, source=src)
                     if args.normalize:
                         from .utils.textproc import normalize_text as _norm
 
@@ -493,14 +560,9 @@ def main(argv=None) -> int:
                         if not cover_bytes:
                             cover_url = getattr(lp, "cover_url", None)
                             if cover_url:
-                                try:
-                                    import requests as _rq
-
-                                    r = _rq.get(cover_url, timeout=20)
-                                    r.raise_for_status()
-                                    cover_bytes = r.content
-                                except Exception:
-                                    cover_bytes = None
+                                from .utils.covers import fetch_cover
+
+                                cover_bytes = fetch_cover(cover_url)
                 # Determine format from target path
                 fmt = args.format or infer_format_from_path(args.combine_into) or "epub"
                 # Build metadata payload suitable for EPUB/KDP
@@ -536,7 +598,7 @@ def main(argv=None) -> int:
                 out_dir.mkdir(parents=True, exist_ok=True)
                 for src in srcs:
                     lp = ensure_local_audio(src)
-                    txt = service.transcribe(lp, language=args.language)
+                    txt = _transcribe(service, lp, args, source=src)
                     segs = getattr(service, "last_segments", None)
                     words = getattr(service, "last_words", None)
                     if args.normalize:
@@ -573,54 +635,7 @@ def main(argv=None) -> int:
         # Single-file mode: resolve local path (download if URL)
         local_path = ensure_local_audio(args.url)
 
-        # Simple cache lookup for single-file mode
-        text = None
-        cache_key = None
-        if not args.input_file and not args.no_cache:
-            try:
-                from .utils import cache as _cache
-
-                cache_key = _cache.compute_key(
-                    source=args.url,
-                    service=args.service,
-                    opts=tuple(
-                        filter(
-                            None,
-                            [
-                                str(args.language or ""),
-                                str(args.speakers or 0),
-                                str(args.whisper_model or ""),
-                                "translate" if args.translate else "",
-                                str(args.chunk_seconds or 0),
-                            ],
-                        )
-                    ),
-                    local_path=str(local_path),
-                )
-                payload = _cache.get(args.cache_dir, cache_key)
-                if payload and "text" in payload:
-                    text = payload["text"]
-                    try:
-                        service.last_segments = payload.get("segments")
-                        service.last_words = payload.get("words")
-                    except Exception:
-                        pass
-            except Exception:
-                text = None
-        if text is None:
-            text = service.transcribe(local_path, language=args.language)
-            if cache_key and not args.no_cache:
-                try:
-                    from .utils import cache as _cache
-
-                    payload = {
-                        "text": text,
-                        "segments": getattr(service, "last_segments", None),
-                        "words": getattr(service, "last_words", None),
-                    }
-                    _cache.set(args.cache_dir, cache_key, payload)
-                except Exception:
-                    pass
+        text = _transcribe(service, local_path, args, source=args.url)
     finally:
         # Clean up temp file if it was created during download
         if local_path is not None:
@@ -715,14 +730,9 @@ def main(argv=None) -> int:
             if not cover_bytes:
                 cover_url = getattr(local_path, "cover_url", None)
                 if cover_url:
-                    try:
-                        import requests as _rq
-
-                        r = _rq.get(cover_url, timeout=20)
-                        r.raise_for_status()
-                        cover_bytes = r.content
-                    except Exception:
-                        cover_bytes = None
+                    from .utils.covers import fetch_cover
+
+                    cover_bytes = fetch_cover(cover_url)
 
         export_transcript(
             text,
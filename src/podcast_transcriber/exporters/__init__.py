@@ -1,6 +1,7 @@
 from .exporter import (
     SUPPORTED_FORMATS,
     export_book,
+    export_many,
     export_transcript,
     infer_format_from_path,
 )
@@ -10,4 +11,5 @@ __all__ = [
     "infer_format_from_path",
     "SUPPORTED_FORMATS",
     "export_book",
+    "export_many",
 ]
@@ -0,0 +1,183 @@
+"""Chapter XHTML for ``export_book``, rendered in parallel and cached.
+
+Combined books (``--combine-into``, digests) can hold hundreds of episodes,
+and escaping every paragraph of every chapter is plain single-threaded
+string work. :func:`render_chapters` spreads it over a process pool once the
+book is large enough to pay for the workers, and yields each chapter's body
+in reading order so the EPUB writer can stream it.
+
+Rendered chapters can also be kept under ``<cache dir>/chapters/`` keyed by a
+hash of their title, time range and text (``export_book(chapter_cache=...)``
+or ``PODCAST_TRANSCRIBER_CHAPTER_CACHE=1``), so rebuilding a combined book
+with one more episode only renders the new chapter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from ..nlp.chapterize import chapter_span
+from .rendered import iter_html_paragraphs
+
+ENV_CHAPTER_CACHE = "PODCAST_TRANSCRIBER_CHAPTER_CACHE"
+# Bump when the chapter markup changes so stale cache entries are ignored
+RENDER_VERSION = 1
+# Below this much text a process pool costs more than it saves
+PARALLEL_MIN_CHARS = 4 << 20
+
+
+def chapter_title(chapter: dict, idx: int) -> str:
+    return str(chapter.get("title") or f"Chapter {idx}")
+
+
+def render_chapter(chapter: dict, idx: int) -> str:
+    """Body XHTML of one chapter: heading, time range and escaped paragraphs."""
+    parts = [f"<h1>{html.escape(chapter_title(chapter, idx))}</h1>"]
+    span = chapter_span(chapter)
+    if span:
+        parts.append(f"<p class='chapter-time'>{span}</p>")
+    parts.extend(iter_html_paragraphs(str(chapter.get("text", ""))))
+    return "\n".join(parts)
+
+
+def _render_job(args: tuple[dict, int]) -> str:
+    return render_chapter(*args)
+
+
+class ChapterCache:
+    """Rendered chapter bodies on disk, one file per content hash."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def key(self, chapter: dict, idx: int) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        for part in (
+            str(RENDER_VERSION),
+            chapter_title(chapter, idx),
+            chapter_span(chapter) or "",
+            str(chapter.get("text", "")),
+        ):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.xhtml"
+
+    def has(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, body: str) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # the chapter is rendered either way; only caching failed
+
+
+def get_chapter_cache(
+    setting: bool | str | None = None,
+) -> Optional[ChapterCache]:
+    """Cache for ``setting``: True (``<cache>/chapters``), a directory, or off.
+
+    None reads ``PODCAST_TRANSCRIBER_CHAPTER_CACHE`` (``1`` or a directory).
+    """
+    if setting is None:
+        value = os.environ.get(ENV_CHAPTER_CACHE, "").strip()
+        if value.lower() in ("", "0", "false", "no", "off"):
+            return None
+        setting = True if value.lower() in ("1", "true", "yes", "on") else value
+    if setting is False:
+        return None
+    if setting is True:
+        from ..utils.cache import _default_cache_dir
+
+        return ChapterCache(_default_cache_dir() / "chapters")
+    return ChapterCache(setting)
+
+
+def _pool_size(chapters: list[dict], workers: Optional[int]) -> int:
+    if not chapters:
+        return 1
+    if workers is None:
+        size = sum(len(str(ch.get("text", ""))) for ch in chapters)
+        workers = (os.cpu_count() or 1) if size >= PARALLEL_MIN_CHARS else 1
+    return max(1, min(int(workers), len(chapters)))
+
+
+def render_chapters(
+    chapters: Iterable[dict],
+    *,
+    workers: Optional[int] = None,
+    cache: Optional[ChapterCache] = None,
+) -> Iterator[str]:
+    """Yield :func:`render_chapter` output for each chapter, in order.
+
+    workers: processes to render with; None picks one per CPU when the
+      chapters still to render hold at least ``PARALLEL_MIN_CHARS`` of text
+      and renders fewer inline. At most two chapters per worker are in
+      flight, so memory stays bounded.
+    cache: skip chapters rendered before and store the new ones. Cached
+      chapters are looked up first, so a fully cached book starts no pool.
+    """
+    chapters = list(chapters)
+    keys = [
+        cache.key(ch, idx) if cache is not None else None
+        for idx, ch in enumerate(chapters, start=1)
+    ]
+    cached = {i for i, key in enumerate(keys) if key and cache.has(key)}
+    size = _pool_size([ch for i, ch in enumerate(chapters) if i not in cached], workers)
+    pool = None
+    if size > 1:
+        try:
+            pool = ProcessPoolExecutor(max_workers=size)
+        except (OSError, NotImplementedError):
+            pool = None  # no process support here: render inline
+    pending: deque = deque()
+
+    def finish(item) -> str:
+        i, job, future = item
+        if i in cached:
+            body = cache.get(keys[i])
+            if body is not None:
+                return body
+        # A miss (or a cache file removed meanwhile): render it
+        body = future.result() if future is not None else _render_job(job)
+        if cache is not None:
+            cache.put(keys[i], body)
+        return body
+
+    try:
+        for i, ch in enumerate(chapters):
+            # Only the fields the markup uses cross the process boundary
+            job = ({k: ch.get(k) for k in ("title", "text", "start", "end")}, i + 1)
+            future = None
+            if pool is not None and i not in cached:
+                future = pool.submit(_render_job, job)
+            pending.append((i, job, future))
+            while len(pending) > 2 * size:
+                yield finish(pending.popleft())
+        while pending:
+            yield finish(pending.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
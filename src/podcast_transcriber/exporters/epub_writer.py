@@ -0,0 +1,292 @@
+"""Native streaming EPUB 3 writer (no ebooklib).
+
+ebooklib keeps every chapter as an ``EpubHtml`` object holding its full
+content and assembles the archive in memory on ``write_epub``; for books
+made of many hours of transcript that is slow and memory hungry.
+:class:`EpubWriter` writes straight into a :mod:`zipfile`: the ``mimetype``
+entry first and uncompressed, each chapter's XHTML as its body fragments
+are produced, and the package document, EPUB 3 navigation and NCX (for
+older readers) on :meth:`close`. Only titles and file names are kept in
+memory. The archive is built in a temporary file next to ``path`` and only
+moved into place once complete, so a failed export never leaves a truncated
+book behind.
+
+Used by the EPUB exporters when ``epub_writer="native"`` (or
+``PODCAST_TRANSCRIBER_EPUB_WRITER=native``) and whenever ebooklib is not
+installed.
+"""
+
+from __future__ import annotations
+
+import html
+import os
+import uuid
+import zipfile
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Optional
+
+ENV_EPUB_WRITER = "PODCAST_TRANSCRIBER_EPUB_WRITER"
+WRITERS = ("auto", "ebooklib", "native")
+MIMETYPE = "application/epub+zip"
+_ROOT = "EPUB"
+_CHUNK = 1 << 16
+_CONTAINER = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="EPUB/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+
+def resolve_writer(requested: Optional[str] = None) -> str:
+    """``ebooklib`` or ``native`` for a requested writer (``auto`` by default).
+
+    ``auto`` (and an unknown value) picks ebooklib when it is installed.
+    """
+    name = (requested or os.environ.get(ENV_EPUB_WRITER) or "auto").strip().lower()
+    if name == "native":
+        return "native"
+    try:
+        import ebooklib  # type: ignore  # noqa: F401
+    except Exception:
+        return "native"
+    return "ebooklib"
+
+
+def _esc(value) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def _image_type(data: bytes) -> str:
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return "image/jpeg"
+
+
+class EpubWriter:
+    """Write an EPUB 3 file chapter by chapter.
+
+    Call :meth:`set_cover` (optional) and :meth:`add_chapter` in reading
+    order, then :meth:`close` (or use it as a context manager).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        title: str,
+        author: Optional[str] = None,
+        language: Optional[str] = None,
+        description: Optional[str] = None,
+        subject: Optional[str] = None,
+        css: Optional[str] = None,
+        identifier: Optional[str] = None,
+        compresslevel: int = 6,
+    ):
+        self.title = title
+        self.author = author
+        self.language = language or "en"
+        self.description = description
+        self.subject = subject
+        self.identifier = identifier or f"urn:uuid:{uuid.uuid4()}"
+        self._css = bool(css)
+        self._cover: Optional[tuple[str, str]] = None  # (file name, media type)
+        self._chapters: list[tuple[str, str]] = []  # (title, file name)
+        self.path = path
+        # Same directory (so os.replace is atomic), mode 0666 minus the umask
+        self._tmp_path = os.path.join(
+            os.path.dirname(os.path.abspath(path)),
+            f".{os.path.basename(path)}.{uuid.uuid4().hex[:8]}.tmp",
+        )
+        fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            self._zip = zipfile.ZipFile(
+                os.fdopen(fd, "wb"),
+                "w",
+                zipfile.ZIP_DEFLATED,
+                compresslevel=compresslevel,
+            )
+        except BaseException:
+            os.unlink(self._tmp_path)
+            raise
+        # The mimetype must be the first entry, stored uncompressed
+        self._zip.writestr(
+            zipfile.ZipInfo("mimetype"), MIMETYPE, compress_type=zipfile.ZIP_STORED
+        )
+        self._zip.writestr("META-INF/container.xml", _CONTAINER)
+        if css:
+            self._zip.writestr(f"{_ROOT}/style/main.css", css)
+
+    def __enter__(self) -> EpubWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def abort(self) -> None:
+        """Discard the partial archive; ``path`` is left untouched."""
+        fp = self._zip.fp
+        try:
+            self._zip.close()
+        except Exception:
+            pass
+        finally:
+            if fp is not None:
+                fp.close()
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass
+
+    def _head(self, title: str) -> str:
+        css = (
+            "<link rel='stylesheet' type='text/css' href='style/main.css'/>"
+            if self._css
+            else ""
+        )
+        return (
+            "<?xml version='1.0' encoding='utf-8'?>\n<!DOCTYPE html>\n"
+            "<html xmlns='http://www.w3.org/1999/xhtml' "
+            "xmlns:epub='http://www.idpf.org/2007/ops' "
+            f"lang='{_esc(self.language)}' xml:lang='{_esc(self.language)}'>\n"
+            f"<head><meta charset='utf-8'/><title>{_esc(title)}</title>{css}</head>\n"
+        )
+
+    def set_cover(self, name: str, data: bytes) -> None:
+        """Embed ``data`` as the cover image (plus a cover page first in the spine)."""
+        media_type = _image_type(data)
+        ext = {"image/png": ".png", "image/gif": ".gif"}.get(media_type, ".jpg")
+        file_name = "images/cover" + ext
+        self._zip.writestr(f"{_ROOT}/{file_name}", data)
+        self._cover = (file_name, media_type)
+        self._zip.writestr(
+            f"{_ROOT}/cover.xhtml",
+            self._head(self.title)
+            + f"<body><div><img src='{file_name}' alt='{_esc(name)}'/></div></body>"
+            "\n</html>\n",
+        )
+
+    def add_chapter(
+        self, title: str, body: Iterable[str], file_name: Optional[str] = None
+    ) -> str:
+        """Stream one chapter: ``body`` yields XHTML fragments of its ``<body>``."""
+        file_name = file_name or f"chapter_{len(self._chapters) + 1}.xhtml"
+        with self._zip.open(f"{_ROOT}/{file_name}", "w") as fh:
+            # Batch fragments so deflate sees few large writes, not many tiny ones
+            buf = [self._head(title), "<body>\n"]
+            size = 0
+            for part in body:
+                buf.append(part)
+                buf.append("\n")
+                size += len(part)
+                if size >= _CHUNK:
+                    fh.write("".join(buf).encode("utf-8"))
+                    buf, size = [], 0
+            buf.append("</body>\n</html>\n")
+            fh.write("".join(buf).encode("utf-8"))
+        self._chapters.append((title, file_name))
+        return file_name
+
+    def _nav(self) -> str:
+        items = "\n".join(
+            f"<li><a href='{_esc(f)}'>{_esc(t)}</a></li>" for t, f in self._chapters
+        )
+        return (
+            self._head(self.title)
+            + "<body>\n<nav epub:type='toc' id='toc'>\n"
+            + f"<h2>{_esc(self.title)}</h2>\n<ol>\n{items}\n</ol>\n</nav>\n"
+            + "</body>\n</html>\n"
+        )
+
+    def _ncx(self) -> str:
+        points = "\n".join(
+            f"<navPoint id='np-{i}' playOrder='{i}'><navLabel><text>{_esc(t)}</text>"
+            f"</navLabel><content src='{_esc(f)}'/></navPoint>"
+            for i, (t, f) in enumerate(self._chapters, start=1)
+        )
+        return (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            "<ncx xmlns='http://www.daisy.org/z3986/2005/ncx/' version='2005-1'>\n"
+            f"<head><meta name='dtb:uid' content='{_esc(self.identifier)}'/></head>\n"
+            f"<docTitle><text>{_esc(self.title)}</text></docTitle>\n"
+            f"<navMap>\n{points}\n</navMap>\n</ncx>\n"
+        )
+
+    def _opf(self) -> str:
+        modified = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        meta = [
+            f"<dc:identifier id='id'>{_esc(self.identifier)}</dc:identifier>",
+            f"<dc:title>{_esc(self.title)}</dc:title>",
+            f"<dc:language>{_esc(self.language)}</dc:language>",
+            f"<meta property='dcterms:modified'>{modified}</meta>",
+        ]
+        if self.author:
+            meta.append(f"<dc:creator>{_esc(self.author)}</dc:creator>")
+        if self.description:
+            meta.append(f"<dc:description>{_esc(self.description)}</dc:description>")
+        if self.subject:
+            meta.append(f"<dc:subject>{_esc(self.subject)}</dc:subject>")
+        manifest = [
+            "<item id='nav' href='nav.xhtml' media-type='application/xhtml+xml' "
+            "properties='nav'/>",
+            "<item id='ncx' href='toc.ncx' media-type='application/x-dtbncx+xml'/>",
+        ]
+        spine = []
+        if self._css:
+            manifest.append(
+                "<item id='style' href='style/main.css' media-type='text/css'/>"
+            )
+        if self._cover:
+            file_name, media_type = self._cover
+            meta.append("<meta name='cover' content='cover-img'/>")
+            manifest.append(
+                f"<item id='cover-img' href='{file_name}' media-type='{media_type}' "
+                "properties='cover-image'/>"
+            )
+            manifest.append(
+                "<item id='cover' href='cover.xhtml' "
+                "media-type='application/xhtml+xml'/>"
+            )
+            spine.append("<itemref idref='cover'/>")
+        spine.append("<itemref idref='nav'/>")
+        for i, (_, file_name) in enumerate(self._chapters, start=1):
+            manifest.append(
+                f"<item id='c{i}' href='{_esc(file_name)}' "
+                "media-type='application/xhtml+xml'/>"
+            )
+            spine.append(f"<itemref idref='c{i}'/>")
+        nl = "\n    "
+        return (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            "<package xmlns='http://www.idpf.org/2007/opf' version='3.0' "
+            "unique-identifier='id'>\n"
+            "  <metadata xmlns:dc='http://purl.org/dc/elements/1.1/'>\n    "
+            + nl.join(meta)
+            + "\n  </metadata>\n  <manifest>\n    "
+            + nl.join(manifest)
+            + "\n  </manifest>\n  <spine toc='ncx'>\n    "
+            + nl.join(spine)
+            + "\n  </spine>\n</package>\n"
+        )
+
+    def close(self) -> None:
+        """Write navigation, NCX and the package document, then publish the file."""
+        fp = self._zip.fp
+        if fp is None:
+            return
+        try:
+            self._zip.writestr(f"{_ROOT}/nav.xhtml", self._nav())
+            self._zip.writestr(f"{_ROOT}/toc.ncx", self._ncx())
+            self._zip.writestr(f"{_ROOT}/content.opf", self._opf())
+            self._zip.close()
+            fp.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
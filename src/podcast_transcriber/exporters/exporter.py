@@ -1,10 +1,19 @@
 import os
 import html
+import itertools
 import shutil
 import subprocess
 import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+from ..nlp.chapterize import chapter_span, format_clock
+from ..utils.covers import EPUB_SIZE, PDF_SIZE, cover_variant, docx_size
+from .chapters import ChapterCache, get_chapter_cache, render_chapters
+from .epub_writer import EpubWriter, resolve_writer
+from .rendered import RenderedDocument, iter_html_paragraphs
 
 SUPPORTED_FORMATS = {
     "txt",
@@ -16,6 +25,7 @@ SUPPORTED_FORMATS = {
     "srt",
     "vtt",
     "json",
+    "jsonl",
     "md",
     "docx",
 }
@@ -45,9 +55,10 @@ def export_transcript(
     pdf_page_size: str = "A4",
     pdf_orientation: str = "portrait",
     pdf_font_file: Optional[str] = None,
-    # Optional rich metadata for advanced formats
-    segments: Optional[list[dict]] = None,
-    words: Optional[list[dict]] = None,
+    # Optional rich metadata for advanced formats (SRT/VTT/JSON/JSONL stream
+    # any iterable of segment/word dicts)
+    segments: Optional[Iterable[dict]] = None,
+    words: Optional[Iterable[dict]] = None,
     metadata: Optional[dict] = None,
     # PDF/EPUB richness
     pdf_header: Optional[str] = None,
@@ -64,6 +75,10 @@ def export_transcript(
     pdf_attribution_text: Optional[str] = None,
     # DOCX attribution page
     docx_attribution_text: Optional[str] = None,
+    # Shared paragraphs/HTML/cover built from this text and cover (see export_many)
+    rendered: Optional[RenderedDocument] = None,
+    # EPUB backend: auto (ebooklib when installed), ebooklib or native
+    epub_writer: Optional[str] = None,
 ) -> None:
     fmt = fmt.lower()
     if fmt not in SUPPORTED_FORMATS:
@@ -96,6 +111,7 @@ def export_transcript(
             toc_segments=(segments if auto_toc else None),
             append_attribution=pdf_append_attribution,
             attribution_text=pdf_attribution_text,
+            rendered=rendered,
         )
         return
 
@@ -111,6 +127,8 @@ def export_transcript(
             css_text=epub_css_text,
             segments=segments,
             metadata=metadata,
+            rendered=rendered,
+            writer=epub_writer,
         )
         return
 
@@ -134,8 +152,20 @@ def export_transcript(
         )
         return
 
+    if fmt == "jsonl":
+        _export_jsonl(
+            text,
+            out_path,
+            segments=segments,
+            words=words,
+            title=title,
+            author=author,
+            metadata=metadata,
+        )
+        return
+
     if fmt == "md":
-        _export_md(text, out_path, title=title, author=author)
+        _export_md(text, out_path, title=title, author=author, rendered=rendered)
         return
 
     if fmt == "docx":
@@ -151,6 +181,7 @@ def export_transcript(
             attribution_text=None,
             footer_text=docx_footer_text,
             footer_page_number=bool(docx_footer_include_page_number),
+            rendered=rendered,
         )
         return
 
@@ -164,9 +195,88 @@ def export_transcript(
         cover_image=cover_image,
         css_file=epub_css_file,
         css_text=epub_css_text,
+        rendered=rendered,
+        epub_writer=epub_writer,
     )
 
 
+# export_transcript arguments that shape the EPUB a Kindle format converts
+_KINDLE_EPUB_KEYS = ("title", "author", "epub_css_file", "epub_css_text")
+
+
+def _same_epub(kindle_kwargs: dict, epub_kwargs: dict) -> bool:
+    return all(kindle_kwargs.get(k) == epub_kwargs.get(k) for k in _KINDLE_EPUB_KEYS)
+
+
+def export_many(
+    text: str,
+    targets: list[tuple[str, str, dict]],
+    *,
+    cover_image: Optional[str] = None,
+    cover_image_bytes: Optional[bytes] = None,
+    segments: Optional[list[dict]] = None,
+    max_workers: Optional[int] = None,
+) -> list[Optional[Exception]]:
+    """Export ``text`` to several formats in parallel from one rendered build.
+
+    targets: (fmt, out_path, extra ``export_transcript`` keyword arguments)
+      per output. The paragraph split, escaped HTML and prepared cover are
+      built once (:class:`RenderedDocument`) and shared by every format;
+      Kindle formats convert the EPUB target instead of building a temporary
+      EPUB when its title, author and CSS match theirs.
+    Returns one entry per target, in order: None on success, else the
+    exception that format raised (other formats still complete).
+    """
+    if not targets:
+        return []
+    rendered = RenderedDocument(
+        text,
+        cover_image=cover_image,
+        cover_image_bytes=cover_image_bytes,
+        segments=segments,
+    ).prepare(fmt for fmt, _, _ in targets)
+    epub = next(((path, kw) for fmt, path, kw in targets if fmt == "epub"), None)
+    # EPUB first: Kindle conversions wait on it and must not starve it of a worker
+    order = sorted(range(len(targets)), key=lambda i: targets[i][0] != "epub")
+    workers = max_workers or min(len(targets), os.cpu_count() or 1)
+    futures: dict[int, object] = {}
+
+    def run(i: int) -> None:
+        fmt, out_path, kwargs = targets[i]
+        kindle = fmt in {"mobi", "azw", "azw3"}
+        if (
+            kindle
+            and epub
+            and _same_epub(kwargs, epub[1])
+            and futures[order[0]].exception() is None
+        ):
+            Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+            _export_kindle(
+                text,
+                out_path,
+                target_fmt=fmt,
+                title=None,
+                author=None,
+                source_epub=epub[0],
+            )
+            return
+        export_transcript(
+            text,
+            out_path,
+            fmt,
+            cover_image=cover_image,
+            cover_image_bytes=cover_image_bytes,
+            segments=segments,
+            rendered=rendered,
+            **kwargs,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for i in order:
+            futures[i] = pool.submit(run, i)
+    return [futures[i].exception() for i in range(len(targets))]
+
+
 def _export_pdf(
     text: str,
     out_path: str,
@@ -187,6 +297,7 @@ def _export_pdf(
     toc_segments: Optional[list[dict]] = None,
     append_attribution: bool = False,
     attribution_text: Optional[str] = None,
+    rendered: Optional[RenderedDocument] = None,
 ):
     try:
         from fpdf import FPDF  # type: ignore
@@ -241,13 +352,15 @@ def _export_pdf(
         fd, tmp_cover = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
         os.close(fd)
         try:
-            if cover_path:
+            if rendered is not None:
+                data = rendered.pdf_cover or b""
+            elif cover_path:
                 p = Path(cover_path)
                 if not p.exists():
                     raise FileNotFoundError(f"Cover image not found: {cover_path}")
-                data = _prepare_cover_bytes(p)
+                data = _prepare_cover_bytes(p, PDF_SIZE)
             else:
-                data = cover_image_bytes or b""
+                data = cover_variant(cover_image_bytes or b"", PDF_SIZE)
             Path(tmp_cover).write_bytes(data)
             if cover_fullpage:
                 # Full-page: draw image across page width, minimal margins
@@ -285,15 +398,16 @@ def _export_pdf(
         pdf.set_font(font, size=font_size + 2)
         pdf.cell(0, 10, "Table of Contents", ln=1)
         pdf.set_font(font, size=font_size)
-        for seg in toc_segments:
-            start = _format_timestamp(seg.get("start", 0.0))
-            spk = seg.get("speaker")
-            label = f"[{start}] {spk + ': ' if spk else ''}{(seg.get('text', '')[:60]).strip()}"
+        if rendered is not None and rendered.segments is toc_segments:
+            labels = rendered.toc
+        else:
+            labels = RenderedDocument(text, segments=toc_segments).toc
+        for label in labels:
             pdf.multi_cell(0, 6, label)
 
     # Basic wrapping: split on double newlines as paragraphs
-    for para in text.split("\n\n"):
-        for line in para.splitlines():
+    for lines in (rendered or RenderedDocument(text)).lines:
+        for line in lines:
             pdf.multi_cell(0, 8, line)
         pdf.ln(4)
     if append_attribution and attribution_text:
@@ -309,75 +423,20 @@ def _export_pdf(
     pdf.output(out_path)
 
 
-def _export_epub(
-    text: str,
-    out_path: str,
-    title: Optional[str],
-    author: Optional[str],
-    cover_image: Optional[str] = None,
-    cover_image_bytes: Optional[bytes] = None,
-    css_file: Optional[str] = None,
-    css_text: Optional[str] = None,
-    segments: Optional[list[dict]] = None,
-    metadata: Optional[dict] = None,
-):
-    try:
-        from ebooklib import epub  # type: ignore
-    except Exception as e:
-        raise RuntimeError(
-            "EPUB export requires 'ebooklib'. Install with: pip install ebooklib"
-        ) from e
+def _epub_metadata(metadata: Optional[dict]) -> tuple:
+    """``(language, description, subject)`` for the EPUB package metadata."""
+    if not metadata or not isinstance(metadata, dict):
+        return None, None, None
+    lang = metadata.get("language") or metadata.get("lang")
+    desc = metadata.get("description")
+    subj = metadata.get("keywords") or metadata.get("subjects")
+    # join list/tuple or accept string
+    if isinstance(subj, (list, tuple)):
+        subj = ", ".join(map(str, subj))
+    return lang or None, str(desc) if desc else None, str(subj) if subj else None
 
-    book = epub.EpubBook()
-    book.set_title(title or "Transcript")
-    if author:
-        book.add_author(author)
-    # Basic metadata helpful for KDP ingestion
-    try:
-        lang = None
-        if metadata and isinstance(metadata, dict):
-            lang = metadata.get("language") or metadata.get("lang")
-            desc = metadata.get("description")
-            subj = metadata.get("keywords") or metadata.get("subjects")
-            if lang:
-                try:
-                    book.set_language(lang)
-                except Exception:
-                    pass
-            if desc:
-                try:
-                    book.add_metadata("DC", "description", str(desc))
-                except Exception:
-                    pass
-            if subj:
-                try:
-                    # join list/tuple or accept string
-                    if isinstance(subj, (list, tuple)):
-                        subj_val = ", ".join(map(str, subj))
-                    else:
-                        subj_val = str(subj)
-                    book.add_metadata("DC", "subject", subj_val)
-                except Exception:
-                    pass
-    except Exception:
-        pass
-    if cover_image:
-        p = Path(cover_image)
-        if not p.exists():
-            raise FileNotFoundError(f"Cover image not found: {cover_image}")
-        if p.suffix.lower() not in {".jpg", ".jpeg", ".png"}:
-            raise ValueError("Cover image must be a .jpg, .jpeg or .png file")
-        try:
-            data = _prepare_cover_bytes(
-                p
-            )  # if Pillow available, resizes and re-encodes
-        except Exception:
-            data = p.read_bytes()
-        book.set_cover(p.name, data)
-    elif cover_image_bytes:
-        book.set_cover("cover.jpg", cover_image_bytes)
 
-    # Simple HTML content with optional embedded CSS
+def _epub_css(css_file: Optional[str], css_text: Optional[str]) -> Optional[str]:
     combined_css = css_text or None
     if css_file:
         css_path = Path(css_file)
@@ -385,62 +444,77 @@ def _export_epub(
             raise FileNotFoundError(f"EPUB CSS file not found: {css_file}")
         css_from_file = css_path.read_text(encoding="utf-8")
         combined_css = (combined_css or "") + css_from_file
+    return combined_css
 
+
+def _write_epub(
+    out_path: str,
+    sections,
+    title: str,
+    author: Optional[str] = None,
+    metadata: Optional[dict] = None,
+    cover: Optional[tuple[str, bytes]] = None,
+    css: Optional[str] = None,
+    writer: Optional[str] = None,
+) -> None:
+    """Write ``sections`` — ``(nav title, file name, body fragments)`` — as EPUB.
+
+    The native writer (:mod:`.epub_writer`) streams each section into the
+    archive as it is produced; ebooklib collects ``EpubHtml`` items first.
+    """
+    lang, desc, subject = _epub_metadata(metadata)
+    if resolve_writer(writer) == "native":
+        with EpubWriter(
+            out_path,
+            title,
+            author=author,
+            language=lang,
+            description=desc,
+            subject=subject,
+            css=css,
+        ) as book:
+            if cover:
+                book.set_cover(*cover)
+            for sec_title, file_name, parts in sections:
+                book.add_chapter(sec_title, parts, file_name)
+        return
+
+    from ebooklib import epub  # type: ignore
+
+    book = epub.EpubBook()
+    book.set_title(title)
+    if author:
+        book.add_author(author)
+    # Basic metadata helpful for KDP ingestion
+    if lang:
+        try:
+            book.set_language(lang)
+        except Exception:
+            pass
+    if desc:
+        try:
+            book.add_metadata("DC", "description", desc)
+        except Exception:
+            pass
+    if subject:
+        try:
+            book.add_metadata("DC", "subject", subject)
+        except Exception:
+            pass
+    if cover:
+        book.set_cover(*cover)
     head = (
         "<head><meta charset='utf-8'/>"
-        + (f"<style>{html.escape(combined_css)}</style>" if combined_css else "")
+        + (f"<style>{html.escape(css)}</style>" if css else "")
         + "</head>"
     )
-    html_parts = [head, "<body>", "<h1>" + (title or "Transcript") + "</h1>"]
-    for para in text.split("\n\n"):
-        html_parts.append(
-            "<p>" + "<br/>".join(html.escape(p) for p in para.splitlines()) + "</p>"
-        )
-    html_parts.append("</body>")
-    content = "\n".join(html_parts)
-    chapters = []
-    if segments:
-        # Split into small chapters by segments, every ~10 minutes or speaker changes
-        cur_html = [head, "<body>"]
-        cur_len = 0
-        cur_idx = 1
-        for seg in segments:
-            start = _format_timestamp(seg.get("start", 0.0))
-            spk = seg.get("speaker")
-            text_seg = seg.get("text", "")
-            cur_html.append(
-                f"<h2 id='seg-{cur_idx}'>[{start}] {html.escape(spk + ': ' if spk else '')}</h2>"
-            )
-            cur_html.append("<p>" + html.escape(text_seg) + "</p>")
-            cur_len += len(text_seg)
-            if cur_len > 4000:  # rough size threshold
-                ch = epub.EpubHtml(
-                    title=f"Section {cur_idx}",
-                    file_name=f"section_{cur_idx}.xhtml",
-                    lang="en",
-                )
-                ch.content = "\n".join(cur_html + ["</body>"])
-                book.add_item(ch)
-                chapters.append(ch)
-                cur_html = [head, "<body>"]
-                cur_len = 0
-                cur_idx += 1
-        if cur_html and len(cur_html) > 2:
-            ch = epub.EpubHtml(
-                title=f"Section {cur_idx}",
-                file_name=f"section_{cur_idx}.xhtml",
-                lang="en",
-            )
-            ch.content = "\n".join(cur_html + ["</body>"])
-            book.add_item(ch)
-            chapters.append(ch)
-    else:
-        c = epub.EpubHtml(title="Transcript", file_name="transcript.xhtml", lang="en")
-        c.content = content
-        book.add_item(c)
-        chapters.append(c)
-
-    book.toc = tuple(chapters)
+    nodes = []
+    for sec_title, file_name, parts in sections:
+        node = epub.EpubHtml(title=sec_title, file_name=file_name, lang="en")
+        node.content = "\n".join([head, "<body>", *parts, "</body>"])
+        book.add_item(node)
+        nodes.append(node)
+    book.toc = tuple(nodes)
     # Add navigation items with compatibility across ebooklib versions
     try:
         book.add_item(epub.EpubNav())
@@ -456,10 +530,88 @@ def _export_epub(
             book.add_item(epub.EpubNCX())
         except Exception:
             pass
-    book.spine = ["nav", *chapters]
+    book.spine = ["nav", *nodes]
     epub.write_epub(out_path, book)
 
 
+def _segment_sections(segments: Iterable[dict], max_chars: int = 4000):
+    """EPUB sections of ~``max_chars`` of segment text, each segment headed by its time."""
+    parts: list[str] = []
+    cur_len = 0
+    cur_idx = 1
+    cur_start = None
+    for seg in segments:
+        if cur_start is None:
+            cur_start = seg.get("start", 0.0)
+        start = _format_timestamp(seg.get("start", 0.0))
+        spk = seg.get("speaker")
+        text_seg = seg.get("text", "")
+        parts.append(
+            f"<h2 id='seg-{cur_idx}'>[{start}] {html.escape(spk + ': ' if spk else '')}</h2>"
+        )
+        parts.append("<p>" + html.escape(text_seg) + "</p>")
+        cur_len += len(text_seg)
+        if cur_len > max_chars:  # rough size threshold
+            title = f"Section {cur_idx} ({format_clock(cur_start)})"
+            yield title, f"section_{cur_idx}.xhtml", parts
+            parts = []
+            cur_len = 0
+            cur_idx += 1
+            cur_start = None
+    if parts:
+        title = f"Section {cur_idx} ({format_clock(cur_start or 0.0)})"
+        yield title, f"section_{cur_idx}.xhtml", parts
+
+
+def _export_epub(
+    text: str,
+    out_path: str,
+    title: Optional[str],
+    author: Optional[str],
+    cover_image: Optional[str] = None,
+    cover_image_bytes: Optional[bytes] = None,
+    css_file: Optional[str] = None,
+    css_text: Optional[str] = None,
+    segments: Optional[list[dict]] = None,
+    metadata: Optional[dict] = None,
+    rendered: Optional[RenderedDocument] = None,
+    writer: Optional[str] = None,
+):
+    cover = None
+    if cover_image:
+        p = Path(cover_image)
+        if not p.exists():
+            raise FileNotFoundError(f"Cover image not found: {cover_image}")
+        if p.suffix.lower() not in {".jpg", ".jpeg", ".png"}:
+            raise ValueError("Cover image must be a .jpg, .jpeg or .png file")
+        # Resized and re-encoded once when Pillow is available
+        cover = (rendered or RenderedDocument("", cover_image=p)).cover
+    elif cover_image_bytes:
+        cover = ("cover.jpg", cover_variant(cover_image_bytes, EPUB_SIZE))
+    css = _epub_css(css_file, css_text)
+
+    if segments:
+        # Split into small sections by segments (~4000 characters each)
+        sections = _segment_sections(segments)
+    else:
+        heading = "<h1>" + html.escape(title or "Transcript") + "</h1>"
+        paragraphs = (
+            rendered.html_paragraphs if rendered else iter_html_paragraphs(text)
+        )
+        body = itertools.chain((heading,), paragraphs)
+        sections = [("Transcript", "transcript.xhtml", body)]
+    _write_epub(
+        out_path,
+        sections,
+        title=title or "Transcript",
+        author=author,
+        metadata=metadata,
+        cover=cover,
+        css=css,
+        writer=writer,
+    )
+
+
 def _export_docx(
     text: str,
     out_path: str,
@@ -472,6 +624,7 @@ def _export_docx(
     attribution_text: Optional[str] = None,
     footer_text: Optional[str] = None,
     footer_page_number: bool = True,
+    rendered: Optional[RenderedDocument] = None,
 ) -> None:
     try:
         import docx  # type: ignore
@@ -494,59 +647,41 @@ def _export_docx(
         except Exception:
             pass
 
-    # Cover support: either file path or raw bytes written to a temp file
-    if cover_image or cover_image_bytes:
-        tmp_path = None
-        try:
-            if cover_image:
-                p = Path(cover_image)
-                if p.exists():
-                    tmp_path = str(p)
-            elif cover_image_bytes:
-                fd, tmp = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
-                os.close(fd)
-                Path(tmp).write_bytes(cover_image_bytes)  # type: ignore[arg-type]
-                tmp_path = tmp
-            # order: cover first or after title/author
-            if tmp_path and cover_first:
-                _add_cover(tmp_path)
-        finally:
-            if cover_image_bytes and tmp_path:
-                try:
-                    Path(tmp_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
-    # Title and author
-    if title:
-        doc.add_heading(title, level=0)
-    if author:
-        p = doc.add_paragraph()
-        run = p.add_run(author)
-        run.italic = True
-    # Cover after title/author when not cover_first
-    if (cover_image or cover_image_bytes) and not cover_first:
-        tmp_path2 = None
-        try:
-            if cover_image:
-                p = Path(cover_image)
-                if p.exists():
-                    tmp_path2 = str(p)
-            elif cover_image_bytes:
-                fd, tmp = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
-                os.close(fd)
-                Path(tmp).write_bytes(cover_image_bytes)  # type: ignore[arg-type]
-                tmp_path2 = tmp
-            if tmp_path2:
-                _add_cover(tmp_path2)
-        finally:
-            if cover_image_bytes and tmp_path2:
-                try:
-                    Path(tmp_path2).unlink(missing_ok=True)
-                except Exception:
-                    pass
+    # Cover: resized for the picture width (memoized) and written to a temp file
+    cover_tmp = None
+    try:
+        cover = rendered or RenderedDocument(
+            "", cover_image=cover_image, cover_image_bytes=cover_image_bytes
+        )
+        data = cover.cover_bytes(docx_size(cover_width_inches))
+    except FileNotFoundError:
+        data = None
+    if data:
+        fd, cover_tmp = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
+        os.close(fd)
+        Path(cover_tmp).write_bytes(data)
+    try:
+        # order: cover first or after title/author
+        if cover_tmp and cover_first:
+            _add_cover(cover_tmp)
+        # Title and author
+        if title:
+            doc.add_heading(title, level=0)
+        if author:
+            p = doc.add_paragraph()
+            run = p.add_run(author)
+            run.italic = True
+        if cover_tmp and not cover_first:
+            _add_cover(cover_tmp)
+    finally:
+        if cover_tmp:
+            try:
+                Path(cover_tmp).unlink(missing_ok=True)
+            except Exception:
+                pass
     # Body
-    for para in text.split("\n\n"):
-        doc.add_paragraph(para.strip())
+    for para in (rendered or RenderedDocument(text)).paragraphs:
+        doc.add_paragraph(para)
         doc.add_paragraph("")
     if attribution_text:
         try:
@@ -581,6 +716,17 @@ def _export_docx(
     doc.save(out_path)
 
 
+def _book_sections(
+    chapters: list[dict],
+    workers: Optional[int] = None,
+    cache: Optional[ChapterCache] = None,
+):
+    """EPUB sections of ``export_book`` chapters, rendered in reading order."""
+    bodies = render_chapters(chapters, workers=workers, cache=cache)
+    for idx, (ch, body) in enumerate(zip(chapters, bodies), start=1):
+        yield _nav_title(ch, idx), f"chapter_{idx}.xhtml", (body,)
+
+
 def export_book(
     chapters: list[dict],
     out_path: str,
@@ -592,104 +738,43 @@ def export_book(
     metadata: Optional[dict] = None,
     epub_css_file: Optional[str] = None,
     epub_css_text: Optional[str] = None,
+    epub_writer: Optional[str] = None,
+    render_workers: Optional[int] = None,
+    chapter_cache: Union[bool, str, None] = None,
 ) -> None:
     """Export a multi-chapter book.
 
-    chapters: list of {"title": str, "text": str}
+    chapters: list of {"title": str, "text": str}, optionally with "start"/"end"
+      (seconds) as produced by ``nlp.chapterize``; timed chapters show their
+      time range and carry the start time into the EPUB navigation, the PDF
+      outline and a Markdown/TXT contents list
     fmt: one of epub, docx, md, txt, pdf (basic)
+    epub_writer: auto (ebooklib when installed), ebooklib or native streaming
+    render_workers: processes rendering EPUB chapters (None: one per CPU for
+      large books, else inline; 1 disables the pool)
+    chapter_cache: reuse rendered EPUB chapters by content hash — True for
+      ``<cache>/chapters``, a directory, or None to follow
+      ``PODCAST_TRANSCRIBER_CHAPTER_CACHE``
     """
     fmt = fmt.lower()
     if fmt == "epub":
-        try:
-            from ebooklib import epub  # type: ignore
-        except Exception as e:
-            raise RuntimeError(
-                "EPUB export requires 'ebooklib'. Install with: pip install ebooklib"
-            ) from e
-        book = epub.EpubBook()
-        book.set_title(title or "Podcast Book")
-        if author:
-            book.add_author(author)
-        if metadata and isinstance(metadata, dict):
-            try:
-                lang = metadata.get("language") or metadata.get("lang")
-                if lang:
-                    book.set_language(lang)
-                desc = metadata.get("description")
-                if desc:
-                    book.add_metadata("DC", "description", str(desc))
-                subj = metadata.get("keywords") or metadata.get("subjects")
-                if subj:
-                    if isinstance(subj, (list, tuple)):
-                        subj_val = ", ".join(map(str, subj))
-                    else:
-                        subj_val = str(subj)
-                    book.add_metadata("DC", "subject", subj_val)
-            except Exception:
-                pass
-        # Cover
+        cover = None
         if cover_image:
             p = Path(cover_image)
             if p.exists():
-                try:
-                    data = _prepare_cover_bytes(p)
-                except Exception:
-                    data = p.read_bytes()
-                book.set_cover(p.name, data)
+                cover = (p.name, _prepare_cover_bytes(p))
         elif cover_image_bytes:
-            book.set_cover("cover.jpg", cover_image_bytes)
-        # CSS
-        combined_css = epub_css_text or None
-        if epub_css_file:
-            css_path = Path(epub_css_file)
-            if not css_path.exists():
-                raise FileNotFoundError(f"EPUB CSS file not found: {epub_css_file}")
-            css_from_file = css_path.read_text(encoding="utf-8")
-            combined_css = (combined_css or "") + css_from_file
-        head = (
-            "<head><meta charset='utf-8'/>"
-            + (f"<style>{html.escape(combined_css)}</style>" if combined_css else "")
-            + "</head>"
+            cover = ("cover.jpg", cover_variant(cover_image_bytes, EPUB_SIZE))
+        _write_epub(
+            out_path,
+            _book_sections(chapters, render_workers, get_chapter_cache(chapter_cache)),
+            title=title or "Podcast Book",
+            author=author,
+            metadata=metadata,
+            cover=cover,
+            css=_epub_css(epub_css_file, epub_css_text),
+            writer=epub_writer,
         )
-        epub_chapters = []
-        for idx, ch in enumerate(chapters, start=1):
-            node = epub.EpubHtml(
-                title=str(ch.get("title") or f"Chapter {idx}"),
-                file_name=f"chapter_{idx}.xhtml",
-                lang="en",
-            )
-            parts = [
-                head,
-                "<body>",
-                f"<h1>{html.escape(str(ch.get('title') or f'Chapter {idx}'))}</h1>",
-            ]
-            for para in str(ch.get("text", "")).split("\n\n"):
-                parts.append(
-                    "<p>"
-                    + "<br/>".join(html.escape(p) for p in para.splitlines())
-                    + "</p>"
-                )
-            parts.append("</body>")
-            node.content = "\n".join(parts)
-            book.add_item(node)
-            epub_chapters.append(node)
-        book.toc = tuple(epub_chapters)
-        try:
-            book.add_item(epub.EpubNav())
-        except Exception:
-            try:
-                book.add_item(epub.EpubNavi())
-            except Exception:
-                pass
-        try:
-            book.add_item(epub.EpubNcx())
-        except Exception:
-            try:
-                book.add_item(epub.EpubNCX())
-            except Exception:
-                pass
-        book.spine = ["nav", *epub_chapters]
-        epub.write_epub(out_path, book)
         return
     elif fmt == "docx":
         try:
@@ -710,13 +795,13 @@ def export_book(
             try:
                 if cover_image:
                     p = Path(cover_image)
-                    if p.exists():
-                        tmp_path = str(p)
-                elif cover_image_bytes:
-                    fd, tmp = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
+                    data = _prepare_cover_bytes(p, docx_size(6)) if p.exists() else b""
+                else:
+                    data = cover_variant(cover_image_bytes, docx_size(6))  # type: ignore[arg-type]
+                if data:
+                    fd, tmp_path = tempfile.mkstemp(prefix="cover_", suffix=".jpg")
                     os.close(fd)
-                    Path(tmp).write_bytes(cover_image_bytes)  # type: ignore[arg-type]
-                    tmp_path = tmp
+                    Path(tmp_path).write_bytes(data)
                 if tmp_path:
                     d.add_page_break()
                     try:
@@ -725,13 +810,16 @@ def export_book(
                     except Exception:
                         pass
             finally:
-                if cover_image_bytes and tmp_path:
+                if tmp_path:
                     try:
                         Path(tmp_path).unlink(missing_ok=True)
                     except Exception:
                         pass
         for idx, ch in enumerate(chapters, start=1):
             d.add_heading(str(ch.get("title") or f"Chapter {idx}"), level=1)
+            span = chapter_span(ch)
+            if span:
+                d.add_paragraph(span)
             for para in str(ch.get("text", "")).split("\n\n"):
                 d.add_paragraph(para.strip())
             d.add_page_break()
@@ -749,12 +837,22 @@ def export_book(
                 lines += [f"_by {author}_", ""]
             else:
                 lines += [f"by {author}", ""]
+        timed = [(idx, ch) for idx, ch in enumerate(chapters, start=1) if _is_timed(ch)]
+        if timed:
+            lines += ["## Contents" if fmt == "md" else "Contents", ""]
+            for idx, ch in timed:
+                label = str(ch.get("title") or f"Chapter {idx}")
+                lines.append(f"- {format_clock(ch['start'])} {label}")
+            lines.append("")
         for idx, ch in enumerate(chapters, start=1):
             ch_title = str(ch.get("title") or f"Chapter {idx}")
             if fmt == "md":
                 lines += [f"\n\n## {ch_title}", ""]
             else:
                 lines += ["\n\n" + ch_title, ""]
+            span = chapter_span(ch)
+            if span:
+                lines += [f"_{span}_" if fmt == "md" else span, ""]
             lines.append(str(ch.get("text", "")).strip())
         Path(out_path).write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
         return
@@ -778,8 +876,19 @@ def export_book(
             pdf.multi_cell(0, 8, f"by {author}")
             pdf.ln(6)
         for idx, ch in enumerate(chapters, start=1):
+            # fpdf2 outline entry (PDF bookmarks), labelled with the start time
+            start_section = getattr(pdf, "start_section", None)
+            if callable(start_section):
+                try:
+                    start_section(_nav_title(ch, idx))
+                except Exception:
+                    pass
             pdf.set_font("Arial", size=14)
             pdf.multi_cell(0, 9, str(ch.get("title") or f"Chapter {idx}"))
+            span = chapter_span(ch)
+            if span:
+                pdf.set_font("Arial", size=10)
+                pdf.multi_cell(0, 6, span)
             pdf.ln(2)
             pdf.set_font("Arial", size=12)
             for para in str(ch.get("text", "")).split("\n\n"):
@@ -803,7 +912,11 @@ def _export_kindle(
     cover_image: Optional[str] = None,
     css_file: Optional[str] = None,
     css_text: Optional[str] = None,
+    rendered: Optional[RenderedDocument] = None,
+    source_epub: Optional[str] = None,
+    epub_writer: Optional[str] = None,
 ):
+    """Convert to a Kindle format with Calibre, from ``source_epub`` when given."""
     conv = shutil.which("ebook-convert")
     if not conv:
         raise RuntimeError(
@@ -823,18 +936,21 @@ def _export_kindle(
             os.close(fd2)
         else:
             tmp_out = out_path
-        _export_epub(
-            text,
-            tmp_epub,
-            title=title,
-            author=author,
-            cover_image=cover_image,
-            css_file=css_file,
-            css_text=css_text,
-        )
+        if not source_epub:
+            _export_epub(
+                text,
+                tmp_epub,
+                title=title,
+                author=author,
+                cover_image=cover_image,
+                css_file=css_file,
+                css_text=css_text,
+                rendered=rendered,
+                writer=epub_writer,
+            )
         # Choose destination for conversion
         dest = tmp_out or out_path
-        subprocess.run([conv, tmp_epub, dest], check=True)
+        subprocess.run([conv, source_epub or tmp_epub, dest], check=True)
         if use_ext == "azw":
             # Copy converted azw3 bytes into expected .azw file name
             try:
@@ -855,39 +971,28 @@ def _export_kindle(
                 pass
 
 
-def _prepare_cover_bytes(path: Path) -> bytes:
-    Image = None
-    try:
-        import importlib
+def _prepare_cover_bytes(path: Path, max_size: tuple[int, int] = EPUB_SIZE) -> bytes:
+    """Cover file resized into ``max_size`` as JPEG, memoized by content hash.
 
-        Image = importlib.import_module("PIL.Image")  # type: ignore
+    Without Pillow (or for files it cannot read) the original bytes are used.
+    """
+    try:
+        data = path.read_bytes()
     except Exception:
-        try:
-            from PIL import Image as PILImage  # type: ignore
+        return b""
+    return cover_variant(data, max_size)
 
-            Image = PILImage
-        except Exception:
-            return path.read_bytes()
 
-    max_size = (1600, 2560)
-    try:
-        with Image.open(str(path)) as img:
-            img = img.convert("RGB")
-            img.thumbnail(max_size, Image.LANCZOS)
-            import io
-
-            buf = io.BytesIO()
-            img.save(buf, format="JPEG", quality=85)
-            data = buf.getvalue()
-            if not data:
-                return path.read_bytes()
-            return data
-    except Exception:
-        # If PIL cannot identify or process the image, fall back to raw file bytes
-        try:
-            return path.read_bytes()
-        except Exception:
-            return b""
+def _is_timed(chapter: dict) -> bool:
+    return chapter.get("start") is not None
+
+
+def _nav_title(chapter: dict, idx: int) -> str:
+    """Navigation label of a book chapter, prefixed with its start time."""
+    title = str(chapter.get("title") or f"Chapter {idx}")
+    if _is_timed(chapter):
+        return f"{format_clock(chapter['start'])} {title}"
+    return title
 
 
 def _format_timestamp(seconds: float) -> str:
@@ -898,91 +1003,151 @@ def _format_timestamp(seconds: float) -> str:
     return f"{h:02}:{m:02}:{s:02},{ms:03}"
 
 
-def _coalesce_segments(text: str, segments: Optional[list[dict]]) -> list[dict]:
-    if segments:
-        # ensure required keys
-        out = []
-        for seg in segments:
-            if "start" in seg and "end" in seg and "text" in seg:
-                out.append(
-                    {
-                        "start": float(seg["start"]),
-                        "end": float(seg["end"]),
-                        "text": str(seg["text"]).strip(),
-                        "speaker": seg.get("speaker"),
-                    }
-                )
-        if out:
-            return out
-    # Fallback: single segment covering unknown duration
-    return [{"start": 0.0, "end": 0.0, "text": text.strip()}]
+# Buffered writes for the streaming caption/JSON writers
+_WRITE_BUFFER = 1 << 16
+
+
+def _iter_segments(text: str, segments: Optional[Iterable[dict]]) -> Iterator[dict]:
+    """Timed segments with the required keys, one at a time.
+
+    Accepts any iterable (e.g. a streaming transcription's output). Falls back
+    to a single segment covering unknown duration when none qualifies.
+    """
+    found = False
+    for seg in segments or ():
+        if "start" in seg and "end" in seg and "text" in seg:
+            found = True
+            yield {
+                "start": float(seg["start"]),
+                "end": float(seg["end"]),
+                "text": str(seg["text"]).strip(),
+                "speaker": seg.get("speaker"),
+            }
+    if not found:
+        yield {"start": 0.0, "end": 0.0, "text": text.strip()}
+
+
+def _caption(seg: dict) -> str:
+    caption = seg.get("text", "").strip()
+    spk = seg.get("speaker")
+    return f"{spk}: {caption}" if spk else caption
 
 
 def _export_srt(
-    text: str, out_path: str, segments: Optional[list[dict]] = None
+    text: str, out_path: str, segments: Optional[Iterable[dict]] = None
 ) -> None:
-    segs = _coalesce_segments(text, segments)
-    lines = []
-    for i, seg in enumerate(segs, start=1):
-        start = _format_timestamp(seg.get("start", 0.0))
-        end = _format_timestamp(seg.get("end", 0.0))
-        caption = seg.get("text", "").strip()
-        spk = seg.get("speaker")
-        if spk:
-            caption = f"{spk}: {caption}"
-        lines.append(str(i))
-        lines.append(f"{start} --> {end}")
-        lines.append(caption)
-        lines.append("")
-    Path(out_path).write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+        sep = ""  # blank line between cues, none after the last
+        for i, seg in enumerate(_iter_segments(text, segments), start=1):
+            start = _format_timestamp(seg.get("start", 0.0))
+            end = _format_timestamp(seg.get("end", 0.0))
+            fh.write(f"{sep}{i}\n{start} --> {end}\n{_caption(seg)}\n")
+            sep = "\n"
 
 
 def _export_vtt(
-    text: str, out_path: str, segments: Optional[list[dict]] = None
+    text: str, out_path: str, segments: Optional[Iterable[dict]] = None
 ) -> None:
-    segs = _coalesce_segments(text, segments)
-    lines = ["WEBVTT", ""]
-    for seg in segs:
-        start = _format_timestamp(seg.get("start", 0.0)).replace(",", ".")
-        end = _format_timestamp(seg.get("end", 0.0)).replace(",", ".")
-        caption = seg.get("text", "").strip()
-        spk = seg.get("speaker")
-        if spk:
-            caption = f"{spk}: {caption}"
-        lines.append(f"{start} --> {end}")
-        lines.append(caption)
-        lines.append("")
-    Path(out_path).write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+        fh.write("WEBVTT\n")
+        for seg in _iter_segments(text, segments):
+            start = _format_timestamp(seg.get("start", 0.0)).replace(",", ".")
+            end = _format_timestamp(seg.get("end", 0.0)).replace(",", ".")
+            fh.write(f"\n{start} --> {end}\n{_caption(seg)}\n")
+
+
+def _nonempty(items: Optional[Iterable]) -> Optional[Iterator]:
+    """Iterator over ``items``, or None when there are none (peeks one item)."""
+    it = iter(items or ())
+    for first in it:
+        return itertools.chain((first,), it)
+    return None
+
+
+def _write_json_array(fh, items: Iterable, dumps) -> None:
+    """Write ``items`` one by one as a top-level field's ``indent=2`` array."""
+    sep = "[\n    "
+    for item in items:
+        fh.write(sep)
+        fh.write(dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n    "))
+        sep = ",\n    "
+    fh.write("[]" if sep.startswith("[") else "\n  ]")
 
 
 def _export_json(
     text: str,
     out_path: str,
-    segments: Optional[list[dict]] = None,
-    words: Optional[list[dict]] = None,
+    segments: Optional[Iterable[dict]] = None,
+    words: Optional[Iterable[dict]] = None,
+    title: Optional[str] = None,
+    author: Optional[str] = None,
+    metadata: Optional[dict] = None,
+) -> None:
+    """Streaming equivalent of ``json.dumps(payload, indent=2)``.
+
+    Segments and words are written as they are produced, so the payload is
+    never materialized; the output matches the dumped dict byte for byte.
+    """
+    import json
+
+    def field(name: str, value, first: bool = False) -> str:
+        return f"{'' if first else ','}\n  {json.dumps(name)}: " + json.dumps(
+            value, ensure_ascii=False, indent=2
+        ).replace("\n", "\n  ")
+
+    with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+        fh.write("{")
+        fh.write(field("title", title or "Transcript", first=True))
+        fh.write(field("author", author))
+        fh.write(field("text", text))
+        fh.write(',\n  "segments": ')
+        _write_json_array(fh, _iter_segments(text, segments), json.dumps)
+        word_iter = _nonempty(words)
+        if word_iter is not None:
+            fh.write(',\n  "words": ')
+            _write_json_array(fh, word_iter, json.dumps)
+        if metadata:
+            fh.write(field("source", metadata))
+        fh.write("\n}")
+
+
+def _export_jsonl(
+    text: str,
+    out_path: str,
+    segments: Optional[Iterable[dict]] = None,
+    words: Optional[Iterable[dict]] = None,
     title: Optional[str] = None,
     author: Optional[str] = None,
     metadata: Optional[dict] = None,
 ) -> None:
+    """JSON Lines: a header record, then one segment or word per line.
+
+    Every line carries ``"type"`` (``transcript``, ``segment`` or ``word``);
+    segments come first, then words. Input may be any iterable, so long
+    transcripts stream through with flat memory.
+    """
     import json
 
-    payload = {
-        "title": title or "Transcript",
-        "author": author,
-        "text": text,
-        "segments": _coalesce_segments(text, segments),
-    }
-    if words:
-        payload["words"] = words
+    def line(kind: str, record: dict) -> str:
+        return json.dumps({"type": kind, **record}, ensure_ascii=False) + "\n"
+
+    header = {"title": title or "Transcript", "author": author}
     if metadata:
-        payload["source"] = metadata
-    Path(out_path).write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+        header["source"] = metadata
+    with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+        fh.write(line("transcript", header))
+        for seg in _iter_segments(text, segments):
+            fh.write(line("segment", seg))
+        for word in words or ():
+            fh.write(line("word", word))
 
 
 def _export_md(
-    text: str, out_path: str, title: Optional[str], author: Optional[str]
+    text: str,
+    out_path: str,
+    title: Optional[str],
+    author: Optional[str],
+    rendered: Optional[RenderedDocument] = None,
 ) -> None:
     lines = []
     if title:
@@ -991,7 +1156,7 @@ def _export_md(
     if author:
         lines.append(f"_by {author}_")
         lines.append("")
-    for para in text.split("\n\n"):
-        lines.append(para.strip())
+    for para in (rendered or RenderedDocument(text)).paragraphs:
+        lines.append(para)
         lines.append("")
     Path(out_path).write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
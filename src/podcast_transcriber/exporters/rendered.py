@@ -0,0 +1,126 @@
+"""Intermediate rendered form of a transcript, shared by the exporters.
+
+Exporting one episode to several formats used to redo the same work per
+format: splitting the body into paragraphs, HTML-escaping every line for
+EPUB and re-encoding the cover image. :class:`RenderedDocument` computes
+each of those once, on first use, and ``export_transcript(...,
+rendered=...)`` / :func:`~.exporter.export_many` hand it to every format.
+"""
+
+from __future__ import annotations
+
+import html
+from collections.abc import Iterator
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from ..utils.covers import EPUB_SIZE, PDF_SIZE, cover_variant
+
+# Pieces each format reads; warmed before exporting in parallel so worker
+# threads only read them.
+_NEEDS = {
+    "pdf": ("lines", "pdf_cover", "toc"),
+    "epub": ("html_paragraphs", "cover"),
+    "docx": ("paragraphs", "cover_source"),
+    "md": ("paragraphs",),
+    "mobi": ("html_paragraphs", "cover"),
+    "azw": ("html_paragraphs", "cover"),
+    "azw3": ("html_paragraphs", "cover"),
+}
+
+
+def iter_html_paragraphs(text: str) -> Iterator[str]:
+    """Escaped ``<p>`` elements of ``text``, one paragraph at a time."""
+    for para in text.split("\n\n"):
+        yield (
+            "<p>"
+            + "<br/>".join(html.escape(line) for line in para.splitlines())
+            + "</p>"
+        )
+
+
+class RenderedDocument:
+    """Paragraphs, escaped HTML, prepared cover and TOC of one transcript body."""
+
+    def __init__(
+        self,
+        text: str,
+        *,
+        cover_image: Optional[str] = None,
+        cover_image_bytes: Optional[bytes] = None,
+        segments: Optional[list[dict]] = None,
+    ) -> None:
+        self.text = text
+        self.cover_image = cover_image
+        self.cover_image_bytes = cover_image_bytes
+        self.segments = segments
+
+    @cached_property
+    def paragraphs(self) -> list[str]:
+        """Stripped paragraphs (blank-line separated), as DOCX and Markdown write them."""
+        return [para.strip() for para in self.text.split("\n\n")]
+
+    @cached_property
+    def lines(self) -> list[list[str]]:
+        """Lines of each paragraph, as the PDF body writes them."""
+        return [para.splitlines() for para in self.text.split("\n\n")]
+
+    @cached_property
+    def html_paragraphs(self) -> list[str]:
+        """One escaped ``<p>`` element per paragraph, lines joined by ``<br/>``."""
+        return list(iter_html_paragraphs(self.text))
+
+    @cached_property
+    def cover_source(self) -> Optional[tuple[str, bytes]]:
+        """``(file name, original bytes)`` of the cover, read once.
+
+        Raises FileNotFoundError for a missing ``cover_image`` path; exporters
+        that treat the cover as optional catch it.
+        """
+        if self.cover_image:
+            p = Path(self.cover_image)
+            if not p.exists():
+                raise FileNotFoundError(f"Cover image not found: {self.cover_image}")
+            return p.name, p.read_bytes()
+        if self.cover_image_bytes:
+            return "cover.jpg", self.cover_image_bytes
+        return None
+
+    def cover_bytes(self, max_size: tuple[int, int] = EPUB_SIZE) -> Optional[bytes]:
+        """Cover resized into ``max_size`` (memoized per size, see ``utils.covers``)."""
+        src = self.cover_source
+        return cover_variant(src[1], max_size) if src else None
+
+    @cached_property
+    def cover(self) -> Optional[tuple[str, bytes]]:
+        """``(file name, bytes)`` of the EPUB cover."""
+        src = self.cover_source
+        return (src[0], self.cover_bytes(EPUB_SIZE)) if src else None
+
+    @cached_property
+    def pdf_cover(self) -> Optional[bytes]:
+        return self.cover_bytes(PDF_SIZE)
+
+    @cached_property
+    def toc(self) -> list[str]:
+        """PDF table-of-contents labels, one per timed segment."""
+        from .exporter import _format_timestamp
+
+        labels = []
+        for seg in self.segments or []:
+            start = _format_timestamp(seg.get("start", 0.0))
+            spk = seg.get("speaker")
+            text = (seg.get("text", "")[:60]).strip()
+            labels.append(f"[{start}] {spk + ': ' if spk else ''}{text}")
+        return labels
+
+    def prepare(self, formats) -> RenderedDocument:
+        """Compute everything ``formats`` will read (before sharing across threads)."""
+        for fmt in formats:
+            for name in _NEEDS.get(str(fmt).lower(), ()):
+                try:
+                    getattr(self, name)
+                except Exception:
+                    pass  # surfaces again in the exporter that needs it
+        return self
@@ -4,6 +4,8 @@ import argparse
 import logging
 from ..orchestrator import cmd_ingest, cmd_process, cmd_send
 from ..storage.state import StateStore
+from ..utils.cache import configure_memory
+from ..utils.cache_store import parse_size
 
 log = logging.getLogger("podcast.auto_run")
 
@@ -33,7 +35,16 @@ def main(argv=None) -> int:
         "--interval", default="daily", choices=["hourly", "daily"], help="Run frequency"
     )
     ap.add_argument("--once", action="store_true", help="Run only once and exit")
+    ap.add_argument(
+        "--memory-cache",
+        default="256M",
+        help="In-memory transcript cache size for this process (e.g. 256M; 0 disables)",
+    )
     args = ap.parse_args(argv)
+    try:
+        configure_memory(parse_size(args.memory_cache))
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
 
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
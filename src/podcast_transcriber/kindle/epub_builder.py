@@ -3,11 +3,26 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ..nlp.chapterize import chapter_span
+
 
 @dataclass
 class Chapter:
     title: str
     text: str
+    start: Optional[float] = None  # seconds into the episode, when known
+    end: Optional[float] = None
+
+    @property
+    def span(self) -> Optional[str]:
+        return chapter_span({"start": self.start, "end": self.end})
+
+    def as_dict(self) -> dict:
+        """Chapter dict as consumed by ``export_book`` and the Markdown template."""
+        out = {"title": self.title, "text": self.text}
+        if self.start is not None:
+            out.update(start=self.start, end=self.end, span=self.span)
+        return out
 
 
 @dataclass
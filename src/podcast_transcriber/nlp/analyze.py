@@ -0,0 +1,97 @@
+"""Single-pass NLP analysis of a transcript.
+
+``analyze`` normalizes the text once, wraps it in a :class:`Document` so the
+sentence split and term arrays are computed a single time, and runs the
+summary, topic segmentation, takeaways and chapter stages on that shared
+model. Each stage's wall time is reported under ``timings`` (seconds).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from ..utils.textproc import normalize_text
+from .chapterize import chapterize
+from .document import as_document
+from .segment_topics import key_takeaways_better, segment_with_embeddings
+from .summarize import summarize
+
+
+def analyze(
+    text: str,
+    segments: Optional[list] = None,
+    *,
+    title: Optional[str] = None,
+    summary: bool = False,
+    summary_method: str = "textrank",
+    summary_sentences: int = 6,
+    semantic: bool = False,
+    takeaways: bool = False,
+    chapter_minutes: Optional[int] = None,
+    chapter_chars: Optional[int] = 4000,
+    speaker_change: bool = False,
+    segment: Optional[Callable[[str], list]] = None,
+    extract_takeaways: Optional[Callable[[str], list]] = None,
+) -> dict:
+    """Summary, topics, takeaways and chapters of ``text`` in one pass.
+
+    Chapters are the semantic topics when ``semantic`` is set and segmentation
+    succeeds, otherwise ``segments`` chapterized by ``chapter_minutes``,
+    ``chapter_chars`` and ``speaker_change`` (see :func:`.chapterize`; these
+    chapters carry ``start``/``end``), otherwise one chapter holding the
+    whole text. ``segment`` and ``extract_takeaways``
+    replace the default topic segmenter and takeaway extractor; both receive
+    the shared document (a ``str``). Segmentation and takeaway failures are
+    non-fatal (the stage yields nothing).
+    """
+    timings: dict[str, float] = {}
+
+    @contextmanager
+    def _stage(name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[name] = round(time.perf_counter() - t0, 6)
+
+    with _stage("tokenize"):
+        doc = as_document(normalize_text(text))
+        doc.sentences  # noqa: B018 - split once, up front
+    result: dict = {"text": str(doc), "summary": None, "topics": None}
+    if summary:
+        with _stage("summary"):
+            result["summary"] = summarize(
+                doc, max_sentences=summary_sentences, method=summary_method
+            )
+    chapters: list = []
+    if semantic:
+        with _stage("topics"):
+            try:
+                topics = (segment or segment_with_embeddings)(doc)
+                result["topics"] = topics
+                chapters = [{"title": t["title"], "text": t["text"]} for t in topics]
+            except Exception:
+                chapters = []
+    with _stage("chapters"):
+        if not chapters and segments and (chapter_minutes or speaker_change):
+            chapters = chapterize(
+                segments,
+                minutes=chapter_minutes,
+                max_chars=chapter_chars,
+                speaker_change=speaker_change,
+            )
+        if not chapters:
+            chapters = [{"title": title or "Transcript", "text": str(doc)}]
+    result["chapters"] = chapters
+    kt = None
+    if takeaways:
+        with _stage("takeaways"):
+            try:
+                kt = (extract_takeaways or key_takeaways_better)(doc) or None
+            except Exception:
+                kt = None
+    result["takeaways"] = kt
+    result["timings"] = timings
+    return result
@@ -0,0 +1,92 @@
+"""Timestamp-aware chapterization of timed transcript segments.
+
+:func:`chapterize` walks the segment list once and closes a chapter when a
+policy fires: elapsed time (``minutes``), text size (``max_chars``) or a
+change of speaker (``speaker_change``). Segment texts are collected per
+chapter and joined once when it closes, and every chapter keeps the
+``start``/``end`` of the segments it covers so exporters can show timings
+and build navigation from them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional
+
+DEFAULT_TITLE = "Chapter {n}"
+
+
+def chapterize(
+    segments: Iterable[dict],
+    *,
+    minutes: Optional[float] = None,
+    max_chars: Optional[int] = None,
+    speaker_change: bool = False,
+    title: str = DEFAULT_TITLE,
+) -> list[dict]:
+    """Group ``segments`` into chapters in a single pass.
+
+    A chapter closes after the segment that makes it span ``minutes`` or
+    exceed ``max_chars``, and before a segment whose ``speaker`` differs from
+    the chapter's when ``speaker_change`` is set. ``title`` is formatted with
+    ``n`` (1-based index) and ``speaker``. Each chapter is
+    ``{"title", "text", "start", "end"}`` (plus ``"speaker"`` when known);
+    segments without text are skipped.
+    """
+    limit = float(minutes) * 60 if minutes else None
+    chapters: list[dict] = []
+    parts: list[str] = []
+    chars = 0
+    start = end = 0.0
+    speaker = None
+
+    def close() -> None:
+        chapter = {
+            "title": title.format(n=len(chapters) + 1, speaker=speaker or ""),
+            "text": " ".join(parts),
+            "start": start,
+            "end": end,
+        }
+        if speaker is not None:
+            chapter["speaker"] = speaker
+        chapters.append(chapter)
+        parts.clear()
+
+    for seg in segments:
+        text = str(seg.get("text") or "").strip()
+        if not text:
+            continue
+        seg_start = float(seg.get("start") or 0.0)
+        seg_end = float(seg.get("end") or seg_start)
+        spk = seg.get("speaker")
+        if parts and speaker_change and spk != speaker:
+            close()
+        if not parts:
+            start, end, chars, speaker = seg_start, seg_end, 0, spk
+        parts.append(text)
+        chars += len(text)
+        end = max(end, seg_end)
+        if (limit is not None and end - start >= limit) or (
+            max_chars and chars > max_chars
+        ):
+            close()
+    if parts:
+        close()
+    return chapters
+
+
+def format_clock(seconds: float) -> str:
+    """``HH:MM:SS`` for a chapter offset in seconds."""
+    total = int(max(0.0, float(seconds)))
+    return f"{total // 3600:02}:{total % 3600 // 60:02}:{total % 60:02}"
+
+
+def chapter_span(chapter: dict) -> Optional[str]:
+    """``"HH:MM:SS - HH:MM:SS"`` of a timed chapter, or None when untimed."""
+    start = chapter.get("start")
+    if start is None:
+        return None
+    end = chapter.get("end")
+    if end is None or float(end) <= float(start):
+        return format_clock(start)
+    return f"{format_clock(start)} - {format_clock(end)}"
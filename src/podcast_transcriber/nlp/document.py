@@ -0,0 +1,54 @@
+"""Shared, tokenize-once view of a transcript for the NLP stages.
+
+:class:`Document` is a ``str`` (so every helper that takes transcript text
+accepts it unchanged) that also carries the sentence split, the token
+stream and the content term arrays, computed on first use and shared by
+summarization, topic segmentation and takeaways instead of each
+re-splitting and re-scanning the text.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+from .texttiling import inverse_document_frequency, term_ids, terms_from_tokens
+from .tokenize import Tokens, split_sentences, tokenize
+
+
+class Document(str):
+    @cached_property
+    def sentences(self) -> list[str]:
+        return split_sentences(self)
+
+    @cached_property
+    def tokens(self) -> Tokens:
+        """Words, their sentence indices and capitalized phrases (one scan)."""
+        return tokenize(self)
+
+    @cached_property
+    def terms(self):
+        """``(sentence, term, vocab_size)`` arrays, see :func:`texttiling.term_ids`."""
+        return terms_from_tokens(self.tokens.words, self.tokens.rows)
+
+    @cached_property
+    def idf(self):
+        row, term, vocab_size = self.terms
+        return inverse_document_frequency(row, term, len(self.sentences), vocab_size)
+
+
+def as_document(text: str) -> Document:
+    return text if isinstance(text, Document) else Document(text)
+
+
+def sentences_of(text: str) -> list[str]:
+    """Sentences of ``text``, reusing a :class:`Document`'s split."""
+    if isinstance(text, Document):
+        return text.sentences
+    return split_sentences(text)
+
+
+def terms_of(text: str, sentences: list[str]):
+    """Term arrays for ``sentences``, reusing a :class:`Document`'s when they match."""
+    if isinstance(text, Document) and sentences is text.sentences:
+        return text.terms
+    return term_ids(sentences)
@@ -0,0 +1,213 @@
+"""Persistent sentence-embedding cache for the semantic NLP stages.
+
+Embeddings are stored per model under ``<cache dir>/embeddings/<model>/`` as
+one append-only ``float16`` matrix (``vectors.f16``, read through
+``numpy.memmap``) plus a SQLite index mapping the hash of each normalized
+sentence to its row. Only sentences missing from the index are encoded, so
+segmenting a transcript a second time never touches the model.
+
+Set ``PODCAST_TRANSCRIBER_EMBEDDING_CACHE=0`` to disable it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+try:  # POSIX advisory locks guard appends from several processes
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+ENV_EMBEDDING_CACHE = "PODCAST_TRANSCRIBER_EMBEDDING_CACHE"
+VECTORS_NAME = "vectors.f16"
+INDEX_NAME = "index.sqlite3"
+LOCK_NAME = "append.lock"
+_QUERY_CHUNK = 500
+_WS = re.compile(r"\s+")
+
+_stores: dict[tuple[str, str], EmbeddingCache] = {}
+_stores_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    value = os.environ.get(ENV_EMBEDDING_CACHE, "1").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+def normalize(sentence: str) -> str:
+    return _WS.sub(" ", sentence).strip()
+
+
+def sentence_key(sentence: str) -> str:
+    return hashlib.blake2b(
+        normalize(sentence).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _model_dirname(model_name: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name).strip("._") or "model"
+    digest = hashlib.blake2b(model_name.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{safe[:60]}-{digest}"
+
+
+class EmbeddingCache:
+    def __init__(self, root: str | Path, model_name: str):
+        self.model_name = model_name
+        self.root = Path(root) / _model_dirname(model_name)
+        self._ready = False
+
+    @contextmanager
+    def _db(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.root / INDEX_NAME), timeout=30)
+        try:
+            if not self._ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS rows ("
+                    " key TEXT PRIMARY KEY, row INTEGER NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta ("
+                    " name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                self._ready = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _append_lock(self):
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            yield
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_NAME, "a+b") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    def dim(self) -> Optional[int]:
+        with self._db() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        return int(row[0]) if row else None
+
+    def __len__(self) -> int:
+        with self._db() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0])
+
+    def _matrix(self, dim: int):
+        import numpy as np
+
+        path = self.root / VECTORS_NAME
+        count = path.stat().st_size // (2 * dim) if path.exists() else 0
+        if not count:
+            return np.zeros((0, dim), dtype=np.float16)
+        return np.memmap(path, dtype=np.float16, mode="r", shape=(count, dim))
+
+    def lookup(self, keys: Sequence[str]) -> dict[str, int]:
+        """Map the known ``keys`` to their row in the vector matrix."""
+        found: dict[str, int] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._db() as conn:
+            for i in range(0, len(unique), _QUERY_CHUNK):
+                part = unique[i : i + _QUERY_CHUNK]
+                marks = ",".join("?" * len(part))
+                found.update(
+                    conn.execute(
+                        f"SELECT key, row FROM rows WHERE key IN ({marks})", part
+                    ).fetchall()
+                )
+        return found
+
+    def add(self, keys: Sequence[str], vectors) -> None:
+        """Append ``vectors`` (one row per key) and index them."""
+        import numpy as np
+
+        vectors = np.asarray(vectors, dtype=np.float16)
+        if not len(keys):
+            return
+        dim = int(vectors.shape[1])
+        known = self.dim()
+        if known is not None and known != dim:
+            raise ValueError(
+                f"Embedding cache for '{self.model_name}' holds {known}-d vectors, got {dim}-d"
+            )
+        path = self.root / VECTORS_NAME
+        with self._append_lock():
+            # Another process may have added some of these meanwhile
+            known = self.lookup(keys)
+            first: dict[str, int] = {}
+            for i, k in enumerate(keys):
+                if k not in known:
+                    first.setdefault(k, i)
+            fresh = list(first.values())
+            if not fresh:
+                return
+            size = path.stat().st_size if path.exists() else 0
+            start = size // (2 * dim)
+            with open(path, "r+b" if size else "wb") as fh:
+                # Drop a partial row left behind by an interrupted append
+                fh.truncate(start * 2 * dim)
+                fh.seek(0, os.SEEK_END)
+                fh.write(np.ascontiguousarray(vectors[fresh]).tobytes())
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta(name, value) VALUES('dim', ?)",
+                    (str(dim),),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO rows(key, row) VALUES(?, ?)",
+                    [(keys[i], start + n) for n, i in enumerate(fresh)],
+                )
+
+    def encode(
+        self,
+        sentences: Sequence[str],
+        encode: Callable[[list[str]], object],
+    ):
+        """Embeddings for ``sentences`` (float32), encoding only unseen ones.
+
+        ``encode`` receives the list of missing sentences and returns one
+        vector per sentence.
+        """
+        import numpy as np
+
+        if not sentences:
+            return np.zeros((0, self.dim() or 0), dtype=np.float32)
+        keys = [sentence_key(s) for s in sentences]
+        rows = self.lookup(keys)
+        missing = list(dict.fromkeys(k for k in keys if k not in rows))
+        if missing:
+            first = {}
+            for k, s in zip(keys, sentences):
+                first.setdefault(k, s)
+            self.add(missing, encode([first[k] for k in missing]))
+            rows = self.lookup(keys)
+        dim = self.dim()
+        matrix = self._matrix(dim)
+        return np.asarray(matrix[[rows[k] for k in keys]], dtype=np.float32)
+
+
+def open_cache(model_name: str, cache_dir: Optional[str] = None) -> EmbeddingCache:
+    """Shared :class:`EmbeddingCache` for ``model_name`` in ``cache_dir``."""
+    if cache_dir is None:
+        from ..utils.cache import _default_cache_dir
+
+        cache_dir = str(_default_cache_dir() / "embeddings")
+    target = (str(cache_dir), model_name)
+    with _stores_lock:
+        store = _stores.get(target)
+        if store is None:
+            store = _stores[target] = EmbeddingCache(cache_dir, model_name)
+    return store
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+
+from .tokenize import PARAGRAPH_BREAK, tokens_of
+
 
 def segment_by_simple_rules(text: str, max_chars: int = 4000) -> list[dict[str, str]]:
     """Very simple fallback segmenter that creates topic-like chunks.
@@ -22,34 +26,120 @@ def segment_by_simple_rules(text: str, max_chars: int = 4000) -> list[dict[str,
     return out
 
 
+def segment_without_embeddings(
+    text: str, max_chunk_chars: int = 6000
+) -> list[dict[str, str]]:
+    """TF-IDF TextTiling segmentation (NumPy only); simple rules without NumPy."""
+    try:
+        import numpy  # noqa: F401
+    except Exception:
+        return segment_by_simple_rules(text, max_chars=max_chunk_chars)
+    from .texttiling import segment_texttiling
+
+    return segment_texttiling(text, max_chunk_chars=max_chunk_chars)
+
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 64
+
+# Loaded SentenceTransformer models by name; loading takes seconds, so a
+# process reuses one instance for every episode.
+_models: dict[str, object] = {}
+_models_lock = threading.Lock()
+
+
+def get_embedding_model(name: str = DEFAULT_EMBEDDING_MODEL):
+    """Return the shared SentenceTransformer for ``name`` (loaded once)."""
+    model = _models.get(name)
+    if model is None:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+
+        with _models_lock:
+            model = _models.get(name)
+            if model is None:
+                model = _models[name] = SentenceTransformer(name)
+    return model
+
+
+def adjacent_similarities(embs):
+    """Cosine similarity of each row with the next one (length ``n - 1``)."""
+    import numpy as np
+
+    embs = np.asarray(embs, dtype=np.float32)
+    norms = np.linalg.norm(embs, axis=1, keepdims=True)
+    unit = embs / np.maximum(norms, 1e-12)
+    return np.einsum("ij,ij->i", unit[:-1], unit[1:])
+
+
+def embed_sentences(
+    sents: list[str],
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache_dir: str | None = None,
+):
+    """Embed ``sents``; only sentences missing from the embedding cache are encoded."""
+
+    def _encode(batch: list[str]):
+        return get_embedding_model(model_name).encode(
+            batch,
+            batch_size=max(1, int(batch_size)),
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+    from . import embedding_cache
+
+    if not embedding_cache.enabled():
+        return _encode(sents)
+    return embedding_cache.open_cache(model_name, cache_dir).encode(sents, _encode)
+
+
 def segment_with_embeddings(
-    text: str, threshold: float = 0.75, max_chunk_chars: int = 6000
+    text: str,
+    threshold: float = 0.75,
+    max_chunk_chars: int = 6000,
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache_dir: str | None = None,
+    method: str = "threshold",
 ) -> list[dict[str, str]]:
     """Optional semantic segmentation using sentence embeddings.
 
     Requires 'sentence-transformers'. Falls back to simple rules if unavailable.
     Groups sentences into topical chunks where similarity dips below threshold.
+    Sentences are encoded in batches of ``batch_size`` with a model that is
+    loaded once per process; embeddings are reused from the persistent
+    embedding cache (``cache_dir``, default under the transcript cache).
+    ``method="texttiling"`` places boundaries by windowed block comparison
+    of the embeddings instead of single adjacent-pair dips. Without
+    sentence-transformers, see :func:`segment_without_embeddings`.
     """
     try:
-        from sentence_transformers import SentenceTransformer, util  # type: ignore
+        import sentence_transformers  # type: ignore  # noqa: F401
     except Exception:
-        return segment_by_simple_rules(text, max_chars=max_chunk_chars)
-    import re
+        return segment_without_embeddings(text, max_chunk_chars=max_chunk_chars)
+    from .document import sentences_of
 
-    sents = re.split(r"(?<=[.!?])\s+", text.strip())
-    sents = [s for s in sents if s]
+    sents = sentences_of(text)
     if not sents:
         return [{"title": "Topic 1", "text": text.strip()}]
-    model = SentenceTransformer("all-MiniLM-L6-v2")
-    embs = model.encode(sents, convert_to_tensor=True, show_progress_bar=False)
+    embs = embed_sentences(sents, model_name, batch_size, cache_dir=cache_dir)
+    if method == "texttiling":
+        from .texttiling import segment_texttiling
+
+        return segment_texttiling(
+            text, max_chunk_chars=max_chunk_chars, vectors=embs, sentences=sents
+        )
+    sims = adjacent_similarities(embs).tolist() if len(sents) > 1 else []
     chunks: list[dict[str, str]] = []
     buf: list[str] = [sents[0]]
+    size = len(sents[0])
     for i in range(1, len(sents)):
-        sim = float(util.cos_sim(embs[i - 1], embs[i]).item())
-        if sim < threshold or sum(len(x) for x in buf) > max_chunk_chars:
+        if sims[i - 1] < threshold or size > max_chunk_chars:
             chunks.append({"title": f"Topic {len(chunks) + 1}", "text": " ".join(buf)})
-            buf = []
+            buf, size = [], 0
         buf.append(sents[i])
+        size += len(sents[i])
     if buf:
         chunks.append({"title": f"Topic {len(chunks) + 1}", "text": " ".join(buf)})
     return chunks
@@ -60,11 +150,8 @@ def key_takeaways(text: str, max_points: int = 5) -> list[str]:
 
     Placeholder for a more robust summarizer. Keeps logic lightweight.
     """
-    import re
-
-    words = re.findall(r"[A-Za-zÅÄÖåäö0-9']+", text)
-    freq = {}
-    for w in words:
+    freq: dict[str, int] = {}
+    for w in tokens_of(text).words:
         if len(w) < 4:
             continue
         w2 = w.lower()
@@ -73,63 +160,110 @@ def key_takeaways(text: str, max_points: int = 5) -> list[str]:
     return [w for w, _ in ranked[:max_points]]
 
 
-def key_takeaways_better(text: str, max_points: int = 5) -> list[str]:
+# spaCy pipelines by (language, model). Noun chunks need the tagger and the
+# parser (plus lemmas for the noun fallback); the other components are skipped.
+SPACY_MODELS = {"en": "en_core_web_sm", "sv": "sv_core_news_sm"}
+SPACY_EXCLUDE = (
+    "ner",
+    "entity_linker",
+    "entity_ruler",
+    "textcat",
+    "textcat_multilabel",
+)
+SPACY_CHUNK_CHARS = 20000
+_spacy_pipelines: dict[tuple[str, str], object] = {}
+
+
+def get_spacy_pipeline(language: str = "en", model: str | None = None):
+    """Return the shared spaCy pipeline for ``language`` (None if unavailable).
+
+    Loaded pipelines are kept for the life of the process; a failed load is
+    not remembered, so installing the model later works without a restart.
+    """
+    lang = (language or "en").split("-")[0].lower()
+    name = model or SPACY_MODELS.get(lang, f"{lang}_core_news_sm")
+    nlp = _spacy_pipelines.get((lang, name))
+    if nlp is not None:
+        return nlp
+    try:
+        import spacy  # type: ignore
+
+        nlp = spacy.load(name, exclude=list(SPACY_EXCLUDE))
+    except Exception:
+        return None
+    with _models_lock:
+        return _spacy_pipelines.setdefault((lang, name), nlp)
+
+
+def _spacy_chunks(text: str, max_chars: int = SPACY_CHUNK_CHARS):
+    """Paragraphs of ``text``, with long ones cut at sentence ends near ``max_chars``."""
+    for para in PARAGRAPH_BREAK.split(text):
+        para = para.strip()
+        while len(para) > max_chars:
+            cut = max(para.rfind(". ", 0, max_chars), para.rfind("? ", 0, max_chars))
+            cut = cut + 1 if cut > 0 else max_chars
+            yield para[:cut].strip()
+            para = para[cut:].strip()
+        if para:
+            yield para
+
+
+def key_takeaways_better(
+    text: str,
+    max_points: int = 5,
+    language: str = "en",
+    batch_size: int = 16,
+    n_process: int = 1,
+) -> list[str]:
     """Improved key takeaways extractor.
 
     Strategy:
     - If spaCy is available, use noun chunks and most frequent lemma nouns.
+      Paragraphs are streamed through ``nlp.pipe`` (``batch_size``,
+      ``n_process``) and counts are merged, so long transcripts never form
+      one giant doc.
     - Otherwise, fall back to a lightweight noun-ish phrase regex and frequency ranking.
     """
     # Try spaCy first
     try:
-        import spacy  # type: ignore
-
-        try:
-            nlp = spacy.load("en_core_web_sm")
-        except Exception:
-            # Fallback to a multilingual small model if available
-            try:
-                nlp = spacy.blank("en")  # minimal tokenizer; no POS tags
-            except Exception:
-                nlp = None
+        nlp = get_spacy_pipeline(language)
         if (
             nlp is not None
             and hasattr(nlp, "pipe")
             and getattr(nlp, "has_pipe", lambda *a, **k: False)("tagger")
         ):
-            doc = nlp(text)
-            phrases = [
-                chunk.text.strip()
-                for chunk in getattr(doc, "noun_chunks", [])
-                if chunk.text.strip()
-            ]
+            chunk_freq: dict[str, int] = {}
+            noun_freq: dict[str, int] = {}
+            docs = nlp.pipe(
+                _spacy_chunks(text), batch_size=batch_size, n_process=n_process
+            )
+            for doc in docs:
+                for chunk in getattr(doc, "noun_chunks", []):
+                    key = chunk.text.strip().lower()
+                    if key:
+                        chunk_freq[key] = chunk_freq.get(key, 0) + 1
+                if not chunk_freq:
+                    for t in doc:
+                        if t.is_alpha and t.pos_ in {"NOUN", "PROPN"}:
+                            key = t.lemma_.lower()
+                            noun_freq[key] = noun_freq.get(key, 0) + 1
             # fallback if no noun_chunks
-            if not phrases:
-                phrases = [
-                    t.lemma_ for t in doc if t.is_alpha and t.pos_ in {"NOUN", "PROPN"}
-                ]
-            freq: dict[str, int] = {}
-            for p in phrases:
-                key = p.lower()
-                freq[key] = freq.get(key, 0) + 1
+            freq = chunk_freq or noun_freq
             ranked = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
             return [p for p, _ in ranked[:max_points]]
     except Exception:
         pass
 
     # Regex-based simple noun-ish phrase extraction
-    import re
-
-    # Capture Capitalized phrases and mid-length lowercase multi-words as candidates
-    caps = re.findall(r"(?:[A-Z][a-z]+(?: [A-Z][a-z]+){0,3})", text)
-    words = re.findall(r"[A-Za-zÅÄÖåäö0-9']+", text)
+    # Capitalized phrases and words come from one fused scan of the text
+    tokens = tokens_of(text)
     # Build frequency with preference for multiword caps
     freq: dict[str, int] = {}
-    for p in caps:
-        k = p.strip().lower()
+    for p in tokens.phrases:
+        k = p.lower()
         if len(k) >= 4:
             freq[k] = freq.get(k, 0) + 3  # boost phrases
-    for w in words:
+    for w in tokens.words:
         if len(w) < 4:
             continue
         k = w.lower()
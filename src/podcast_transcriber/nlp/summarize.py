@@ -0,0 +1,123 @@
+"""Extractive summaries ranked with TextRank over a sentence similarity graph.
+
+Sentences are TF-IDF vectors (rows of a sparse matrix ``X`` kept as COO
+arrays) and the graph weight between two sentences is their cosine
+similarity. The graph ``S = X Xᵀ`` is never built: power iteration only needs
+``S v = X (Xᵀ v)``, two sparse products that cost O(non-zeros) each. The
+embedding mode ranks on sentence embeddings the same way, with
+``(1 + cos) / 2`` as the weight so it stays non-negative.
+
+Without NumPy the summary falls back to the leading sentences.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .document import sentences_of, terms_of
+from .texttiling import inverse_document_frequency, term_ids
+
+METHODS = ("textrank", "embedding", "lead")
+DAMPING = 0.85
+TOLERANCE = 1e-6
+MAX_ITER = 100
+# Fillers ("Yeah.", "Right, okay.") are never picked
+MIN_WORDS = 4
+
+
+def _tfidf_operator(sentences: list[str], terms=None):
+    """``matvec`` for the TF-IDF cosine graph (without self-loops)."""
+    import numpy as np
+
+    row, term, vocab_size = terms if terms is not None else term_ids(sentences)
+    n = len(sentences)
+    width = max(vocab_size, 1)
+    # Merge repeated terms of a sentence into one tf-idf entry
+    keys, inverse = np.unique(row * width + term, return_inverse=True)
+    idf = inverse_document_frequency(row, term, n, vocab_size)
+    rows, cols = keys // width, keys % width
+    vals = np.bincount(inverse, minlength=len(keys)) * idf[cols]
+    norms = np.sqrt(np.bincount(rows, weights=vals**2, minlength=n))
+    vals = vals / norms[rows]
+    self_sim = (norms > 0).astype(np.float64)  # unit rows, or empty ones
+
+    def matvec(v):
+        xt_v = np.bincount(cols, weights=vals * v[rows], minlength=width)
+        return np.bincount(rows, weights=vals * xt_v[cols], minlength=n) - self_sim * v
+
+    return matvec
+
+
+def _embedding_operator(embeddings):
+    import numpy as np
+
+    e = np.asarray(embeddings, dtype=np.float64)
+    e = e / np.maximum(np.linalg.norm(e, axis=1, keepdims=True), 1e-12)
+
+    def matvec(v):
+        # ((1 + cos) / 2) v without self-loops (each self weight is 1)
+        return (v.sum() + e @ (e.T @ v)) / 2 - v
+
+    return matvec
+
+
+def rank(matvec, n: int, damping: float = DAMPING, tol: float = TOLERANCE):
+    """PageRank scores on the weighted graph given by ``matvec``."""
+    import numpy as np
+
+    degree = matvec(np.ones(n))
+    inv_degree = np.divide(1.0, degree, out=np.zeros(n), where=degree > 1e-12)
+    dangling = degree <= 1e-12
+    p = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITER):
+        leak = p[dangling].sum() / n  # isolated sentences spread evenly
+        nxt = (1 - damping) / n + damping * (matvec(p * inv_degree) + leak)
+        done = np.abs(nxt - p).sum() < tol
+        p = nxt
+        if done:
+            break
+    return p
+
+
+def summarize(
+    text: str,
+    max_sentences: int = 5,
+    method: str = "textrank",
+    embeddings=None,
+    sentences: Optional[list[str]] = None,
+) -> str:
+    """Return the ``max_sentences`` most central sentences in original order.
+
+    ``method="embedding"`` ranks on sentence embeddings: pass ``embeddings``
+    (one row per sentence in ``sentences``) or let it reuse the semantic
+    segmentation's cached embeddings (TF-IDF is used when
+    sentence-transformers is missing). ``method="lead"`` keeps the first
+    sentences.
+    """
+    if method not in METHODS:
+        raise ValueError(
+            f"Unknown summary method '{method}'. Use: {', '.join(METHODS)}"
+        )
+    sents = sentences if sentences is not None else sentences_of(text)
+    if len(sents) <= max_sentences or method == "lead":
+        return " ".join(sents[:max_sentences]).strip()
+    try:
+        import numpy as np
+    except Exception:
+        return " ".join(sents[:max_sentences]).strip()
+    if method == "embedding" and embeddings is None:
+        try:
+            from .segment_topics import embed_sentences
+
+            embeddings = embed_sentences(sents)
+        except ImportError:
+            embeddings = None  # no sentence-transformers: rank on TF-IDF
+    if embeddings is not None:
+        matvec = _embedding_operator(embeddings)
+    else:
+        matvec = _tfidf_operator(sents, terms_of(text, sents))
+    scores = rank(matvec, len(sents))
+    short = np.fromiter((len(s.split()) < MIN_WORDS for s in sents), bool, len(sents))
+    scores[short] = -1.0
+    top = np.argsort(-scores, kind="stable")[:max_sentences]
+    return " ".join(sents[i] for i in sorted(top.tolist())).strip()
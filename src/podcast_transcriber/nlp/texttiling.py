@@ -0,0 +1,254 @@
+"""TextTiling-style topic segmentation in pure NumPy.
+
+Each gap between two sentences is scored by the cosine similarity of the
+``window`` sentences before it and the ``window`` sentences after it (block
+comparison). Sentences are TF-IDF vectors hashed into ``dim`` signed buckets,
+or any precomputed vectors such as sentence embeddings. Block vectors come
+from prefix sums, so scoring is linear in the number of sentences and is done
+in bounded-size slices. Scores are smoothed, turned into depth scores (how far
+a gap lies below the peaks on either side) and gaps that are deep local
+minima become boundaries.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Optional
+
+from .tokenize import WORD, is_content_word
+
+DEFAULT_WINDOW = 6
+DEFAULT_SMOOTHING = 2
+DEFAULT_DIM = 512
+DEFAULT_MIN_SENTENCES = 3
+_SLICE = 4096
+
+
+def term_ids(sentences: list[str]):
+    """Content-word occurrences as arrays ``(sentence, term)`` plus vocabulary size.
+
+    Terms are numbered in order of first appearance, so results are
+    deterministic; ``sentence`` is sorted.
+    """
+    words: list[str] = []
+    rows: list[int] = []
+    for i, sent in enumerate(sentences):
+        found = WORD.findall(sent)
+        words.extend(found)
+        rows.extend([i] * len(found))
+    return terms_from_tokens(words, rows)
+
+
+def terms_from_tokens(words: list[str], rows: list[int]):
+    """:func:`term_ids` for an already tokenized text (see :mod:`.tokenize`)."""
+    import numpy as np
+
+    vocab: dict[str, int] = {}
+    keep: list[int] = []
+    ids: list[int] = []
+    for word, row in zip(words, rows):
+        word = word.lower()
+        if is_content_word(word):
+            keep.append(row)
+            ids.append(vocab.setdefault(word, len(vocab)))
+    return (
+        np.asarray(keep, dtype=np.int64),
+        np.asarray(ids, dtype=np.int64),
+        len(vocab),
+    )
+
+
+def inverse_document_frequency(row, term, n: int, vocab_size: int):
+    """Smoothed IDF per term, treating each sentence as a document."""
+    import numpy as np
+
+    width = max(vocab_size, 1)
+    # Each (sentence, term) pair counted once
+    pairs = np.unique(row * width + term)
+    df = np.bincount(pairs % width, minlength=vocab_size)
+    return np.log((n + 1) / (df + 1.0)) + 1.0
+
+
+def hashed_tfidf(sentences: list[str], dim: int = DEFAULT_DIM, terms=None):
+    """Sparse TF-IDF as COO arrays ``(rows, cols, values)`` over ``dim`` buckets.
+
+    Terms (see :func:`term_ids`) are folded into ``dim`` buckets with a
+    +/-1 sign so collisions cancel out on average.
+    """
+    import numpy as np
+
+    row, term, vocab_size = terms if terms is not None else term_ids(sentences)
+    idf = inverse_document_frequency(row, term, len(sentences), vocab_size)
+    mixed = (term * 0x9E3779B1) & 0xFFFFFFFF
+    col = mixed % dim
+    sign = np.where((mixed >> 31) & 1, -1.0, 1.0)
+    return row, col, (sign * idf[term]).astype(np.float32)
+
+
+def _block_similarity(rows_of, n: int, window: int):
+    """Cosine similarity across each of the ``n - 1`` gaps (sliced prefix sums).
+
+    ``rows_of(first, last)`` returns the dense vectors of sentences
+    ``first..last-1``; only one slice is materialized at a time.
+    """
+    import numpy as np
+
+    out = np.zeros(max(n - 1, 0), dtype=np.float64)
+    for lo in range(1, n, _SLICE):
+        hi = min(n, lo + _SLICE)  # gaps lo..hi-1 (gap g sits before sentence g)
+        first, last = max(0, lo - window), min(n, hi - 1 + window)
+        block = rows_of(first, last)
+        prefix = np.zeros((last - first + 1, block.shape[1]), dtype=np.float64)
+        np.cumsum(block, axis=0, out=prefix[1:])  # prefix[k]: sentences < first+k
+        gaps = np.arange(lo, hi)
+        left = prefix[gaps - first] - prefix[np.maximum(gaps - window, 0) - first]
+        right = prefix[np.minimum(gaps + window, n) - first] - prefix[gaps - first]
+        dot = np.einsum("ij,ij->i", left, right)
+        norm = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+        out[lo - 1 : hi - 1] = np.divide(
+            dot, norm, out=np.zeros_like(dot), where=norm > 0
+        )
+    return out
+
+
+def _sparse_rows(rows, cols, vals, dim: int):
+    import numpy as np
+
+    def rows_of(first: int, last: int):
+        a, b = np.searchsorted(rows, [first, last])
+        flat = (rows[a:b] - first) * dim + cols[a:b]
+        dense = np.bincount(flat, weights=vals[a:b], minlength=(last - first) * dim)
+        return dense.reshape(last - first, dim)
+
+    return rows_of
+
+
+def depth_scores(scores):
+    """TextTiling depth: climb to the nearest peak on each side of every gap."""
+    import numpy as np
+
+    s = np.asarray(scores, dtype=np.float64)
+    if not len(s):
+        return s
+    idx = np.arange(len(s))
+    # Climbing left from i continues while the previous score is higher, so
+    # the left peak is the start of the strictly decreasing run ending at i.
+    start = np.r_[True, s[:-1] <= s[1:]]
+    left = s[np.maximum.accumulate(np.where(start, idx, 0))]
+    r = s[::-1]
+    start = np.r_[True, r[:-1] <= r[1:]]
+    right = r[np.maximum.accumulate(np.where(start, idx, 0))][::-1]
+    return (left - s) + (right - s)
+
+
+def _smooth(scores, width: int):
+    import numpy as np
+
+    if width <= 0 or len(scores) < 3:
+        return scores
+    kernel = np.ones(2 * width + 1)
+    padded = np.pad(scores, width, mode="edge")
+    return np.convolve(padded, kernel / kernel.sum(), mode="valid")
+
+
+def boundaries(
+    scores,
+    min_sentences: int = DEFAULT_MIN_SENTENCES,
+    cutoff: Optional[float] = None,
+) -> list[int]:
+    """Sentence indices that start a new segment, chosen from gap ``scores``.
+
+    A gap qualifies when its depth is a local maximum above ``cutoff``
+    (default: mean depth minus half a standard deviation); deeper gaps win
+    when two would produce a segment shorter than ``min_sentences``.
+    """
+    import numpy as np
+
+    depth = depth_scores(scores)
+    if len(depth) == 0 or not depth.any():
+        return []
+    if cutoff is None:
+        cutoff = float(depth.mean() - depth.std() / 2)
+    padded = np.pad(depth, 1, constant_values=-np.inf)
+    peak = (depth >= padded[:-2]) & (depth >= padded[2:]) & (depth > 0)
+    candidates = np.flatnonzero(peak & (depth > cutoff))
+    n = len(depth) + 1
+    chosen: list[int] = []  # kept sorted
+    for gap in candidates[np.argsort(-depth[candidates], kind="stable")]:
+        cut = int(gap) + 1
+        if cut < min_sentences or n - cut < min_sentences:
+            continue
+        at = bisect.bisect_left(chosen, cut)
+        if at > 0 and cut - chosen[at - 1] < min_sentences:
+            continue
+        if at < len(chosen) and chosen[at] - cut < min_sentences:
+            continue
+        chosen.insert(at, cut)
+    return chosen
+
+
+def gap_scores(
+    sentences: list[str],
+    vectors=None,
+    window: int = DEFAULT_WINDOW,
+    smoothing: int = DEFAULT_SMOOTHING,
+    dim: int = DEFAULT_DIM,
+    terms=None,
+):
+    """Smoothed block-comparison similarity for each gap between sentences.
+
+    ``terms`` are precomputed :func:`term_ids` arrays for ``sentences``.
+    """
+    import numpy as np
+
+    if vectors is None:
+        n = len(sentences)
+        rows_of = _sparse_rows(*hashed_tfidf(sentences, dim, terms), dim)
+    else:
+        matrix = np.asarray(vectors)
+        n = len(matrix)
+
+        def rows_of(first: int, last: int):
+            return np.asarray(matrix[first:last], dtype=np.float64)
+
+    return _smooth(_block_similarity(rows_of, n, window), smoothing)
+
+
+def segment_texttiling(
+    text: str,
+    max_chunk_chars: int = 6000,
+    vectors=None,
+    window: int = DEFAULT_WINDOW,
+    smoothing: int = DEFAULT_SMOOTHING,
+    min_sentences: int = DEFAULT_MIN_SENTENCES,
+    sentences: Optional[list[str]] = None,
+) -> list[dict[str, str]]:
+    """Topic chunks ``[{title, text}]`` using windowed block comparison.
+
+    Pass ``vectors`` (one row per sentence, e.g. embeddings) together with
+    the matching ``sentences`` to segment on them instead of TF-IDF.
+    Segments longer than ``max_chunk_chars`` are split further.
+    """
+    from .document import sentences_of, terms_of
+
+    sents = sentences if sentences is not None else sentences_of(text)
+    if not sents:
+        return [{"title": "Topic 1", "text": text.strip()}]
+    cuts = set()
+    if len(sents) > 1:
+        terms = terms_of(text, sents) if vectors is None else None
+        scores = gap_scores(
+            sents, vectors, window=window, smoothing=smoothing, terms=terms
+        )
+        cuts = set(boundaries(scores, min_sentences=min_sentences))
+    chunks: list[dict[str, str]] = []
+    buf: list[str] = [sents[0]]
+    size = len(sents[0])
+    for i in range(1, len(sents)):
+        if i in cuts or size > max_chunk_chars:
+            chunks.append({"title": f"Topic {len(chunks) + 1}", "text": " ".join(buf)})
+            buf, size = [], 0
+        buf.append(sents[i])
+        size += len(sents[i])
+    chunks.append({"title": f"Topic {len(chunks) + 1}", "text": " ".join(buf)})
+    return chunks
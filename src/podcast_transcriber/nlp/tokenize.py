@@ -0,0 +1,86 @@
+"""Fused single-scan tokenizer shared by the NLP helpers.
+
+One precompiled pattern walks the transcript once and yields capitalized
+phrases (1-4 Title-case words separated by single spaces), other word
+tokens, sentence ends (terminal punctuation plus the following whitespace)
+and paragraph breaks. From that stream :func:`tokenize` builds
+the word list, the sentence index of every word and the capitalized phrases,
+which previously took one regex pass each (plus one per sentence).
+
+Sentence boundaries match :func:`split_sentences`, so ``rows``
+index into its result for the same (stripped) text.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+# Alternatives in priority order: Capitalized Phrase (1-4 words), word,
+# sentence end, paragraph break. No capture groups: findall then returns
+# plain strings (much cheaper than tuples) and the first character tells
+# breaks from words.
+TOKEN = re.compile(
+    r"[A-Z][a-z]+\b(?!')(?: [A-Z][a-z]+\b(?!')){0,3}|\w+(?:'\w+)*|[.!?]+\s+|\n\s*\n"
+)
+_BREAK_START = frozenset(".!?\n")
+WORD = re.compile(r"\w+(?:'\w+)*")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+# Function words carry no topic; a short English/Swedish list keeps blocks clean
+_STOPWORD_TEXT = """
+    the and for are but not you all any can had her was one our out has him his
+    how its may new now see two way who did get got let say she too use that
+    with have this will your from they know want been good much some time very
+    when come here just like long make many more only over such take than them
+    then well were what there their about would these other which could into
+    also because really going think yeah okay right thing things mean actually
+    och att det som var för med har inte till den jag men ett han hon kan
+"""
+STOPWORDS = frozenset(_STOPWORD_TEXT.split())
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in SENTENCE_BREAK.split(text.strip()) if s and s.strip()]
+
+
+class Tokens(NamedTuple):
+    words: list[str]  # original case, in text order
+    rows: list[int]  # sentence index of each word
+    phrases: list[str]  # capitalized phrases (single Title-case words included)
+    sentences: int  # number of sentence boundaries seen + 1
+
+
+def tokenize(text: str) -> Tokens:
+    """Words, their sentence indices and capitalized phrases in one scan."""
+    words: list[str] = []
+    rows: list[int] = []
+    phrases: list[str] = []
+    add_word, add_row = words.append, rows.append
+    row = 0
+    for tok in TOKEN.findall(text.strip()):
+        first = tok[0]
+        if first in _BREAK_START:
+            row += 1
+        elif " " in tok:
+            phrases.append(tok)
+            parts = tok.split(" ")
+            words.extend(parts)
+            rows.extend([row] * len(parts))
+        else:
+            add_word(tok)
+            add_row(row)
+            if first.isupper() and tok.isalpha() and tok.istitle() and tok.isascii():
+                phrases.append(tok)
+    return Tokens(words, rows, phrases, row + 1)
+
+
+def is_content_word(word: str) -> bool:
+    """Lowercased ``word`` counts as a topic term (alphabetic, 3+ chars, no stopword)."""
+    return len(word) >= 3 and word.isalpha() and word not in STOPWORDS
+
+
+def tokens_of(text: str) -> Tokens:
+    """Tokens of ``text``, reusing a :class:`~.document.Document`'s scan."""
+    cached = getattr(text, "tokens", None)
+    return cached if isinstance(cached, Tokens) else tokenize(text)
@@ -4,20 +4,25 @@ import sys
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from . import services
 from .delivery.send_to_kindle import send_file_via_smtp
-from .exporters import export_book, export_transcript
+from .exporters import export_book, export_many
 from .ingestion.feed import discover_new_episodes
 from .kindle.epub_builder import Chapter, Document
+from .nlp.analyze import analyze
 from .nlp.segment_topics import key_takeaways_better, segment_with_embeddings
+from .nlp.summarize import METHODS as SUMMARY_METHODS
 from .storage.state import StateStore
 from .templates.render import render_markdown
+from .utils.cache import transcribe_cached
+from .utils.covers import fetch_cover
 from .utils.downloader import ensure_local_audio
-from .utils.textproc import normalize_text, summarize_text
+from .utils.pipeline import PipelineError, Stage, run_pipeline
 
 
 def load_yaml_config(path: str) -> dict:
@@ -84,14 +89,23 @@ def cmd_ingest(args) -> int:
     return 0
 
 
-def _process_episode(
+def _transcribe_episode(
     ep: dict,
     service_name: str,
     quality: str,
     language: Optional[str],
-    nlp_cfg: Optional[dict] = None,
     clip_minutes: Optional[int] = None,
-) -> dict:
+    local_path: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    use_cache: bool = True,
+) -> tuple[str, Optional[list]]:
+    """Run the transcription backend for one episode.
+
+    Returns ``(text, segments)``. ``local_path`` skips the download when the
+    audio was already fetched (e.g. by the pipeline's download stage).
+    Transcripts go through the shared transcript cache, so re-processing a
+    job (e.g. to add an output format) does not transcribe again.
+    """
     qs = pick_quality_settings(quality)
     service = services.get_service(service_name)
     if (
@@ -108,7 +122,34 @@ def _process_episode(
             service.speakers = int(qs["diarization"])  # type: ignore[attr-defined]
         except Exception:
             pass
-    local_path = ensure_local_audio(ep["source"])  # URL or path
+    if local_path is None:
+        local_path = ensure_local_audio(ep["source"])  # URL or path
+    text = transcribe_cached(
+        service,
+        str(local_path),
+        service_name=service_name,
+        source=ep.get("source"),
+        language=language,
+        model=qs.get("whisper_model") if service_name == "whisper" else None,
+        translate=bool(qs.get("translate", False)),
+        clip_minutes=clip_minutes,
+        speakers=qs.get("diarization", 0),
+        cache_dir=cache_dir,
+        enabled=use_cache,
+        transcribe=lambda: _run_transcription(
+            service, local_path, language, clip_minutes
+        ),
+    )
+    segs = getattr(service, "last_segments", None)
+    if segs is not None:
+        segs = list(segs)  # cache hits restore lazy rows; checkpoints need a list
+    return text, segs
+
+
+def _run_transcription(
+    service, local_path, language: Optional[str], clip_minutes: Optional[int]
+) -> str:
+    """Call the backend, pre-clipping the audio to ``clip_minutes`` if set."""
     clip_path = None
     if clip_minutes and int(clip_minutes) > 0:
         try:
@@ -138,78 +179,651 @@ def _process_episode(
         except Exception:
             clip_path = None
     try:
-        text = service.transcribe(clip_path or local_path, language=language)
+        return service.transcribe(clip_path or local_path, language=language)
     finally:
         if clip_path:
             try:
                 Path(clip_path).unlink(missing_ok=True)
             except Exception:
                 pass
-    segs = getattr(service, "last_segments", None)
-    # normalize optionally
-    text = normalize_text(text)
-    # basic summaries for standard/premium
-    summary = None
-    if qs.get("summarize"):
-        summary = summarize_text(text, max_sentences=6)
-    # basic chapterization by minutes when segments available
-    chapters = []
-    # NLP: semantic topic segmentation when configured
-    use_semantic = bool((nlp_cfg or {}).get("semantic")) or bool(
-        qs.get("topic_segmentation")
+
+
+def _check_nlp_cfg(nlp_cfg: dict) -> dict:
+    """Replace an unknown ``nlp.summary`` method with textrank (and warn)."""
+    method = nlp_cfg.get("summary")
+    if method and method not in SUMMARY_METHODS:
+        print(
+            f"Unknown nlp.summary '{method}' (use: {', '.join(SUMMARY_METHODS)}); "
+            "using textrank",
+            file=sys.stderr,
+        )
+        nlp_cfg = {**nlp_cfg, "summary": "textrank"}
+    return nlp_cfg
+
+
+def _analyze_episode(
+    ep: dict,
+    text: str,
+    segs: Optional[list],
+    quality: str,
+    nlp_cfg: Optional[dict] = None,
+) -> dict:
+    """Normalize, summarize and chapterize a transcript."""
+    qs = pick_quality_settings(quality)
+    nlp_cfg = _check_nlp_cfg(nlp_cfg or {})
+    # Segment chapter policies; ``nlp.chapters`` overrides the preset minutes
+    chap_cfg = nlp_cfg.get("chapters")
+    chap_cfg = chap_cfg if isinstance(chap_cfg, dict) else {}
+    res = analyze(
+        text,
+        segs,
+        title=ep.get("title"),
+        summary=bool(qs.get("summarize")),
+        summary_method=nlp_cfg.get("summary") or "textrank",
+        # NLP: semantic topic segmentation when configured
+        semantic=bool(nlp_cfg.get("semantic")) or bool(qs.get("topic_segmentation")),
+        takeaways=bool(nlp_cfg.get("takeaways")),
+        chapter_minutes=chap_cfg.get("minutes", qs.get("chapter_minutes")),
+        chapter_chars=chap_cfg.get("max_chars", 4000),
+        speaker_change=bool(chap_cfg.get("speaker_change")),
+        segment=segment_with_embeddings,
+        extract_takeaways=key_takeaways_better,
     )
-    if use_semantic:
-        try:
-            topics = segment_with_embeddings(text)
-            chapters = [{"title": t["title"], "text": t["text"]} for t in topics]
-        except Exception:
-            chapters = []
-    if not chapters and qs.get("chapter_minutes") and segs:
-        mins = int(qs["chapter_minutes"]) or 10
-        bucket = []
-        bucket_chars = 0
-        start_time = None
-        for s in segs:
-            if start_time is None:
-                start_time = s.get("start", 0.0)
-            bucket.append(s.get("text", ""))
-            bucket_chars += len(bucket[-1])
-            if (s.get("end", 0.0) - start_time) >= mins * 60 or bucket_chars > 4000:
-                chapters.append(
-                    {"title": f"Chapter {len(chapters) + 1}", "text": " ".join(bucket)}
-                )
-                bucket, bucket_chars, start_time = [], 0, None
-        if bucket:
-            chapters.append(
-                {"title": f"Chapter {len(chapters) + 1}", "text": " ".join(bucket)}
-            )
-    else:
-        chapters = [{"title": ep.get("title") or "Transcript", "text": text}]
+    chapters = res["chapters"]
     # If episode description present, prepend as an intro page
     ep_desc = ep.get("description")
     if ep_desc:
         chapters = [{"title": "Introduction", "text": str(ep_desc).strip()}] + chapters
-    # Enrich with key takeaways if NLP enabled
-    if (nlp_cfg or {}).get("takeaways"):
-        try:
-            kt = key_takeaways_better(text)
-            if kt:
-                takeaways = kt
-            else:
-                takeaways = None
-        except Exception:
-            takeaways = None
-    else:
-        takeaways = None
     return {
-        "text": text,
+        "text": res["text"],
         "chapters": chapters,
-        "summary": summary,
-        "takeaways": takeaways,
+        "summary": res["summary"],
+        "takeaways": res["takeaways"],
         "segments": segs,
+        "nlp_timings": res["timings"],
     }
 
 
+def _process_episode(
+    ep: dict,
+    service_name: str,
+    quality: str,
+    language: Optional[str],
+    nlp_cfg: Optional[dict] = None,
+    clip_minutes: Optional[int] = None,
+) -> dict:
+    text, segs = _transcribe_episode(
+        ep, service_name, quality, language, clip_minutes=clip_minutes
+    )
+    return _analyze_episode(ep, text, segs, quality, nlp_cfg=nlp_cfg)
+
+
+def _fetch_episode_cover(ep: dict) -> Optional[bytes]:
+    # Try to fetch episode image (e.g., itunes:image) if present and is URL
+    ep_img = ep.get("image")
+    if ep_img and isinstance(ep_img, str) and ep_img.lower().startswith("http"):
+        # Shared artwork is downloaded once and revalidated with conditional GETs
+        return fetch_cover(ep_img)
+    return None
+
+
+def _translate_episode(
+    local_path: str,
+    source: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    use_cache: bool = True,
+) -> Optional[str]:
+    """Second Whisper pass with the translate task (bilingual books)."""
+    try:
+        svc_tr = services.get_service("whisper")
+        if getattr(services, "WhisperService", None) is not None and isinstance(
+            svc_tr, services.WhisperService
+        ):
+            svc_tr.translate = True
+        return transcribe_cached(
+            svc_tr,
+            str(local_path),
+            service_name="whisper",
+            source=source,
+            translate=True,
+            cache_dir=cache_dir,
+            enabled=use_cache,
+            transcribe=lambda: svc_tr.transcribe(local_path),
+        )
+    except Exception:
+        return None
+
+
+# Per-episode stages. Each takes and returns a context dict
+# ({"ep": ..., "opts": ...} plus whatever earlier stages added) and stays at
+# module level so the transcription stage can run in a worker process.
+
+
+def _episode_key(ep: dict) -> str:
+    """Stable identity of an episode within a job (for checkpoints)."""
+    return str(ep.get("guid") or ep.get("source") or ep.get("slug") or "")
+
+
+def _checkpoint(ctx: dict, stage: str, data=None, payload=None) -> None:
+    """Record a finished stage for the context's episode (no-op without a job).
+
+    Stages may run in worker threads or processes, so writes go through the
+    worker process's :meth:`StateStore.shared` store; its locks serialize
+    threads and processes.
+    """
+    job_id = ctx["opts"].get("job_id")
+    if not job_id:
+        return
+    try:
+        StateStore.shared().save_checkpoint(
+            job_id, _episode_key(ctx["ep"]), stage, data=data, payload=payload
+        )
+    except Exception as e:  # a lost checkpoint only costs redoing the stage
+        print(f"Checkpoint {stage} not saved: {e}", file=sys.stderr)
+        return
+    ctx.setdefault("checkpoints", {})[stage] = dict(data or {})
+
+
+def _resumed(ctx: dict, stage: str) -> Optional[dict]:
+    """Checkpoint data for ``stage`` when resuming, else None."""
+    return (ctx.get("checkpoints") or {}).get(stage)
+
+
+def _resumed_payload(ctx: dict, stage: str):
+    data = _resumed(ctx, stage)
+    if data is None or not data.get("blob"):
+        return None
+    return StateStore.shared().load_checkpoint_payload(ctx["opts"].get("job_id"), data)
+
+
+def _stage_fetch(ctx: dict) -> dict:
+    """Network I/O: resolve the enclosure to a local file and fetch the cover."""
+    done = _resumed(ctx, "downloaded") or {}
+    if _resumed(ctx, "transcribed") is not None:
+        # Transcript is checkpointed; the audio is only needed as a fallback.
+        ctx["local_path"] = None
+    elif done.get("local_path") and Path(done["local_path"]).exists():
+        ctx["local_path"] = done["local_path"]
+    else:
+        ctx["local_path"] = ensure_local_audio(ctx["ep"]["source"])
+        _checkpoint(ctx, "downloaded", {"local_path": str(ctx["local_path"])})
+    ctx["cover_bytes"] = _fetch_episode_cover(ctx["ep"])
+    return ctx
+
+
+def _stage_transcribe(ctx: dict) -> dict:
+    """Model work: transcription plus the optional translated second pass."""
+    opts = ctx["opts"]
+    saved = _resumed_payload(ctx, "transcribed")
+    if isinstance(saved, dict) and "text" in saved:
+        ctx["text"] = saved["text"]
+        ctx["segments"] = saved.get("segments")
+        if saved.get("text_tr") is not None:
+            ctx["text_tr"] = saved["text_tr"]
+        return ctx
+    ctx["text"], ctx["segments"] = _transcribe_episode(
+        ctx["ep"],
+        opts["service_name"],
+        opts.get("quality") or "standard",
+        opts.get("language"),
+        clip_minutes=opts.get("clip_minutes"),
+        local_path=ctx.get("local_path"),
+        cache_dir=opts.get("cache_dir"),
+        use_cache=opts.get("use_cache", True),
+    )
+    if opts.get("bilingual") and opts["service_name"] == "whisper":
+        ctx["text_tr"] = _translate_episode(
+            ctx.get("local_path") or ensure_local_audio(ctx["ep"]["source"]),
+            source=ctx["ep"].get("source"),
+            cache_dir=opts.get("cache_dir"),
+            use_cache=opts.get("use_cache", True),
+        )
+    _checkpoint(
+        ctx,
+        "transcribed",
+        payload={
+            "text": ctx["text"],
+            "segments": ctx["segments"],
+            "text_tr": ctx.get("text_tr"),
+        },
+    )
+    return ctx
+
+
+def _stage_analyze(ctx: dict) -> dict:
+    """NLP: normalization, summary, chapters and takeaways."""
+    opts = ctx["opts"]
+    saved = _resumed_payload(ctx, "analyzed")
+    if isinstance(saved, dict) and "chapters" in saved:
+        ctx["result"] = saved
+        return ctx
+    ctx["result"] = _analyze_episode(
+        ctx["ep"],
+        ctx["text"],
+        ctx.get("segments"),
+        opts.get("quality") or "standard",
+        nlp_cfg=opts.get("nlp_cfg"),
+    )
+    _checkpoint(ctx, "analyzed", payload=ctx["result"])
+    return ctx
+
+
+def _exported(ctx: dict, fmt: str) -> Optional[str]:
+    """Output path of a format exported by an earlier run, if still on disk."""
+    done = _resumed(ctx, f"export:{fmt}") or {}
+    path = done.get("path")
+    return path if path and Path(path).exists() else None
+
+
+def _episode_ctx(ep: dict, opts: dict) -> dict:
+    """Initial stage context, seeded with the episode's resume checkpoints."""
+    ctx = {"ep": ep, "opts": opts}
+    saved = (opts.get("checkpoints") or {}).get(_episode_key(ep))
+    if saved:
+        ctx["checkpoints"] = dict(saved)
+    return ctx
+
+
+def _run_episode(ep: dict, opts: dict) -> list[str]:
+    """Transcribe one episode and write all configured outputs.
+
+    ``opts`` carries the job-level settings resolved by ``cmd_process``. Kept
+    at module level so it can run in a worker thread or process; returns the
+    produced output paths in a stable order. The only store access is
+    :func:`_checkpoint`, which uses the worker process's shared
+    ``StateStore``, so workers meet in the state file through the store's
+    file lock rather than the parent's instance.
+    """
+    ctx = _episode_ctx(ep, opts)
+    for stage in (_stage_fetch, _stage_transcribe, _stage_analyze):
+        ctx = stage(ctx)
+    return _stage_export(ctx)
+
+
+def _stage_export(ctx: dict) -> list[str]:
+    """Disk I/O: build the document and write every configured output."""
+    ep = ctx["ep"]
+    opts = ctx["opts"]
+    res = ctx["result"]
+    cover_bytes = ctx.get("cover_bytes")
+    language = opts.get("language")
+    cfg = opts.get("cfg") or {}
+    out_dir = Path(opts["out_dir"])
+    outputs_cfg = opts.get("outputs_cfg") or []
+    emit_md = bool(opts.get("emit_md"))
+    md_template = opts.get("md_template")
+    produced: list[str] = []
+    # Build document
+    title = ep.get("title") or opts.get("job_title") or "Podcast Transcript"
+    author = cfg.get("author")
+    cover_image = cfg.get("cover_image")
+    chapters = [
+        Chapter(c["title"], c["text"], c.get("start"), c.get("end"))
+        for c in res["chapters"]
+    ]
+    text_tr = ctx.get("text_tr")
+    if text_tr is not None:
+        chapters = [
+            Chapter("Original", "\n\n".join(c.text for c in chapters)),
+            Chapter("Translated", text_tr),
+        ]
+    # Append attribution chapter (visible in EPUB/MD and part of composed text)
+    attribution = (
+        "Generated with Podcast-Transcription-CLI, developed by Johan Caripson."
+    )
+    try:
+        chapters.append(Chapter("Attribution", attribution))
+    except Exception:
+        pass
+    doc = Document(
+        title=title, author=author, chapters=chapters, summary=res.get("summary")
+    )
+    base = _sanitize_filename(Path(ep.get("slug") or title).stem)
+    # Multi-output support via config.outputs
+    if outputs_cfg:
+        produced_paths = []
+        # Compose a plain body text from chapters for transcript-style exports
+        composed_all = []
+        for ch in doc.chapters:
+            composed_all.append(ch.title)
+            composed_all.append("")
+            composed_all.append(ch.text)
+            composed_all.append("")
+        body_all = "\n".join(composed_all).strip()
+        # Exporter formats are collected and written together (in parallel,
+        # from one rendered build); ``slots`` keeps produced paths in order.
+        targets: list[tuple[str, str, dict]] = []
+        slots: list[int] = []
+        for out in outputs_cfg:
+            try:
+                fmt = str(out.get("fmt") or out.get("format") or "").lower()
+            except Exception:
+                fmt = ""
+            if not fmt:
+                continue
+            out_path = out_dir / f"{base}.{fmt}"
+            prev = _exported(ctx, fmt)
+            if prev:
+                produced_paths.append(prev)
+                continue
+            title_ov = out.get("title") if isinstance(out, dict) else None
+            author_ov = out.get("author") if isinstance(out, dict) else None
+            # Optional CSS/template
+            css_file = out.get("epub_css_file") or out.get("css_file")
+            css_text = out.get("epub_css_text") or out.get("css_text")
+            template = out.get("template") or out.get("markdown_template")
+            metadata = {
+                "language": language,
+                "description": ep.get("description") or cfg.get("description"),
+                "keywords": cfg.get("keywords"),
+            }
+            try:
+                if fmt == "epub":
+                    targets.append(
+                        (
+                            fmt,
+                            str(out_path),
+                            {
+                                "title": title_ov or doc.title,
+                                "author": author_ov or doc.author,
+                                "epub_css_file": css_file,
+                                "epub_css_text": css_text,
+                                "metadata": metadata,
+                                "epub_writer": out.get("epub_writer")
+                                or cfg.get("epub_writer"),
+                            },
+                        )
+                    )
+                    slots.append(len(produced_paths))
+                    produced_paths.append(None)
+                elif fmt == "md":
+                    md_path = out_path
+                    md_cover_flag = bool(out.get("md_include_cover"))
+                    cover_rel = None
+                    if md_cover_flag and (cover_bytes or cover_image):
+                        try:
+                            img_name = f"{base}-cover.jpg"
+                            img_path = out_dir / img_name
+                            if cover_bytes:
+                                img_path.write_bytes(cover_bytes)
+                            elif cover_image:
+                                cp = Path(cover_image)
+                                if cp.exists():
+                                    img_path.write_bytes(cp.read_bytes())
+                            if img_path.exists():
+                                cover_rel = img_name
+                        except Exception:
+                            cover_rel = None
+                    try:
+                        tmpl = template or md_template
+                        md_text = render_markdown(
+                            tmpl,
+                            {
+                                "title": title_ov or doc.title,
+                                "author": author_ov or doc.author,
+                                "summary": doc.summary,
+                                "topics": [ch.title for ch in doc.chapters],
+                                "takeaways": res.get("takeaways"),
+                                "chapters": [ch.as_dict() for ch in doc.chapters],
+                                "cover_image": cover_rel,
+                            },
+                        )
+                    except Exception:
+                        lines = []
+                        if cover_rel:
+                            lines += [f"![Cover]({cover_rel})", ""]
+                        if title_ov or doc.title:
+                            lines += [f"# {title_ov or doc.title}", ""]
+                        if author_ov or doc.author:
+                            lines += [f"_by {author_ov or doc.author}_", ""]
+                        if doc.summary:
+                            lines += ["## Summary", "", str(doc.summary), ""]
+                        topics = [ch.title for ch in doc.chapters]
+                        if topics:
+                            lines += ["## Topics", ""]
+                            lines += ["- " + t for t in topics]
+                            lines += [""]
+                        takeaways = res.get("takeaways")
+                        if takeaways:
+                            lines += ["## Key Takeaways", ""]
+                            lines += ["- " + k for k in takeaways]
+                            lines += [""]
+                        for ch in doc.chapters:
+                            lines += [f"## {ch.title}", ""]
+                            if ch.span:
+                                lines += [f"_{ch.span}_", ""]
+                            lines += [ch.text, ""]
+                        md_text = "\n".join(lines).rstrip() + "\n"
+                    md_path.write_text(md_text, encoding="utf-8")
+                    produced_paths.append(str(md_path))
+                    _checkpoint(ctx, f"export:{fmt}", {"path": str(md_path)})
+                else:
+                    kwargs = {}
+                    if isinstance(out, dict):
+                        allowed_keys = {
+                            "pdf_font",
+                            "pdf_font_size",
+                            "pdf_margin",
+                            "pdf_cover_fullpage",
+                            "pdf_first_page_cover_only",
+                            "pdf_page_size",
+                            "pdf_orientation",
+                            "pdf_font_file",
+                            "epub_css_file",
+                            "epub_css_text",
+                            "auto_toc",
+                            "docx_cover_first",
+                            "docx_cover_width_inches",
+                            "epub_writer",
+                        }
+                        for k, v in out.items():
+                            if k in allowed_keys:
+                                kwargs[k] = v
+                    if cfg.get("epub_writer"):
+                        # Kindle formats without an EPUB output build their own
+                        kwargs.setdefault("epub_writer", cfg["epub_writer"])
+                    if fmt == "pdf":
+                        kwargs.setdefault(
+                            "pdf_footer",
+                            "Generated with Podcast-Transcription-CLI by Johan Caripson",
+                        )
+                    if fmt == "docx":
+                        kwargs.setdefault(
+                            "docx_footer_text",
+                            "Generated with Podcast-Transcription-CLI by Johan Caripson",
+                        )
+                    kwargs.update(
+                        title=title_ov or doc.title,
+                        author=author_ov or doc.author,
+                        metadata=metadata,
+                    )
+                    targets.append((fmt, str(out_path), kwargs))
+                    slots.append(len(produced_paths))
+                    produced_paths.append(None)
+            except Exception as e:  # pragma: no cover - best-effort per-format
+                try:
+                    print(f"Output {fmt} failed: {e}", file=sys.stderr)
+                except Exception:
+                    pass
+        errors = export_many(
+            body_all,
+            targets,
+            cover_image=cover_image,
+            cover_image_bytes=cover_bytes,
+            segments=res.get("segments"),
+            max_workers=opts.get("export_workers"),
+        )
+        for (fmt, path, _), slot, err in zip(targets, slots, errors):
+            if err is not None:
+                try:
+                    print(f"Output {fmt} failed: {err}", file=sys.stderr)
+                except Exception:
+                    pass
+                continue
+            produced_paths[slot] = path
+            _checkpoint(ctx, f"export:{fmt}", {"path": path})
+        # Record artifacts
+        produced.extend(p for p in produced_paths if p)
+    else:
+        # Default single EPUB path + optional Markdown
+        out_path = out_dir / f"{base}.epub"
+        if not _exported(ctx, "epub"):
+            export_book(
+                chapters=[ch.as_dict() for ch in doc.chapters],
+                out_path=str(out_path),
+                fmt="epub",
+                title=doc.title,
+                author=doc.author,
+                cover_image=cover_image,
+                cover_image_bytes=cover_bytes,
+                metadata={
+                    "language": language,
+                    "description": ep.get("description") or cfg.get("description"),
+                    "keywords": cfg.get("keywords"),
+                },
+                epub_writer=cfg.get("epub_writer"),
+            )
+            _checkpoint(ctx, "export:epub", {"path": str(out_path)})
+        # Optional: emit companion Markdown using Jinja2 template
+        if emit_md and not _exported(ctx, "md"):
+            md_path = out_path.with_suffix(".md")
+            try:
+                md_text = render_markdown(
+                    md_template,
+                    {
+                        "title": doc.title,
+                        "author": doc.author,
+                        "summary": doc.summary,
+                        "topics": [ch.title for ch in doc.chapters],
+                        "takeaways": res.get("takeaways"),
+                        "chapters": [ch.as_dict() for ch in doc.chapters],
+                    },
+                )
+            except Exception:
+                # Fallback: minimal Markdown without Jinja2 dependency
+                lines = []
+                if doc.title:
+                    lines += [f"# {doc.title}", ""]
+                if doc.author:
+                    lines += [f"_by {doc.author}_", ""]
+                if doc.summary:
+                    lines += ["## Summary", "", str(doc.summary), ""]
+                topics = [ch.title for ch in doc.chapters]
+                if topics:
+                    lines += ["## Topics", ""]
+                    lines += ["- " + t for t in topics]
+                    lines += [""]
+                takeaways = res.get("takeaways")
+                if takeaways:
+                    lines += ["## Key Takeaways", ""]
+                    lines += ["- " + k for k in takeaways]
+                    lines += [""]
+                for ch in doc.chapters:
+                    lines += [f"## {ch.title}", ""]
+                    if ch.span:
+                        lines += [f"_{ch.span}_", ""]
+                    lines += [ch.text, ""]
+                md_text = "\n".join(lines).rstrip() + "\n"
+            md_path.write_text(md_text, encoding="utf-8")
+            _checkpoint(ctx, "export:md", {"path": str(md_path)})
+        produced.append(str(out_path))
+    return produced
+
+
+def _resolve_workers(cli_value, cfg: dict) -> int:
+    """Episode worker count: ``--workers`` overrides config ``workers:``."""
+    value = cli_value if cli_value is not None else cfg.get("workers")
+    try:
+        return max(1, int(value or 1))
+    except Exception:
+        return 1
+
+
+def _use_process_pool(service_name: str, cfg: dict) -> bool:
+    """Pick processes for local Whisper (CPU/GPU bound) and threads otherwise.
+
+    Cloud backends mostly wait on the network, so threads are enough there.
+    Config ``worker_pool: process|thread`` overrides the choice.
+    """
+    kind = str(cfg.get("worker_pool") or "").lower()
+    if kind in ("process", "thread"):
+        return kind == "process"
+    return service_name == "whisper"
+
+
+def _resolve_pipeline(cli_flag: bool, cfg: dict, workers: int) -> Optional[dict]:
+    """Stage sizes for the staged executor, or None to process per episode.
+
+    Enabled by ``--pipeline`` or a ``pipeline:`` config block (``true`` or a
+    mapping overriding ``download``, ``transcribe``, ``nlp``, ``export`` and
+    ``queue_size``). The transcription stage defaults to ``workers``.
+    """
+    raw = cfg.get("pipeline")
+    if not cli_flag and not raw:
+        return None
+    sizes = {"download": 2, "transcribe": workers, "nlp": 1, "export": 2}
+    sizes["queue_size"] = 2
+    if isinstance(raw, dict):
+        for key in sizes:
+            try:
+                if raw.get(key) is not None:
+                    sizes[key] = max(1, int(raw[key]))
+            except Exception:
+                pass
+    return sizes
+
+
+def _run_staged(episodes: list[dict], opts: dict, sizes: dict, on_done) -> dict:
+    """Overlap download, transcription, NLP and export across episodes.
+
+    Each stage has its own pool and bounded queues sit in between, so the
+    next episode downloads while the current one transcribes without the
+    downloader running far ahead. Returns per-stage utilization metrics.
+    """
+    proc_pool = None
+    if _use_process_pool(opts["service_name"], opts.get("cfg") or {}):
+        proc_pool = ProcessPoolExecutor(max_workers=sizes["transcribe"])
+    stages = [
+        Stage("download", _stage_fetch, sizes["download"]),
+        Stage("transcribe", _stage_transcribe, sizes["transcribe"], proc_pool),
+        Stage("nlp", _stage_analyze, sizes["nlp"]),
+        Stage("export", _stage_export, sizes["export"]),
+    ]
+    try:
+        _, metrics = run_pipeline(
+            [_episode_ctx(ep, opts) for ep in episodes],
+            stages,
+            queue_size=sizes["queue_size"],
+            on_result=on_done,
+        )
+    except PipelineError as e:
+        _print_pipeline_metrics(e.metrics)
+        raise e.error from e
+    finally:
+        if proc_pool is not None:
+            proc_pool.shutdown(wait=True, cancel_futures=True)
+    _print_pipeline_metrics(metrics)
+    return metrics
+
+
+def _print_pipeline_metrics(metrics: dict) -> None:
+    for name, m in (metrics or {}).get("stages", {}).items():
+        print(
+            f"[pipeline] {name}: {m['items']} items, {m['workers']} workers, "
+            f"utilization {m['utilization']:.0%}, blocked {m['blocked_s']:.1f}s",
+            file=sys.stderr,
+        )
+
+
+def _collect_artifacts(episodes: list[dict], produced: list) -> list[dict]:
+    """Flatten per-episode output paths in episode order."""
+    out = []
+    for ep, paths in zip(episodes, produced):
+        for pth in paths or []:
+            out.append({"episode": ep, "output": pth})
+    return out
+
+
 def cmd_process(args) -> int:
     store = StateStore()
     job = store.get_job(args.job_id)
@@ -221,9 +835,8 @@ def cmd_process(args) -> int:
     language = cfg.get("language")
     out_dir = Path(cfg.get("output_dir", "./out"))
     out_dir.mkdir(parents=True, exist_ok=True)
-    processed = []
     bilingual = bool(cfg.get("bilingual"))
-    nlp_cfg = cfg.get("nlp") or {}
+    nlp_cfg = _check_nlp_cfg(cfg.get("nlp") or {})
     if getattr(args, "semantic", False):
         nlp_cfg = dict(nlp_cfg)
         nlp_cfg["semantic"] = True
@@ -243,279 +856,75 @@ def cmd_process(args) -> int:
             clip_minutes = int(args.clip_minutes)
     except Exception:
         pass
-    for ep in job.get("episodes", []):
-        res = _process_episode(
-            ep,
-            service_name,
-            quality,
-            language,
-            nlp_cfg=nlp_cfg,
-            clip_minutes=clip_minutes,
+    opts = {
+        "service_name": service_name,
+        "quality": quality,
+        "language": language,
+        "nlp_cfg": nlp_cfg,
+        "clip_minutes": clip_minutes,
+        "cfg": cfg,
+        "job_title": job.get("title"),
+        "out_dir": str(out_dir),
+        "outputs_cfg": outputs_cfg,
+        "emit_md": emit_md,
+        "md_template": md_template,
+        # Formats of one episode are written in parallel (default: one per CPU)
+        "export_workers": cfg.get("export_workers"),
+        "bilingual": bilingual,
+        "job_id": job["id"],
+        # Transcript cache: config ``cache: false`` or ``--no-cache`` disables
+        "cache_dir": cfg.get("cache_dir"),
+        "use_cache": cfg.get("cache", True) is not False
+        and not getattr(args, "no_cache", False),
+    }
+    # Stage checkpoints let ``--resume`` skip work finished by an earlier run;
+    # a fresh run starts from scratch.
+    if getattr(args, "resume", False):
+        opts["checkpoints"] = store.get_checkpoints(job["id"])
+    else:
+        store.clear_checkpoints(job["id"])
+    episodes = job.get("episodes", [])
+    produced: list = [None] * len(episodes)
+
+    def _episode_done(idx: int, paths: list[str]) -> None:
+        # Persist progress after every episode so a crash keeps finished work.
+        produced[idx] = paths
+        artifacts = _collect_artifacts(episodes, produced)
+        store.update_job(
+            job["id"], lambda j: j.update(artifacts=artifacts, status="processing")
         )
-        # Build document
-        title = ep.get("title") or job.get("title") or "Podcast Transcript"
-        author = cfg.get("author")
-        cover_image = cfg.get("cover_image")
-        cover_bytes = None
-        # Try to fetch episode image (e.g., itunes:image) if present and is URL
-        ep_img = ep.get("image")
-        if ep_img and isinstance(ep_img, str) and ep_img.lower().startswith("http"):
-            try:
-                import requests  # type: ignore
 
-                r = requests.get(ep_img, timeout=20)
-                r.raise_for_status()
-                cover_bytes = r.content
-            except Exception:
-                cover_bytes = None
-        chapters = [Chapter(c["title"], c["text"]) for c in res["chapters"]]
-        if bilingual and service_name == "whisper":
-            try:
-                svc_tr = services.get_service("whisper")
-                if getattr(services, "WhisperService", None) is not None and isinstance(
-                    svc_tr, services.WhisperService
-                ):
-                    svc_tr.translate = True
-                text_tr = svc_tr.transcribe(ensure_local_audio(ep["source"]))
-                chapters = [
-                    Chapter("Original", "\n\n".join(c.text for c in chapters)),
-                    Chapter("Translated", text_tr),
-                ]
-            except Exception:
-                pass
-        # Append attribution chapter (visible in EPUB/MD and part of composed text)
-        attribution = (
-            "Generated with Podcast-Transcription-CLI, developed by Johan Caripson."
+    workers = _resolve_workers(getattr(args, "workers", None), cfg)
+    pipeline_cfg = _resolve_pipeline(getattr(args, "pipeline", False), cfg, workers)
+    metrics = None
+    if pipeline_cfg and episodes:
+        metrics = _run_staged(episodes, opts, pipeline_cfg, _episode_done)
+    elif workers <= 1 or len(episodes) <= 1:
+        for idx, ep in enumerate(episodes):
+            _episode_done(idx, _run_episode(ep, opts))
+    else:
+        pool_cls = (
+            ProcessPoolExecutor
+            if _use_process_pool(service_name, cfg)
+            else ThreadPoolExecutor
         )
+        pool = pool_cls(max_workers=min(workers, len(episodes)))
         try:
-            chapters.append(Chapter("Attribution", attribution))
-        except Exception:
-            pass
-        doc = Document(
-            title=title, author=author, chapters=chapters, summary=res.get("summary")
-        )
-        base = _sanitize_filename(Path(ep.get("slug") or title).stem)
-        # Multi-output support via config.outputs
-        if outputs_cfg:
-            produced_paths = []
-            # Compose a plain body text from chapters for transcript-style exports
-            composed_all = []
-            for ch in doc.chapters:
-                composed_all.append(ch.title)
-                composed_all.append("")
-                composed_all.append(ch.text)
-                composed_all.append("")
-            body_all = "\n".join(composed_all).strip()
-            for out in outputs_cfg:
-                try:
-                    fmt = str(out.get("fmt") or out.get("format") or "").lower()
-                except Exception:
-                    fmt = ""
-                if not fmt:
-                    continue
-                out_path = out_dir / f"{base}.{fmt}"
-                title_ov = out.get("title") if isinstance(out, dict) else None
-                author_ov = out.get("author") if isinstance(out, dict) else None
-                # Optional CSS/template
-                css_file = out.get("epub_css_file") or out.get("css_file")
-                css_text = out.get("epub_css_text") or out.get("css_text")
-                template = out.get("template") or out.get("markdown_template")
-                metadata = {
-                    "language": language,
-                    "description": ep.get("description") or cfg.get("description"),
-                    "keywords": cfg.get("keywords"),
-                }
-                try:
-                    if fmt == "epub":
-                        export_transcript(
-                            text=body_all,
-                            out_path=str(out_path),
-                            fmt="epub",
-                            title=title_ov or doc.title,
-                            author=author_ov or doc.author,
-                            cover_image=cover_image,
-                            cover_image_bytes=cover_bytes,
-                            epub_css_file=css_file,
-                            epub_css_text=css_text,
-                            metadata=metadata,
-                            segments=res.get("segments"),
-                        )
-                        produced_paths.append(str(out_path))
-                    elif fmt == "md":
-                        md_path = out_path
-                        md_cover_flag = bool(out.get("md_include_cover"))
-                        cover_rel = None
-                        if md_cover_flag and (cover_bytes or cover_image):
-                            try:
-                                img_name = f"{base}-cover.jpg"
-                                img_path = out_dir / img_name
-                                if cover_bytes:
-                                    img_path.write_bytes(cover_bytes)
-                                elif cover_image:
-                                    cp = Path(cover_image)
-                                    if cp.exists():
-                                        img_path.write_bytes(cp.read_bytes())
-                                if img_path.exists():
-                                    cover_rel = img_name
-                            except Exception:
-                                cover_rel = None
-                        try:
-                            tmpl = template or md_template
-                            md_text = render_markdown(
-                                tmpl,
-                                {
-                                    "title": title_ov or doc.title,
-                                    "author": author_ov or doc.author,
-                                    "summary": doc.summary,
-                                    "topics": [ch.title for ch in doc.chapters],
-                                    "takeaways": res.get("takeaways"),
-                                    "chapters": [
-                                        {"title": ch.title, "text": ch.text}
-                                        for ch in doc.chapters
-                                    ],
-                                    "cover_image": cover_rel,
-                                },
-                            )
-                        except Exception:
-                            lines = []
-                            if cover_rel:
-                                lines += [f"![Cover]({cover_rel})", ""]
-                            if title_ov or doc.title:
-                                lines += [f"# {title_ov or doc.title}", ""]
-                            if author_ov or doc.author:
-                                lines += [f"_by {author_ov or doc.author}_", ""]
-                            if doc.summary:
-                                lines += ["## Summary", "", str(doc.summary), ""]
-                            topics = [ch.title for ch in doc.chapters]
-                            if topics:
-                                lines += ["## Topics", ""]
-                                lines += ["- " + t for t in topics]
-                                lines += [""]
-                            takeaways = res.get("takeaways")
-                            if takeaways:
-                                lines += ["## Key Takeaways", ""]
-                                lines += ["- " + k for k in takeaways]
-                                lines += [""]
-                            for ch in doc.chapters:
-                                lines += [f"## {ch.title}", "", ch.text, ""]
-                            md_text = "\n".join(lines).rstrip() + "\n"
-                        md_path.write_text(md_text, encoding="utf-8")
-                        produced_paths.append(str(md_path))
-                    else:
-                        body = body_all
-                        kwargs = {}
-                        if isinstance(out, dict):
-                            allowed_keys = {
-                                "pdf_font",
-                                "pdf_font_size",
-                                "pdf_margin",
-                                "pdf_cover_fullpage",
-                                "pdf_first_page_cover_only",
-                                "pdf_page_size",
-                                "pdf_orientation",
-                                "pdf_font_file",
-                                "epub_css_file",
-                                "epub_css_text",
-                                "auto_toc",
-                                "docx_cover_first",
-                                "docx_cover_width_inches",
-                            }
-                            for k, v in out.items():
-                                if k in allowed_keys:
-                                    kwargs[k] = v
-                        if fmt == "pdf":
-                            kwargs.setdefault(
-                                "pdf_footer",
-                                "Generated with Podcast-Transcription-CLI by Johan Caripson",
-                            )
-                        if fmt == "docx":
-                            kwargs.setdefault(
-                                "docx_footer_text",
-                                "Generated with Podcast-Transcription-CLI by Johan Caripson",
-                            )
-                        export_transcript(
-                            text=body,
-                            out_path=str(out_path),
-                            fmt=fmt,
-                            title=title_ov or doc.title,
-                            author=author_ov or doc.author,
-                            cover_image=cover_image,
-                            cover_image_bytes=cover_bytes,
-                            segments=res.get("segments"),
-                            metadata=metadata,
-                            **kwargs,
-                        )
-                        produced_paths.append(str(out_path))
-                except Exception as e:  # pragma: no cover - best-effort per-format
-                    try:
-                        print(f"Output {fmt} failed: {e}", file=sys.stderr)
-                    except Exception:
-                        pass
-            # Record artifacts
-            for pth in produced_paths:
-                processed.append({"episode": ep, "output": pth})
-        else:
-            # Default single EPUB path + optional Markdown
-            out_path = out_dir / f"{base}.epub"
-            export_book(
-                chapters=[{"title": ch.title, "text": ch.text} for ch in doc.chapters],
-                out_path=str(out_path),
-                fmt="epub",
-                title=doc.title,
-                author=doc.author,
-                cover_image=cover_image,
-                cover_image_bytes=cover_bytes,
-                metadata={
-                    "language": language,
-                    "description": ep.get("description") or cfg.get("description"),
-                    "keywords": cfg.get("keywords"),
-                },
-            )
-            # Optional: emit companion Markdown using Jinja2 template
-            if emit_md:
-                md_path = out_path.with_suffix(".md")
-                try:
-                    md_text = render_markdown(
-                        md_template,
-                        {
-                            "title": doc.title,
-                            "author": doc.author,
-                            "summary": doc.summary,
-                            "topics": [ch.title for ch in doc.chapters],
-                            "takeaways": res.get("takeaways"),
-                            "chapters": [
-                                {"title": ch.title, "text": ch.text}
-                                for ch in doc.chapters
-                            ],
-                        },
-                    )
-                except Exception:
-                    # Fallback: minimal Markdown without Jinja2 dependency
-                    lines = []
-                    if doc.title:
-                        lines += [f"# {doc.title}", ""]
-                    if doc.author:
-                        lines += [f"_by {doc.author}_", ""]
-                    if doc.summary:
-                        lines += ["## Summary", "", str(doc.summary), ""]
-                    topics = [ch.title for ch in doc.chapters]
-                    if topics:
-                        lines += ["## Topics", ""]
-                        lines += ["- " + t for t in topics]
-                        lines += [""]
-                    takeaways = res.get("takeaways")
-                    if takeaways:
-                        lines += ["## Key Takeaways", ""]
-                        lines += ["- " + k for k in takeaways]
-                        lines += [""]
-                    for ch in doc.chapters:
-                        lines += [f"## {ch.title}", "", ch.text, ""]
-                    md_text = "\n".join(lines).rstrip() + "\n"
-                md_path.write_text(md_text, encoding="utf-8")
-            processed.append({"episode": ep, "output": str(out_path)})
-    job["artifacts"] = processed
-    job["status"] = "processed"
-    store.save_job(job)
+            futures = {
+                pool.submit(_run_episode, ep, opts): idx
+                for idx, ep in enumerate(episodes)
+            }
+            for fut in as_completed(futures):
+                _episode_done(futures[fut], fut.result())
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+    processed = _collect_artifacts(episodes, produced)
+    final = {"artifacts": processed, "status": "processed"}
+    if metrics is not None:
+        final["pipeline_metrics"] = metrics
+    job = store.update_job(job["id"], lambda j: j.update(final))
     print(str([p["output"] for p in processed]))
     return 0
 
@@ -633,6 +1042,27 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Limit transcription to the first N minutes (pre-clips audio)",
     )
+    proc.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process up to N episodes concurrently (overrides config 'workers')",
+    )
+    proc.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap download, transcription, NLP and export across episodes",
+    )
+    proc.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Transcribe again even when a cached transcript exists",
+    )
+    proc.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages an interrupted run already finished (uses checkpoints)",
+    )
     proc.set_defaults(func=cmd_process)
 
     snd = sub.add_parser("send", help="Email EPUB to Kindle for a job")
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
+import shutil
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
 
 # Avoid side effects at import time. Compute preferred dirs lazily and
 # create them only when we actually need to write.
 
 APP_DIR_NAME = "podcast_transcriber"
 ENV_STATE_DIR = "PODCAST_STATE_DIR"
+ENV_STATE_JOURNAL = "PODCAST_STATE_JOURNAL"
+
+# Journal mode: fsync after this many appended records, and fold the journal
+# into state.json once it holds this many records.
+JOURNAL_FSYNC_EVERY = 32
+JOURNAL_COMPACT_AFTER = 1000
+# StateStore.shared(): one store per (process, state dir, mode)
+_shared: dict[tuple, StateStore] = {}
+_shared_lock = threading.Lock()
+
+
+class StateConflictError(RuntimeError):
+    """Raised when saving a job that another process updated in the meantime."""
 
 
 def _preferred_state_dir() -> Path:
@@ -27,12 +50,99 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _empty_state() -> dict:
+    return {"jobs": [], "episodes": [], "seen": {}}
+
+
+def _encode_job(job: dict) -> dict:
+    """Per-field JSON of a job (episodes one by one), to diff against later."""
+    enc: dict[str, Any] = {}
+    for k, v in job.items():
+        if k == "episodes" and isinstance(v, list):
+            enc[k] = tuple(json.dumps(ep, sort_keys=True, default=str) for ep in v)
+        else:
+            enc[k] = json.dumps(v, sort_keys=True, default=str)
+    return enc
+
+
+def _file_sig(path: Path) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 class StateStore:
-    def __init__(self):
+    """Persistent orchestrator state (jobs, episodes, seen keys).
+
+    By default every mutation rewrites ``state.json``. With ``journal=True``
+    (or ``PODCAST_STATE_JOURNAL=1``) mutations are appended as small JSONL
+    records to ``state.journal.jsonl`` instead (job updates as ``set`` records
+    holding only the changed fields and episodes), with fsync batched every
+    ``fsync_every`` records. The journal is replayed over the snapshot on open
+    and folded back into ``state.json`` once it reaches ``compact_after``
+    records, either on open or while appending.
+
+    Several processes may share one state directory. Every mutation takes an
+    advisory ``fcntl`` lock on ``state.lock``, re-reads whatever other
+    processes wrote since the last access and only then applies its change,
+    so updates merge instead of the last writer winning. Jobs carry a
+    ``version`` counter: ``save_job`` raises :class:`StateConflictError` when
+    the stored job moved on since the caller read it, while ``update_job``
+    performs a read-modify-write inside a single critical section.
+    """
+
+    def __init__(
+        self,
+        journal: bool | None = None,
+        fsync_every: int = JOURNAL_FSYNC_EVERY,
+        compact_after: int = JOURNAL_COMPACT_AFTER,
+    ):
         # Start with preferred location, but don't create directories yet.
         self._state_dir = _preferred_state_dir()
         self._state_path = self._state_dir / "state.json"
-        self._load()
+        self._journal = _env_flag(ENV_STATE_JOURNAL) if journal is None else journal
+        self._fsync_every = max(1, int(fsync_every))
+        self._compact_after = max(1, int(compact_after))
+        self._journal_fh = None
+        self._journal_records = 0
+        self._unsynced = 0
+        self._lock_fh = None
+        self._lock_depth = 0
+        # Journal mode: per-field encoding of each job as last persisted
+        self._persisted: dict[str, dict] = {}
+        # Threads sharing this store queue here; the owner may re-enter
+        self._thread_lock = threading.RLock()
+        # Only lock an existing state dir; a read-only store must not create it.
+        with self._lock(create=False):
+            self._load()
+            if self._journal and self._journal_records >= self._compact_after:
+                self.compact()
+
+    @classmethod
+    def shared(cls) -> StateStore:
+        """This process's store for the current state directory, opened once.
+
+        For code that touches the state often from worker threads or
+        processes (e.g. per-stage checkpoints): opening a new store reads the
+        whole state each time, while a shared one only picks up what changed.
+        Threads may share it; a forked child opens its own.
+        """
+        key = (os.getpid(), str(_preferred_state_dir()), _env_flag(ENV_STATE_JOURNAL))
+        with _shared_lock:
+            store = _shared.get(key)
+            if store is None:
+                store = _shared[key] = cls()
+            return store
+
+    @property
+    def _journal_path(self) -> Path:
+        return self._state_dir / "state.journal.jsonl"
 
     def _ensure_dir(self) -> None:
         try:
@@ -51,21 +161,239 @@ class StateStore:
                 self._state_dir = Path.cwd()
                 self._state_path = self._state_dir / "state.json"
 
+    @contextmanager
+    def _lock(self, create: bool = True):
+        """Hold the state lock: per thread, then across processes (re-entrant)."""
+        with self._thread_lock:
+            with self._flock(create):
+                yield
+
+    @contextmanager
+    def _flock(self, create: bool):
+        # Only the thread holding ``_thread_lock`` gets here, so the depth
+        # counter is never shared between threads.
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        if fcntl is None or (not create and not self._state_dir.exists()):
+            yield
+            return
+        if create:
+            self._ensure_dir()
+        try:
+            fh = open(self._state_dir / "state.lock", "a+")
+        except OSError:
+            # Read-only state dir: nothing can be written, so nothing to guard.
+            yield
+            return
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            self._lock_fh, self._lock_depth = fh, 1
+            try:
+                yield
+            finally:
+                self._lock_fh, self._lock_depth = None, 0
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            fh.close()
+
+    @contextmanager
+    def _reading(self):
+        """Refresh under the lock, so reads see what other stores wrote since.
+
+        Cheap when nothing changed: the snapshot and journal are only
+        ``stat``-ed.
+        """
+        with self._lock(create=False):
+            self._refresh()
+            yield
+
     def _load(self):
         p = self._state_path
+        self._snapshot_sig = _file_sig(p)
         if p.exists():
             try:
                 self.state = json.loads(p.read_text(encoding="utf-8"))
             except Exception:
-                self.state = {"jobs": [], "episodes": [], "seen": {}}
+                self.state = _empty_state()
         else:
-            self.state = {"jobs": [], "episodes": [], "seen": {}}
+            self.state = _empty_state()
+        self._journal_records = 0
+        self._journal_pos = 0
+        self._journal_ino = None
+        self._persisted = {}
+        if self._journal:
+            self._replay_journal()
+
+    def _refresh(self) -> None:
+        """Pick up changes other processes persisted since our last access."""
+        if _file_sig(self._state_path) != self._snapshot_sig:
+            self._load()
+            return
+        if self._journal:
+            sig = _file_sig(self._journal_path)
+            if (sig[0] if sig else None) != self._journal_ino or (
+                sig and sig[2] < self._journal_pos
+            ):
+                self._load()
+            elif sig and sig[2] > self._journal_pos:
+                self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        jp = self._journal_path
+        sig = _file_sig(jp)
+        if sig is None:
+            return
+        self._journal_ino = sig[0]
+        with open(jp, "rb") as fh:
+            fh.seek(self._journal_pos)
+            data = fh.read()
+        good = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # torn tail from an interrupted append
+            try:
+                record = json.loads(line)
+            except Exception:
+                break
+            self._apply(record)
+            self._journal_records += 1
+            good += len(line)
+        self._journal_pos += good
+        if good < len(data) and self._lock_fh is not None:
+            # Any writer appends under the lock we hold, so a damaged tail is
+            # left over from a crash: drop it so new records start cleanly.
+            try:
+                with open(jp, "r+b") as fh:
+                    fh.truncate(self._journal_pos)
+            except Exception:
+                pass
+
+    def _apply(self, record: dict) -> None:
+        op = record.get("op")
+        if op == "job":
+            job = record.get("job") or {}
+            self._persisted.pop(job.get("id"), None)
+            jobs = self.state.setdefault("jobs", [])
+            for i, j in enumerate(jobs):
+                if j.get("id") == job.get("id"):
+                    jobs[i] = job
+                    break
+            else:
+                jobs.append(job)
+        elif op == "set":
+            self._persisted.pop(record.get("id"), None)
+            jobs = self.state.setdefault("jobs", [])
+            for i, old in enumerate(jobs):
+                if old.get("id") != record.get("id"):
+                    continue
+                # Build a new dict: handles callers got from get_job keep their
+                # old contents and version, so save_job still detects conflicts
+                job = {**old, **(record.get("fields") or {})}
+                for key in record.get("unset") or ():
+                    job.pop(key, None)
+                changed = record.get("episodes") or {}
+                if changed and isinstance(job.get("episodes"), list):
+                    episodes = list(job["episodes"])
+                    for idx, ep in changed.items():
+                        if int(idx) < len(episodes):
+                            episodes[int(idx)] = ep
+                    job["episodes"] = episodes
+                jobs[i] = job
+                break
+        elif op == "seen":
+            arr = self.state.setdefault("seen", {}).setdefault(record.get("feed"), [])
+            if record.get("key") not in arr:
+                arr.append(record.get("key"))
+        elif op == "checkpoint":
+            eps = self.state.setdefault("checkpoints", {}).setdefault(record["job"], {})
+            eps.setdefault(record["episode"], {})[record["stage"]] = record["data"]
+        elif op == "checkpoints_clear":
+            self.state.setdefault("checkpoints", {}).pop(record["job"], None)
 
     def _save(self):
         self._ensure_dir()
-        self._state_path.write_text(
-            json.dumps(self.state, ensure_ascii=False, indent=2), encoding="utf-8"
+        tmp = self._state_path.with_name(f"{self._state_path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(self.state, ensure_ascii=False, indent=2))
+            # Compaction drops the journal right after this, so make it durable.
+            if self._journal:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, self._state_path)
+        self._snapshot_sig = _file_sig(self._state_path)
+
+    def _record(self, record: dict) -> None:
+        """Persist one mutation: journal append or full snapshot rewrite.
+
+        Callers hold the state lock and have already refreshed and applied
+        ``record`` to ``self.state``.
+        """
+        if not self._journal:
+            self._save()
+            return
+        self._ensure_dir()
+        if self._journal_fh is not None and self._journal_ino != _file_ino(
+            self._journal_fh
+        ):
+            self.close()  # another process compacted the journal away
+        if self._journal_fh is None:
+            self._journal_fh = open(self._journal_path, "ab")
+            self._journal_ino = _file_ino(self._journal_fh)
+        self._journal_fh.write(
+            (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
         )
+        self._journal_fh.flush()
+        self._journal_pos = self._journal_fh.tell()
+        self._journal_records += 1
+        self._unsynced += 1
+        if self._unsynced >= self._fsync_every:
+            self.sync()
+        if self._journal_records >= self._compact_after:
+            self.compact()
+
+    def sync(self) -> None:
+        """Force outstanding journal records to stable storage."""
+        if self._journal_fh is not None and self._unsynced:
+            try:
+                os.fsync(self._journal_fh.fileno())
+            except Exception:
+                pass
+        self._unsynced = 0
+
+    def compact(self) -> None:
+        """Fold the journal into ``state.json`` and start an empty journal.
+
+        The snapshot is written atomically before the journal is dropped, so a
+        crash in between only replays idempotent records over the new snapshot.
+        """
+        if not self._journal:
+            return
+        with self._lock():
+            self._refresh()
+            self.sync()
+            self._save()
+            self.close()
+            try:
+                self._journal_path.unlink(missing_ok=True)
+            except Exception:
+                pass
+            self._journal_records = 0
+            self._journal_pos = 0
+            self._journal_ino = None
+
+    def close(self) -> None:
+        if self._journal_fh is not None:
+            self.sync()
+            try:
+                self._journal_fh.close()
+            except Exception:
+                pass
+            self._journal_fh = None
 
     def create_job(self, config: dict[str, Any], feed_name: str | None = None) -> dict:
         job_id = f"job-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
@@ -77,9 +405,19 @@ class StateStore:
             "status": "new",
             "episodes": episodes,
             "config": config,
+            "version": 1,
         }
-        self.state.setdefault("jobs", []).append(job)
-        self._save()
+        with self._lock():
+            self._refresh()
+            taken = {j.get("id") for j in self.state.get("jobs", [])}
+            n = 2
+            while job["id"] in taken:
+                job["id"] = f"{job_id}-{n}"
+                n += 1
+            self.state.setdefault("jobs", []).append(job)
+            if self._journal:
+                self._persisted[job["id"]] = _encode_job(job)
+            self._record({"op": "job", "job": job})
         return job
 
     def create_job_with_episodes(
@@ -90,27 +428,173 @@ class StateStore:
         self.save_job(job)
         return job
 
-    def get_job(self, job_id: str) -> dict | None:
+    def _find_job(self, job_id: str | None) -> dict | None:
         for j in self.state.get("jobs", []):
             if j.get("id") == job_id:
                 return j
         return None
 
+    def get_job(self, job_id: str) -> dict | None:
+        with self._reading():
+            job = self._find_job(job_id)
+            if job is not None and self._journal and job_id not in self._persisted:
+                # Callers edit the returned dict in place; diff against this copy
+                self._persisted[job_id] = _encode_job(job)
+        return job
+
+    def _job_record(self, job: dict, base: dict | None) -> dict:
+        """Journal record for ``job``: only what changed since ``base``.
+
+        Without a baseline (the job was never read through :meth:`get_job`
+        since it was loaded) the whole job is written.
+        """
+        enc = _encode_job(job)
+        self._persisted[job["id"]] = enc
+        if base is None:
+            return {"op": "job", "job": job}
+        record: dict[str, Any] = {"op": "set", "id": job["id"], "fields": {}}
+        for key, value in enc.items():
+            old = base.get(key)
+            if old == value:
+                continue
+            if (
+                key == "episodes"
+                and isinstance(old, tuple)
+                and isinstance(value, tuple)
+                and len(old) == len(value)
+            ):
+                record["episodes"] = {
+                    str(i): job[key][i]
+                    for i, (a, b) in enumerate(zip(old, value))
+                    if a != b
+                }
+            else:
+                record["fields"][key] = job[key]
+        unset = [key for key in base if key not in enc]
+        if unset:
+            record["unset"] = unset
+        return record
+
     def save_job(self, job: dict) -> None:
-        jobs = self.state.get("jobs", [])
-        for i, j in enumerate(jobs):
-            if j.get("id") == job.get("id"):
-                jobs[i] = job
-                break
-        else:
-            jobs.append(job)
-        self._save()
+        """Store ``job``, bumping its ``version``.
+
+        Raises StateConflictError if the stored copy has a different version
+        than ``job``, i.e. another writer saved it after we read it.
+        """
+        with self._lock():
+            self._refresh()
+            current = self._find_job(job.get("id"))
+            version = int(job.get("version") or 0)
+            if current is not None and int(current.get("version") or 0) != version:
+                raise StateConflictError(
+                    f"Job {job.get('id')} was modified concurrently "
+                    f"(stored version {current.get('version')}, ours {version})"
+                )
+            job["version"] = version + 1
+            base = self._persisted.get(job["id"]) if current is not None else None
+            self._apply({"op": "job", "job": job})
+            self._record(
+                self._job_record(job, base)
+                if self._journal
+                else {"op": "job", "job": job}
+            )
+
+    def update_job(self, job_id: str, mutate: Callable[[dict], Any]) -> dict:
+        """Atomically apply ``mutate`` to the latest stored copy of a job.
+
+        ``mutate`` runs inside the state lock, so keep it short. Returns the
+        updated job.
+        """
+        with self._lock():
+            self._refresh()
+            job = self._find_job(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            base = self._persisted.get(job_id)
+            mutate(job)
+            job["version"] = int(job.get("version") or 0) + 1
+            self._record(
+                self._job_record(job, base)
+                if self._journal
+                else {"op": "job", "job": job}
+            )
+        return job
+
+    # Per-episode stage checkpoints (resume support for long process runs)
+    def _checkpoint_dir(self, job_id: str) -> Path:
+        return self._state_dir / "checkpoints" / job_id
+
+    def save_checkpoint(
+        self,
+        job_id: str,
+        episode_key: str,
+        stage: str,
+        data: dict | None = None,
+        payload: Any = None,
+    ) -> None:
+        """Record that ``stage`` finished for one episode of a job.
+
+        ``data`` is stored inline and should stay small; a bulky ``payload``
+        (e.g. transcript text and segments) goes to a JSON file under
+        ``checkpoints/<job_id>/`` next to the state and is referenced by name.
+        """
+        data = dict(data or {}, at=_now_iso())
+        with self._lock():
+            if payload is not None:
+                digest = hashlib.sha1(episode_key.encode("utf-8")).hexdigest()[:16]
+                safe_stage = re.sub(r"[^A-Za-z0-9_.-]+", "_", stage)
+                blob = self._checkpoint_dir(job_id) / f"{digest}-{safe_stage}.json"
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_name(f"{blob.name}.{os.getpid()}.tmp")
+                tmp.write_text(
+                    json.dumps(payload, ensure_ascii=False, default=str), "utf-8"
+                )
+                os.replace(tmp, blob)
+                data["blob"] = blob.name
+            record = {
+                "op": "checkpoint",
+                "job": job_id,
+                "episode": episode_key,
+                "stage": stage,
+                "data": data,
+            }
+            self._refresh()
+            self._apply(record)
+            self._record(record)
+
+    def get_checkpoints(self, job_id: str) -> dict[str, dict[str, dict]]:
+        """Return ``{episode_key: {stage: data}}`` for a job."""
+        with self._reading():
+            return self.state.get("checkpoints", {}).get(job_id, {})
+
+    def load_checkpoint_payload(self, job_id: str, data: dict | None) -> Any:
+        """Read the payload saved with a checkpoint, or None if unavailable."""
+        name = (data or {}).get("blob")
+        if not name:
+            return None
+        try:
+            path = self._checkpoint_dir(job_id) / name
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def clear_checkpoints(self, job_id: str) -> None:
+        with self._lock():
+            self._refresh()
+            if job_id not in self.state.get("checkpoints", {}):
+                return
+            record = {"op": "checkpoints_clear", "job": job_id}
+            self._apply(record)
+            self._record(record)
+            shutil.rmtree(self._checkpoint_dir(job_id), ignore_errors=True)
 
     def list_recent(self, days: int = 7, feed_name: str | None = None) -> list[dict]:
         # naive: collect episodes from recent jobs
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         out = []
-        for j in self.state.get("jobs", []):
+        with self._reading():
+            jobs = list(self.state.get("jobs", []))
+        for j in jobs:
             try:
                 dt = datetime.fromisoformat(j.get("created_at", "").rstrip("Z"))
                 if dt.tzinfo is None:
@@ -129,16 +613,24 @@ class StateStore:
     def has_seen(self, feed: str, key: str | None) -> bool:
         if not key:
             return False
-        seen = self.state.setdefault("seen", {})
-        keys = set(seen.setdefault(feed, []))
-        return key in keys
+        with self._reading():
+            return key in self.state.get("seen", {}).get(feed, [])
 
     def mark_seen(self, feed: str, key: str | None) -> None:
         if not key:
             return
-        seen = self.state.setdefault("seen", {})
-        arr = list(seen.setdefault(feed, []))
-        if key not in arr:
-            arr.append(key)
-            seen[feed] = arr
-            self._save()
+        with self._lock():
+            self._refresh()
+            seen = self.state.setdefault("seen", {})
+            arr = list(seen.setdefault(feed, []))
+            if key not in arr:
+                arr.append(key)
+                seen[feed] = arr
+                self._record({"op": "seen", "feed": feed, "key": key})
+
+
+def _file_ino(fh) -> int | None:
+    try:
+        return os.fstat(fh.fileno()).st_ino
+    except Exception:
+        return None
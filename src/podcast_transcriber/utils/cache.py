@@ -1,8 +1,27 @@
 import hashlib
 import json
 import os
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from . import cache_codec
+from .cache_redis import RedisCache, is_backend_url
+from .singleflight import SingleFlight
+from .cache_store import (
+    ENV_MAX_BYTES,
+    ENV_POLICY,
+    ENV_TTL,
+    CacheBackend,
+    DiskCache,
+    MemoryCache,
+    parse_size,
+)
+
+# In-process LRU tier in front of the disk cache, sized in bytes (e.g. 256M).
+ENV_MEMORY_BYTES = "PODCAST_TRANSCRIBER_MEMORY_CACHE"
+# Default backend when no cache dir is given, e.g. redis://cache-host:6379/0
+ENV_CACHE_URL = "PODCAST_TRANSCRIBER_CACHE_URL"
 
 
 def _default_cache_dir() -> Path:
@@ -14,43 +33,349 @@ def _default_cache_dir() -> Path:
     return p
 
 
+# Content hashing. Keys depend on the audio bytes rather than on the path or
+# mtime, so a re-downloaded, renamed or moved file still hits the cache. By
+# default only SAMPLE_BLOCKS evenly spaced blocks (plus the size) are hashed;
+# full hashing reads the whole file. A sidecar index maps
+# (path, size, mtime, inode) to known hashes so unchanged files are not re-read.
+ENV_FULL_HASH = "PODCAST_TRANSCRIBER_FULL_HASH"
+SAMPLE_BLOCK_SIZE = 256 * 1024
+SAMPLE_BLOCKS = 16
+INDEX_NAME = "content-index.json"
+INDEX_MAX_ENTRIES = 5000
+_CHUNK = 1024 * 1024
+
+_index_memo: dict[str, tuple[Any, dict]] = {}
+_stores: dict[tuple, CacheBackend] = {}
+_memory: Optional[MemoryCache] = None
+_flight = SingleFlight()
+
+
+def _hash_file(path: str, full: bool) -> str:
+    size = os.path.getsize(path)
+    h = hashlib.blake2b(digest_size=32)
+    h.update(str(size).encode())
+    with open(path, "rb") as fh:
+        if full or size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCKS:
+            for chunk in iter(lambda: fh.read(_CHUNK), b""):
+                h.update(chunk)
+            return "full:" + h.hexdigest()
+        step = (size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCKS - 1)
+        for i in range(SAMPLE_BLOCKS):
+            fh.seek(i * step)
+            h.update(fh.read(SAMPLE_BLOCK_SIZE))
+    return "sampled:" + h.hexdigest()
+
+
+def _index_path(cache_dir: Optional[str]) -> Path:
+    # The content index is per machine, even when entries live in Redis
+    local = cache_dir and not is_backend_url(cache_dir)
+    dirp = Path(cache_dir) if local else _default_cache_dir()
+    return dirp / INDEX_NAME
+
+
+def _load_index(path: Path) -> dict:
+    try:
+        st = path.stat()
+        sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return {}
+    memo = _index_memo.get(str(path))
+    if memo and memo[0] == sig:
+        return memo[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        index = data if isinstance(data, dict) else {}
+    except Exception:
+        index = {}
+    _index_memo[str(path)] = (sig, index)
+    return index
+
+
+def _save_index(path: Path, index: dict) -> None:
+    if len(index) > INDEX_MAX_ENTRIES:
+        index = {k: v for k, v in index.items() if os.path.exists(k)}
+        while len(index) > INDEX_MAX_ENTRIES:  # oldest entries first
+            index.pop(next(iter(index)))
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, path)
+        st = path.stat()
+        _index_memo[str(path)] = ((st.st_ino, st.st_mtime_ns, st.st_size), index)
+    except Exception:
+        pass
+
+
+def content_hash(
+    local_path: str,
+    full: Optional[bool] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """Return a content hash of ``local_path`` (sampled unless ``full``).
+
+    ``full`` defaults to the ``PODCAST_TRANSCRIBER_FULL_HASH`` environment
+    flag. Results are remembered in the sidecar index next to the cache.
+    """
+    if full is None:
+        full = os.environ.get(ENV_FULL_HASH, "").lower() in ("1", "true", "yes")
+    kind = "full" if full else "sampled"
+    real = os.path.realpath(local_path)
+    st = os.stat(real)
+    sig = [st.st_size, st.st_mtime_ns, st.st_ino]
+    index_path = _index_path(cache_dir)
+    index = _load_index(index_path)
+    entry = index.get(real)
+    if entry and entry.get("sig") == sig and entry.get(kind):
+        return entry[kind]
+    digest = _hash_file(real, full)
+    hashes = dict(entry or {}) if entry and entry.get("sig") == sig else {}
+    hashes[kind] = digest
+    if not full and digest.startswith("full:"):
+        hashes["full"] = digest  # small file: the sample was the whole file
+    hashes["sig"] = sig
+    index = dict(index)
+    index.pop(real, None)
+    index[real] = hashes
+    _save_index(index_path, index)
+    return digest
+
+
 def compute_key(
     source: str,
     service: str,
     opts: tuple[str, ...],
     local_path: Optional[str] = None,
+    full_hash: Optional[bool] = None,
+    cache_dir: Optional[str] = None,
 ) -> str:
+    """Cache key for a transcript of ``local_path`` (or ``source``).
+
+    When the audio is available locally the key is built from its content
+    hash, so the same audio hits the cache regardless of where it came from;
+    otherwise the source string stands in for it.
+    """
     h = hashlib.sha256()
     h.update(service.encode())
     h.update(b"\0")
-    h.update(source.encode())
     if local_path and os.path.exists(local_path):
-        st = os.stat(local_path)
-        h.update(f"{st.st_size}:{int(st.st_mtime)}".encode())
+        h.update(content_hash(local_path, full=full_hash, cache_dir=cache_dir).encode())
+    else:
+        h.update(source.encode())
     for o in opts:
         h.update(b"\0")
         h.update(o.encode())
     return h.hexdigest()
 
 
+def open_store(cache_dir: Optional[str] = None) -> CacheBackend:
+    """The cache backend for ``cache_dir``.
+
+    A ``redis://`` (``rediss://``, ``unix://``) URL selects the shared Redis
+    backend; anything else is a directory for the size-bounded filesystem
+    store. Without ``cache_dir``, ``PODCAST_TRANSCRIBER_CACHE_URL`` or the
+    default cache directory is used.
+    """
+    target = cache_dir or os.environ.get(ENV_CACHE_URL)
+    env = tuple(os.environ.get(n) for n in (ENV_MAX_BYTES, ENV_TTL, ENV_POLICY))
+    if is_backend_url(target):
+        memo_key = (str(target),) + env
+        store = _stores.get(memo_key)
+        if store is None:
+            store = _stores[memo_key] = RedisCache(str(target))
+        return store
+    dirp = Path(target) if target else _default_cache_dir()
+    memo_key = (str(dirp.resolve()),) + env
+    store = _stores.get(memo_key)
+    if store is None:
+        store = _stores[memo_key] = DiskCache(dirp)
+    return store
+
+
+def memory_tier() -> MemoryCache:
+    """The process-wide in-memory tier (disabled unless configured)."""
+    global _memory
+    if _memory is None:
+        try:
+            size = parse_size(os.environ.get(ENV_MEMORY_BYTES)) or 0
+        except ValueError:
+            size = 0
+        _memory = MemoryCache(size)
+    return _memory
+
+
+def configure_memory(max_bytes: Optional[int]) -> MemoryCache:
+    """Enable (or resize/disable with 0) the in-memory tier for this process."""
+    global _memory
+    _memory = MemoryCache(int(max_bytes or 0))
+    return _memory
+
+
 def get(cache_dir: Optional[str], key: str) -> Optional[dict]:
-    dirp = Path(cache_dir) if cache_dir else _default_cache_dir()
-    p = dirp / f"{key}.json"
-    if not p.exists():
-        return None
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        store = open_store(cache_dir)
+        mem = memory_tier()
+        mem_key = (store.location, key)
+        if mem.max_bytes:
+            payload = mem.get(mem_key)
+            if payload is not None:
+                return payload
+        payload = store.get(key)
+        if payload is not None:
+            mem.put(mem_key, payload)
+        return payload
     except Exception:
         return None
 
 
 def set(cache_dir: Optional[str], key: str, payload: dict) -> None:
-    dirp = Path(cache_dir) if cache_dir else _default_cache_dir()
-    dirp.mkdir(parents=True, exist_ok=True)
-    p = dirp / f"{key}.json"
     try:
-        p.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        store = open_store(cache_dir)
+        data = cache_codec.encode(payload)
+        store.set_encoded(key, data)
+        # Keep the immutable decoded view, not the caller's (mutable) dict
+        memory_tier().put((store.location, key), cache_codec.decode(data))
     except Exception:
         pass
+
+
+def transcription_opts(
+    language: Optional[str] = None,
+    model: Optional[str] = None,
+    translate: bool = False,
+    clip_minutes: Optional[int] = None,
+    speakers: Optional[int] = None,
+    extra: tuple[str, ...] = (),
+) -> tuple[str, ...]:
+    """Cache-key options for everything that changes a transcript."""
+    return (
+        f"language={language or ''}",
+        f"model={model or ''}",
+        f"translate={int(bool(translate))}",
+        f"clip={int(clip_minutes or 0)}",
+        f"speakers={int(speakers or 0)}",
+        *extra,
+    )
+
+
+def transcribe_cached(
+    service: Any,
+    audio_path: str,
+    *,
+    service_name: str,
+    source: Optional[str] = None,
+    language: Optional[str] = None,
+    model: Optional[str] = None,
+    translate: Optional[bool] = None,
+    clip_minutes: Optional[int] = None,
+    speakers: Optional[int] = None,
+    extra: tuple[str, ...] = (),
+    cache_dir: Optional[str] = None,
+    enabled: bool = True,
+    transcribe: Optional[Callable[[], str]] = None,
+) -> str:
+    """Transcribe ``audio_path`` with ``service``, reusing a cached transcript.
+
+    The key covers the audio, service, model, language, translate flag, clip
+    length and diarization speakers; unset model/translate/speakers are read
+    from the service instance. On a hit the cached ``segments``/``words`` are
+    restored onto ``service.last_segments``/``last_words`` so callers see the
+    same state as after a real run; from binary entries they are list-like
+    :class:`~.cache_codec.LazyRows` decoded on first access. ``transcribe`` overrides the default
+    ``service.transcribe(audio_path, language=language)`` call (e.g. to
+    transcribe a pre-clipped file). Cache failures never fail a transcription.
+    """
+    if model is None:
+        model = getattr(service, "model_name", None)
+    if translate is None:
+        translate = bool(getattr(service, "translate", False))
+    if speakers is None:
+        speakers = getattr(service, "speakers", None)
+    key = None
+    if enabled:
+        try:
+            opts = transcription_opts(
+                language, model, translate, clip_minutes, speakers, extra
+            )
+            key = compute_key(
+                str(source or audio_path),
+                service_name,
+                opts,
+                local_path=str(audio_path),
+                cache_dir=cache_dir,
+            )
+            text = _cached_text(service, cache_dir, key)
+            if text is not None:
+                return text
+        except Exception:
+            key = None
+    if key is None:
+        return _run(service, audio_path, language, transcribe)
+
+    def _fill() -> Any:
+        return _transcribe_once(
+            service, audio_path, language, transcribe, cache_dir, key
+        )
+
+    try:
+        flight_key = (open_store(cache_dir).location, key)
+    except Exception:
+        flight_key = (str(cache_dir), key)
+    # Concurrent requests for the same key in this process share one run
+    payload, shared = _flight.do(flight_key, _fill)
+    if shared:
+        _restore(service, payload)
+    return payload["text"]
+
+
+def _transcribe_once(service, audio_path, language, transcribe, cache_dir, key):
+    """Fill ``key`` under the backend's cross-process single-flight lock."""
+    guard = ExitStack()
+    try:
+        held = guard.enter_context(open_store(cache_dir).lock(key))
+    except Exception:
+        held = False
+    with guard:
+        if held:
+            # Another process or node may have filled it while we waited
+            payload = get(cache_dir, key)
+            if payload and "text" in payload:
+                _restore(service, payload)
+                return payload
+        text = _run(service, audio_path, language, transcribe)
+        payload = {
+            "text": text,
+            "segments": getattr(service, "last_segments", None),
+            "words": getattr(service, "last_words", None),
+        }
+        try:
+            set(cache_dir, key, payload)
+        except Exception:
+            pass
+    return payload
+
+
+def _run(service, audio_path, language, transcribe) -> str:
+    if transcribe is not None:
+        return transcribe()
+    return service.transcribe(audio_path, language=language)
+
+
+def _restore(service: Any, payload: Any) -> None:
+    # Binary entries hand out LazyRows: a text-only hit never decodes the arrays
+    lazy = getattr(payload, "lazy", payload.get)
+    for attr in ("segments", "words"):
+        try:
+            setattr(service, f"last_{attr}", lazy(attr))
+        except Exception:
+            pass
+
+
+def _cached_text(service: Any, cache_dir: Optional[str], key: str) -> Optional[str]:
+    """Cached transcript text for ``key``; restores segments/words on a hit."""
+    payload = get(cache_dir, key)
+    if not payload or "text" not in payload:
+        return None
+    _restore(service, payload)
+    return payload["text"]
@@ -0,0 +1,291 @@
+"""Compact, versioned binary encoding for transcript cache payloads.
+
+Layout::
+
+    b"PTC" + version byte + codec byte + uint32 header length + header + sections
+
+The header is a small JSON document listing the payload keys and, per key, the
+kind, offset, compressed length and raw length of an independently compressed
+section. Decoding is lazy:
+``decode`` returns a read-only mapping that decompresses a section the first
+time its key is read, so a cache hit that only needs ``text`` never touches
+the (much larger) word arrays. Decoded payloads are shared (e.g. by the
+in-memory tier), so ``segments``/``words`` rows are handed out as copies.
+
+``segments`` and ``words`` (lists of dicts) are stored column by column:
+all-float and all-int columns as packed little-endian ``float64``/``int64``
+arrays, other columns (including mixed int/float ones, so ints stay ints) as
+JSON lists. Sections are compressed with zstd when the optional
+``zstandard`` package is installed, otherwise with gzip.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator, Optional
+
+MAGIC = b"PTC"
+VERSION = 1
+CODEC_NONE, CODEC_GZIP, CODEC_ZSTD = 0, 1, 2
+COLUMNAR_KEYS = ("segments", "words")
+_PREFIX = struct.Struct("<3sBBI")
+
+try:  # optional, faster and smaller than gzip
+    import zstandard as _zstd  # type: ignore
+except Exception:  # pragma: no cover - depends on environment
+    _zstd = None
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded (corrupt or unsupported)."""
+
+
+def default_codec() -> int:
+    return CODEC_ZSTD if _zstd is not None else CODEC_GZIP
+
+
+def _compress(data: bytes, codec: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        return _zstd.ZstdCompressor(level=3).compress(data)
+    if codec == CODEC_GZIP:
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    return data
+
+
+def _decompress(data: bytes, codec: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        if _zstd is None:
+            raise CodecError(
+                "Cache entry is zstd-compressed; install 'zstandard' to read it"
+            )
+        return _zstd.ZstdDecompressor().decompress(data)
+    if codec == CODEC_GZIP:
+        return gzip.decompress(data)
+    if codec == CODEC_NONE:
+        return data
+    raise CodecError(f"Unknown cache codec {codec}")
+
+
+def _number_kind(values: list) -> Optional[str]:
+    if not values:
+        return None
+    if all(type(v) is int for v in values):
+        return "i8"
+    if all(type(v) is float for v in values):
+        return "f8"
+    return None
+
+
+def _encode_rows(rows: list) -> bytes:
+    """Columnar encoding of a list of dicts sharing the same keys."""
+    names = list(rows[0])
+    cols, blobs = [], []
+    for name in names:
+        values = [r[name] for r in rows]
+        kind = _number_kind(values)
+        try:
+            arr = array("q" if kind == "i8" else "d", values) if kind else None
+        except OverflowError:  # ints beyond int64 stay JSON
+            kind = arr = None
+        if arr is not None:
+            if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+                arr.byteswap()
+            blob = arr.tobytes()
+        else:
+            kind = "json"
+            blob = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+            blob = blob.encode("utf-8")
+        cols.append([name, kind, len(blob)])
+        blobs.append(blob)
+    head = json.dumps({"n": len(rows), "cols": cols}).encode("utf-8")
+    return struct.pack("<I", len(head)) + head + b"".join(blobs)
+
+
+def _decode_rows(data: bytes) -> list:
+    (hlen,) = struct.unpack_from("<I", data)
+    head = json.loads(data[4 : 4 + hlen])
+    pos = 4 + hlen
+    columns = []
+    for name, kind, size in head["cols"]:
+        blob = data[pos : pos + size]
+        pos += size
+        if kind in ("i8", "f8"):
+            arr = array("q" if kind == "i8" else "d")
+            arr.frombytes(blob)
+            if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+                arr.byteswap()
+            values = arr.tolist()
+        else:
+            values = json.loads(blob)
+        columns.append((name, values))
+    names = [name for name, _ in columns]
+    return [dict(zip(names, row)) for row in zip(*(v for _, v in columns))]
+
+
+def _is_rows(value: Any) -> bool:
+    if not isinstance(value, list) or not value:
+        return False
+    if not all(isinstance(r, dict) for r in value):
+        return False
+    keys = list(value[0])
+    return all(isinstance(k, str) for k in keys) and all(list(r) == keys for r in value)
+
+
+def encode(payload: Mapping, codec: Optional[int] = None) -> bytes:
+    """Encode a JSON-compatible mapping into the binary cache format."""
+    codec = default_codec() if codec is None else codec
+    sections, blobs, offset = {}, [], 0
+    for key, value in payload.items():
+        if key in COLUMNAR_KEYS and _is_rows(value):
+            kind, raw = "rows", _encode_rows(value)
+        elif isinstance(value, str):
+            kind, raw = "str", value.encode("utf-8")
+        else:
+            kind = "json"
+            raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            raw = raw.encode("utf-8")
+        blob = _compress(raw, codec)
+        sections[key] = [kind, offset, len(blob), len(raw)]
+        blobs.append(blob)
+        offset += len(blob)
+    header = json.dumps({"sections": sections}, ensure_ascii=False).encode("utf-8")
+    return _PREFIX.pack(MAGIC, VERSION, codec, len(header)) + header + b"".join(blobs)
+
+
+def is_encoded(data: bytes) -> bool:
+    return data[:3] == MAGIC
+
+
+class LazyPayload(Mapping):
+    """Read-only mapping over an encoded payload; sections decode on access.
+
+    Each read of a ``rows`` section returns fresh row dicts, so callers may
+    edit them without changing the cached entry.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _PREFIX.size:
+            raise CodecError("Truncated cache entry")
+        magic, version, codec, hlen = _PREFIX.unpack_from(data)
+        if magic != MAGIC:
+            raise CodecError("Not a binary cache entry")
+        if version != VERSION:
+            raise CodecError(f"Unsupported cache entry version {version}")
+        if codec == CODEC_ZSTD and _zstd is None:
+            raise CodecError(
+                "Cache entry is zstd-compressed; install 'zstandard' to read it"
+            )
+        start = _PREFIX.size
+        try:
+            self._sections = json.loads(data[start : start + hlen])["sections"]
+        except Exception as e:
+            raise CodecError("Corrupt cache entry header") from e
+        self._data = memoryview(data)
+        self._base = start + hlen
+        self._codec = codec
+        self._values: dict[str, Any] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the encoded (compressed) entry."""
+        return len(self._data)
+
+    @property
+    def raw_nbytes(self) -> int:
+        """Size of all sections once decompressed (memory-tier weight)."""
+        return sum(sec[3] for sec in self._sections.values())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            value = self._values[key]
+        else:
+            value = self._values[key] = self._decode(key)
+        if self._sections[key][0] == "rows":
+            return [dict(r) for r in value]
+        return value
+
+    def _decode(self, key: str) -> Any:
+        kind, offset, size = self._sections[key][:3]
+        start = self._base + offset
+        raw = _decompress(bytes(self._data[start : start + size]), self._codec)
+        if kind == "rows":
+            return _decode_rows(raw)
+        if kind == "str":
+            return raw.decode("utf-8")
+        return json.loads(raw)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __repr__(self) -> str:
+        return f"LazyPayload(keys={list(self._sections)})"
+
+    def is_decoded(self, key: str) -> bool:
+        return key in self._values
+
+    def lazy(self, key: str) -> Any:
+        """``self[key]``, deferred as :class:`LazyRows` for columnar sections."""
+        if key not in self._sections:
+            return None
+        if self._sections[key][0] == "rows" and key not in self._values:
+            return LazyRows(self, key)
+        return self[key]
+
+
+class LazyRows(Sequence):
+    """List-like view of a ``segments``/``words`` section, decoded on first use.
+
+    The view copies the rows once, when first read, so edits stay with this
+    view. It pickles as a plain list, so it can cross process boundaries.
+    """
+
+    __slots__ = ("_payload", "_key", "_list")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, payload: LazyPayload, key: str):
+        self._payload = payload
+        self._key = key
+        self._list: Optional[list] = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._list is not None
+
+    def _rows(self) -> list:
+        if self._list is None:
+            self._list = self._payload[self._key]
+        return self._list
+
+    def __getitem__(self, index):
+        return self._rows()[index]
+
+    def __len__(self) -> int:
+        return len(self._rows())
+
+    def __iter__(self) -> Iterator:
+        return iter(self._rows())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyRows):
+            other = other._rows()
+        return self._rows() == other
+
+    def __reduce__(self):
+        return (list, (self._rows(),))
+
+    def __repr__(self) -> str:
+        state = "decoded" if self.decoded else "pending"
+        return f"LazyRows({self._key!r}, {state})"
+
+
+def decode(data: bytes) -> LazyPayload:
+    """Wrap encoded bytes in a lazily decoding mapping (header parsed eagerly)."""
+    return LazyPayload(data)
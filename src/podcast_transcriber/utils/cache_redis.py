@@ -0,0 +1,258 @@
+"""Redis-protocol transcript cache backend shared by several machines.
+
+Select it with ``--cache-dir redis://host:6379/0`` (or ``cache_dir:`` in the
+orchestrator config, or ``PODCAST_TRANSCRIBER_CACHE_URL``). Entries are the
+same :mod:`cache_codec` bytes the filesystem backend writes. Besides the
+entry keys, two sorted sets track creation and access times (for TTL and LRU
+pruning) and a hash keeps hit/miss counters and the byte total.
+
+``lock(key)`` is a distributed single-flight lock: ``SET NX PX`` with a random
+token, renewed in the background while held and released only by its owner,
+so two nodes never transcribe the same key at once and a crashed holder's
+lease expires after ``lock_ttl`` seconds.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from . import cache_codec
+from .cache_store import (
+    ENV_MAX_BYTES,
+    ENV_TTL,
+    LOCK_POLL,
+    LOCK_WAIT,
+    LOW_WATER,
+    CacheBackend,
+    parse_duration,
+    parse_size,
+)
+
+URL_SCHEMES = ("redis", "rediss", "unix")
+DEFAULT_PREFIX = "podcast_transcriber:cache:"
+LOCK_TTL = 60.0
+
+
+def is_backend_url(value: Optional[str]) -> bool:
+    return bool(value) and str(value).split("://", 1)[0] in URL_SCHEMES
+
+
+def _redact(url: str) -> str:
+    parts = urlsplit(url)
+    if parts.password:
+        netloc = parts.netloc.replace(f":{parts.password}@", ":***@")
+        return urlunsplit(parts._replace(netloc=netloc))
+    return url
+
+
+class RedisCache(CacheBackend):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        prefix: str = DEFAULT_PREFIX,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        lock_ttl: float = LOCK_TTL,
+        lock_wait: float = LOCK_WAIT,
+    ):
+        if client is None:
+            try:
+                import redis  # type: ignore
+            except Exception as e:
+                raise RuntimeError(
+                    "Redis cache backend requires 'redis'. Install with: pip install redis or pip install podcast-transcriber[redis]"
+                ) from e
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self._r = client
+        self._url = url or "redis://"
+        self._prefix = prefix
+        # No default budget: the server's maxmemory policy usually applies
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else parse_size(os.environ.get(ENV_MAX_BYTES))
+        )
+        self.ttl = ttl if ttl is not None else parse_duration(os.environ.get(ENV_TTL))
+        self.lock_ttl = float(lock_ttl)
+        self.lock_wait = float(lock_wait)
+
+    @property
+    def location(self) -> str:
+        return _redact(self._url)
+
+    def _k(self, *parts: str) -> str:
+        return self._prefix + ":".join(parts)
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self._r.get(self._k("e", key))
+        stats = self._k("stats")
+        if data is None:
+            self._forget(key)
+            self._r.hincrby(stats, "misses", 1)
+            return None
+        try:
+            payload = cache_codec.decode(data)
+        except cache_codec.CodecError:
+            self.delete(key)
+            self._r.hincrby(stats, "misses", 1)
+            return None
+        pipe = self._r.pipeline()
+        pipe.zadd(self._k("atime"), {key: time.time()})
+        pipe.hincrby(stats, "hits", 1)
+        pipe.execute()
+        return payload
+
+    def set_encoded(self, key: str, data: bytes) -> None:
+        now = time.time()
+        px = int(self.ttl * 1000) if self.ttl else None
+        old = self._r.hget(self._k("sizes"), key)
+        pipe = self._r.pipeline()
+        pipe.set(self._k("e", key), data, px=px)
+        pipe.zadd(self._k("ctime"), {key: now})
+        pipe.zadd(self._k("atime"), {key: now})
+        pipe.hset(self._k("sizes"), key, len(data))
+        pipe.hincrby(self._k("stats"), "bytes", len(data) - int(old or 0))
+        pipe.hincrby(self._k("stats"), "writes", 1)
+        pipe.execute()
+        if self.max_bytes is not None:
+            self._evict(self.max_bytes, keep=key)
+
+    def delete(self, key: str) -> None:
+        self._r.delete(self._k("e", key))
+        self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        """Drop index entries of a key whose value is gone (deleted/expired)."""
+        size = self._r.hget(self._k("sizes"), key)
+        if size is None:
+            return
+        pipe = self._r.pipeline()
+        pipe.zrem(self._k("ctime"), key)
+        pipe.zrem(self._k("atime"), key)
+        pipe.hdel(self._k("sizes"), key)
+        pipe.hincrby(self._k("stats"), "bytes", -int(size))
+        pipe.execute()
+
+    def _total(self) -> int:
+        return int(self._r.hget(self._k("stats"), "bytes") or 0)
+
+    def _evict(self, budget: int, keep: Optional[str] = None) -> int:
+        total = self._total()
+        if total <= budget:
+            return 0
+        target = int(budget * LOW_WATER)
+        evicted = 0
+        for raw in self._r.zrange(self._k("atime"), 0, -1):
+            if total <= target:
+                break
+            key = raw.decode() if isinstance(raw, bytes) else raw
+            if key == keep:
+                continue
+            size = int(self._r.hget(self._k("sizes"), key) or 0)
+            self.delete(key)
+            total -= size
+            evicted += 1
+        if evicted:
+            self._r.hincrby(self._k("stats"), "evictions", evicted)
+        return evicted
+
+    def prune(
+        self, max_bytes: Optional[int] = None, ttl: Optional[float] = None
+    ) -> dict:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expired = missing = 0
+        for raw, created in self._r.zrange(self._k("ctime"), 0, -1, withscores=True):
+            key = raw.decode() if isinstance(raw, bytes) else raw
+            if ttl is not None and now - created > ttl:
+                self.delete(key)
+                expired += 1
+            elif not self._r.exists(self._k("e", key)):
+                self._forget(key)
+                missing += 1
+        if expired:
+            self._r.hincrby(self._k("stats"), "expired", expired)
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        evicted = self._evict(int(budget)) if budget is not None else 0
+        return {"expired": expired, "missing": missing, "evicted": evicted}
+
+    def stats(self) -> dict:
+        raw = self._r.hgetall(self._k("stats"))
+        counters = {
+            (k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()
+        }
+        out = {
+            "dir": self.location,
+            "entries": int(self._r.zcard(self._k("ctime"))),
+            "bytes": counters.get("bytes", 0),
+        }
+        for name in ("hits", "misses", "writes", "evictions", "expired"):
+            out[name] = counters.get(name, 0)
+        lookups = out["hits"] + out["misses"]
+        out["hit_rate"] = round(out["hits"] / lookups, 3) if lookups else 0.0
+        out.update(max_bytes=self.max_bytes, ttl=self.ttl, policy="lru")
+        return out
+
+    # Distributed single-flight lock
+    def _if_owner(self, name: str, token: str, action) -> bool:
+        """Run ``action(pipe)`` atomically only while ``token`` owns ``name``."""
+        from redis.exceptions import WatchError  # type: ignore
+
+        with self._r.pipeline() as pipe:
+            try:
+                pipe.watch(name)
+                current = pipe.get(name)
+                # bytes, or str on clients created with decode_responses=True
+                if isinstance(current, bytes):
+                    current = current.decode()
+                if current != token:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                action(pipe)
+                pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+    @contextmanager
+    def lock(self, key: str, timeout: Optional[float] = None):
+        name = self._k("lock", key)
+        token = uuid.uuid4().hex
+        ttl_ms = max(1, int(self.lock_ttl * 1000))
+        deadline = time.monotonic() + (self.lock_wait if timeout is None else timeout)
+        acquired = bool(self._r.set(name, token, nx=True, px=ttl_ms))
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(LOCK_POLL)
+            acquired = bool(self._r.set(name, token, nx=True, px=ttl_ms))
+        stop = threading.Event()
+        renewer = None
+        if acquired:
+
+            def _renew() -> None:
+                while not stop.wait(self.lock_ttl / 3):
+                    if not self._if_owner(
+                        name, token, lambda p: p.pexpire(name, ttl_ms)
+                    ):
+                        return
+
+            renewer = threading.Thread(target=_renew, name="cache-lock", daemon=True)
+            renewer.start()
+        try:
+            yield acquired
+        finally:
+            stop.set()
+            if renewer is not None:
+                renewer.join()
+            if acquired:
+                try:
+                    self._if_owner(name, token, lambda p: p.delete(name))
+                except Exception:
+                    pass
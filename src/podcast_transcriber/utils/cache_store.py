@@ -0,0 +1,466 @@
+"""Size-bounded on-disk transcript cache with a SQLite manifest.
+
+Entries live in sharded subdirectories (``ab/cd/<key>.bin``, encoded with
+:mod:`cache_codec`; flat ``<key>.json`` files from before the manifest are
+imported once when the store is first opened, other JSON entries are
+re-encoded on read) so no directory
+grows unbounded. A single ``cache.sqlite3`` manifest records size, creation
+and access times and hit counts per key, so lookups, statistics and eviction
+never walk the file tree. Writes are atomic (temp file + ``os.replace``).
+When the total size exceeds ``max_bytes`` the least recently used (``lru``)
+or least frequently used (``lfu``) entries are evicted down to
+``LOW_WATER`` of the budget; entries older than ``ttl`` seconds expire.
+
+Limits come from the constructor or the environment:
+``PODCAST_TRANSCRIBER_CACHE_MAX_BYTES`` (e.g. ``2G``),
+``PODCAST_TRANSCRIBER_CACHE_TTL`` (e.g. ``30d``; empty means no expiry) and
+``PODCAST_TRANSCRIBER_CACHE_POLICY`` (``lru`` or ``lfu``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from . import cache_codec
+
+try:
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+ENV_MAX_BYTES = "PODCAST_TRANSCRIBER_CACHE_MAX_BYTES"
+ENV_TTL = "PODCAST_TRANSCRIBER_CACHE_TTL"
+ENV_POLICY = "PODCAST_TRANSCRIBER_CACHE_POLICY"
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+LOW_WATER = 0.9
+MANIFEST_NAME = "cache.sqlite3"
+POLICIES = ("lru", "lfu")
+# Single-flight locks: how long a second requester waits, and how often it polls
+LOCK_WAIT = 6 * 3600.0
+LOCK_POLL = 0.2
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+_TIME_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_COUNTERS = ("hits", "misses", "writes", "evictions", "expired")
+# Flat entries written before the manifest: ``<sha256 key>.json``
+_LEGACY_NAME = re.compile(r"[0-9a-f]{64}\.json")
+
+
+def parse_size(value: str | int | float | None) -> Optional[int]:
+    """Parse ``512M``, ``2G`` or a plain byte count; ``None``/empty -> None."""
+    if value is None or str(value).strip() == "":
+        return None
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*", str(value).lower())
+    if not m:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(float(m.group(1)) * _SIZE_UNITS[m.group(2)])
+
+
+def parse_duration(value: str | int | float | None) -> Optional[float]:
+    """Parse ``30d``, ``12h``, ``90m`` or plain seconds; ``None``/empty -> None."""
+    if value is None or str(value).strip() == "":
+        return None
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", str(value).lower())
+    if not m:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return float(m.group(1)) * _TIME_UNITS[m.group(2)]
+
+
+class CacheBackend(ABC):
+    """Interface shared by transcript cache backends (see :mod:`utils.cache`).
+
+    Payloads travel as :mod:`cache_codec` bytes; ``get`` returns a mapping.
+    ``lock(key)`` is a single-flight guard around filling a missing key: it
+    yields True when this caller holds the key exclusively (and should re-check
+    the cache before doing the work) or False when the backend cannot lock or
+    the wait timed out.
+    """
+
+    @property
+    @abstractmethod
+    def location(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_encoded(self, key: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def set(self, key: str, payload: Any) -> None:
+        self.set_encoded(key, cache_codec.encode(payload))
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def prune(
+        self, max_bytes: Optional[int] = None, ttl: Optional[float] = None
+    ) -> dict:
+        return {"expired": 0, "missing": 0, "evicted": 0}
+
+    def stats(self) -> dict:
+        return {"dir": self.location}
+
+    @contextmanager
+    def lock(self, key: str, timeout: Optional[float] = None):
+        yield False
+
+
+class DiskCache(CacheBackend):
+    """Sharded key -> payload store on the local filesystem (see module doc)."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        policy: Optional[str] = None,
+    ):
+        self.root = Path(root)
+        env_max = parse_size(os.environ.get(ENV_MAX_BYTES))
+        self.max_bytes = int(
+            max_bytes if max_bytes is not None else env_max or DEFAULT_MAX_BYTES
+        )
+        self.ttl = ttl if ttl is not None else parse_duration(os.environ.get(ENV_TTL))
+        self.policy = (policy or os.environ.get(ENV_POLICY) or "lru").lower()
+        if self.policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy '{self.policy}'. Use lru or lfu.")
+        self._ready = False
+
+    @property
+    def location(self) -> str:
+        return str(self.root)
+
+    # Manifest
+    @contextmanager
+    def _db(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        if not self._ready:
+            self._setup()
+        # One short-lived connection per operation keeps the store safe to use
+        # from threads and worker processes; SQLite serializes the writers.
+        conn = sqlite3.connect(str(self.root / MANIFEST_NAME), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _setup(self) -> None:
+        """Create the manifest and import legacy flat entries (first open only)."""
+        conn = sqlite3.connect(str(self.root / MANIFEST_NAME), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, path TEXT NOT NULL,"
+                " size INTEGER NOT NULL, created REAL NOT NULL,"
+                " accessed REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                " name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_accessed ON entries(accessed)")
+            migrated = conn.execute(
+                "SELECT 1 FROM meta WHERE name = 'legacy_json'"
+            ).fetchone()
+        finally:
+            conn.close()
+        self._ready = True
+        if migrated:
+            return
+        for path in self.root.glob("*.json"):
+            if _LEGACY_NAME.fullmatch(path.name):
+                payload = self._read_json(path)
+                if payload is not None:
+                    self._migrate(path.stem, payload, path.name)
+        with self._db() as conn:
+            conn.execute("INSERT OR IGNORE INTO meta(name) VALUES('legacy_json')")
+
+    @staticmethod
+    def _bump(conn, name: str, n: int = 1) -> None:
+        if n:
+            conn.execute(
+                "INSERT INTO counters(name, value) VALUES(?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, n),
+            )
+
+    def _rel_path(self, key: str) -> str:
+        return f"{key[:2]}/{key[2:4]}/{key}.bin"
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    # Public API
+    def get(self, key: str) -> Optional[Any]:
+        """Return the payload (lazily decoded) or None on a miss."""
+        now = time.time()
+        old_rel = None
+        with self._db() as conn:
+            row = conn.execute(
+                "SELECT path, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._bump(conn, "misses")
+                return None
+            rel, created = row
+            if self._expired(created, now):
+                self._delete(conn, key, rel)
+                self._bump(conn, "expired")
+                self._bump(conn, "misses")
+                return None
+            try:
+                data = (self.root / rel).read_bytes()
+                if cache_codec.is_encoded(data):
+                    payload = cache_codec.decode(data)
+                else:  # JSON entry from an older version
+                    payload, old_rel = json.loads(data.decode("utf-8")), rel
+            except Exception:
+                self._delete(conn, key, rel)
+                self._bump(conn, "misses")
+                return None
+            conn.execute(
+                "UPDATE entries SET accessed = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+            self._bump(conn, "hits")
+        if old_rel is not None:
+            self._migrate(key, payload, old_rel)
+        return payload
+
+    def set_encoded(self, key: str, data: bytes) -> None:
+        self._write(key, data)
+
+    def _write(self, key: str, data: bytes, created: Optional[float] = None) -> None:
+        rel = self._rel_path(key)
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        now = time.time()
+        with self._db() as conn:
+            conn.execute(
+                "INSERT INTO entries(key, path, size, created, accessed, hits) "
+                "VALUES(?, ?, ?, ?, ?, 0) ON CONFLICT(key) DO UPDATE SET "
+                "path = excluded.path, size = excluded.size, "
+                "created = excluded.created, accessed = excluded.accessed",
+                (key, rel, len(data), created or now, now),
+            )
+            self._bump(conn, "writes")
+            self._evict(conn, self.max_bytes, keep=key)
+
+    @contextmanager
+    def lock(self, key: str, timeout: Optional[float] = None):
+        """Cross-process single-flight lock (``fcntl.flock`` on a lock file)."""
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            yield False
+            return
+        path = self.root / "locks" / key[:2] / f"{key}.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + (LOCK_WAIT if timeout is None else timeout)
+        with open(path, "a+b") as fh:
+            while True:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    acquired = True
+                    break
+                except OSError:
+                    if time.monotonic() >= deadline:
+                        acquired = False
+                        break
+                    time.sleep(LOCK_POLL)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    def _prune_locks(self) -> None:
+        # Lock files are tiny but would pile up; drop the ones nobody holds.
+        # A process that opened a file just before it is unlinked can still
+        # lock the orphan, which at worst costs one duplicate transcription.
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            return
+        for path in (self.root / "locks").glob("*/*.lock"):
+            try:
+                with open(path, "a+b") as fh:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def delete(self, key: str) -> None:
+        with self._db() as conn:
+            row = conn.execute(
+                "SELECT path FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                self._delete(conn, key, row[0])
+
+    def _delete(self, conn, key: str, rel: str) -> None:
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            (self.root / rel).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Any]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def _migrate(self, key: str, payload: Any, old_rel: str) -> None:
+        """Re-encode a JSON entry in the binary format and drop the old file."""
+        try:
+            self._write(key, cache_codec.encode(payload))
+            if old_rel != self._rel_path(key):
+                (self.root / old_rel).unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    def _evict(self, conn, budget: int, keep: Optional[str] = None) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= budget:
+            return 0
+        target = int(budget * LOW_WATER)
+        order = "accessed" if self.policy == "lru" else "hits, accessed"
+        evicted = 0
+        rows = conn.execute(f"SELECT key, path, size FROM entries ORDER BY {order}")
+        for key, rel, size in rows.fetchall():
+            if total <= target:
+                break
+            if key == keep:  # never evict the entry being written
+                continue
+            self._delete(conn, key, rel)
+            total -= size
+            evicted += 1
+        self._bump(conn, "evictions", evicted)
+        return evicted
+
+    def prune(
+        self, max_bytes: Optional[int] = None, ttl: Optional[float] = None
+    ) -> dict:
+        """Drop expired and orphaned entries, then evict down to the budget."""
+        budget = self.max_bytes if max_bytes is None else int(max_bytes)
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expired = missing = 0
+        with self._db() as conn:
+            for key, rel, created in conn.execute(
+                "SELECT key, path, created FROM entries"
+            ).fetchall():
+                if ttl is not None and now - created > ttl:
+                    self._delete(conn, key, rel)
+                    expired += 1
+                elif not (self.root / rel).exists():
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    missing += 1
+            self._bump(conn, "expired", expired)
+            evicted = self._evict(conn, budget)
+        self._prune_locks()
+        return {"expired": expired, "missing": missing, "evicted": evicted}
+
+    def stats(self) -> dict:
+        with self._db() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+        out = {"dir": str(self.root), "entries": entries, "bytes": size}
+        out.update({name: int(counters.get(name, 0)) for name in _COUNTERS})
+        lookups = out["hits"] + out["misses"]
+        out["hit_rate"] = round(out["hits"] / lookups, 3) if lookups else 0.0
+        out.update(max_bytes=self.max_bytes, ttl=self.ttl, policy=self.policy)
+        return out
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU tier bounded by the entries' decoded bytes.
+
+    Sits in front of a :class:`DiskCache` in long-lived processes (e.g.
+    ``podcast-auto-run``) so hot entries skip disk reads and decoding.
+    ``max_bytes=0`` disables the tier.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def weight(payload: Any) -> int:
+        size = getattr(payload, "raw_nbytes", None)
+        if size is None:
+            size = len(json.dumps(payload, ensure_ascii=False, default=str))
+        return int(size)
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Any, payload: Any) -> None:
+        if not self.max_bytes:
+            return
+        size = self.weight(payload)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (payload, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self.evictions += 1
+
+    def discard(self, key: Any) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
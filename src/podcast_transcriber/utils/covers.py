@@ -0,0 +1,328 @@
+"""Cover artwork cache shared across exports, episodes and runs.
+
+Episodes of a feed usually share one artwork URL, and every export used to
+download it again and re-encode it with Pillow. Here originals are stored
+under ``<cache dir>/covers/blobs/`` by content hash, next to a per-URL
+record of that hash and the ``ETag``/``Last-Modified`` validators, so a later
+run revalidates with a conditional GET and reuses the stored body on
+``304``. Within a process a URL is fetched once (concurrent callers share the
+download) and kept in a small LRU for ``FETCH_TTL`` seconds, after which it is
+revalidated the same way. Resized JPEG variants are memoized per content
+hash, bounding box and quality, in memory and under ``covers/variants/``.
+
+Blobs and variants share a size budget of their own
+(``PODCAST_TRANSCRIBER_COVER_CACHE_MAX_BYTES``, default 256M); the least
+recently used files are removed once it is exceeded. Set
+``PODCAST_TRANSCRIBER_COVER_CACHE=0`` to keep everything in memory only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .cache_store import LOW_WATER, parse_size
+from .singleflight import SingleFlight
+
+ENV_COVER_CACHE = "PODCAST_TRANSCRIBER_COVER_CACHE"
+ENV_COVER_CACHE_MAX_BYTES = "PODCAST_TRANSCRIBER_COVER_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 256 * 1024**2
+# Bounding boxes (pixels) of the prepared cover per target
+EPUB_SIZE = (1600, 2560)
+PDF_SIZE = (1240, 1754)  # A4 at 150 dpi
+DOCX_DPI = 300
+JPEG_QUALITY = 85
+MAX_MEMORY_VARIANTS = 32
+MAX_MEMORY_COVERS = 16
+FETCH_TTL = 3600.0  # seconds before a memoized URL is revalidated
+
+_caches: dict[Optional[str], CoverCache] = {}
+_caches_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    value = os.environ.get(ENV_COVER_CACHE, "1").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def docx_size(width_inches: Optional[float]) -> tuple[int, int]:
+    """Bounding box for a DOCX cover ``width_inches`` wide (6in by default)."""
+    px = int(float(width_inches or 6) * DOCX_DPI)
+    return px, px * 2
+
+
+def resize_jpeg(data: bytes, max_size: tuple[int, int], quality: int) -> bytes:
+    """Fit ``data`` into ``max_size`` as RGB JPEG; unchanged bytes without Pillow."""
+    try:
+        Image = importlib.import_module("PIL.Image")  # type: ignore
+    except Exception:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img = img.convert("RGB")
+            img.thumbnail(max_size, Image.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=quality)
+            return buf.getvalue() or data
+    except Exception:
+        # Not an image Pillow can read: use the original bytes
+        return data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class CoverCache:
+    """Downloaded covers and their resized variants; ``root=None`` is memory only."""
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root is not None else None
+        if max_bytes is None:
+            max_bytes = parse_size(os.environ.get(ENV_COVER_CACHE_MAX_BYTES))
+        self.max_bytes = int(max_bytes or DEFAULT_MAX_BYTES)
+        self._lock = threading.Lock()
+        # url -> (bytes, fetched at, validators), least recently used first
+        self._fetched: OrderedDict[str, tuple[bytes, float, dict]] = OrderedDict()
+        self._variants: OrderedDict[tuple, bytes] = OrderedDict()
+        self._flight = SingleFlight()
+        self._disk_bytes: Optional[int] = None  # counted on the first write
+
+    # -- disk layout -----------------------------------------------------
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest  # type: ignore[operator]
+
+    def _record_path(self, url: str) -> Path:
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".json"
+        return self.root / "urls" / name  # type: ignore[operator]
+
+    def _variant_path(self, key: tuple) -> Path:
+        digest, (w, h), quality = key
+        name = f"{digest}-{w}x{h}-q{quality}.jpg"
+        return self.root / "variants" / digest[:2] / name  # type: ignore[operator]
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # mtime orders eviction: most recently used last
+        except OSError:
+            pass
+        return data
+
+    def _files(self) -> list[Path]:
+        return [
+            p
+            for sub in ("blobs", "variants")
+            for p in (self.root / sub).glob("*/*")  # type: ignore[operator]
+            if p.is_file()
+        ]
+
+    def _store(self, path: Path, data: bytes) -> None:
+        """Write a blob or variant, evicting old files past ``max_bytes``."""
+        _write_atomic(path, data)
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(self._size(p) for p in self._files())
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.max_bytes:
+                self._disk_bytes = self._prune(int(self.max_bytes * LOW_WATER))
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _prune(self, target: int) -> int:
+        entries = []
+        for p in self._files():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= target:
+                break
+            try:
+                p.unlink()
+                total -= size
+            except OSError:
+                pass
+        return total
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used blobs/variants down to ``max_bytes``; new total."""
+        if self.root is None:
+            return 0
+        with self._lock:
+            self._disk_bytes = self._prune(
+                self.max_bytes if max_bytes is None else max_bytes
+            )
+            return self._disk_bytes
+
+    def _record(self, url: str) -> dict:
+        if self.root is None:
+            return {}
+        try:
+            rec = json.loads(self._record_path(url).read_text(encoding="utf-8"))
+            return rec if isinstance(rec, dict) else {}
+        except Exception:
+            return {}
+
+    # -- originals -------------------------------------------------------
+    def fetch(self, url: str, timeout: float = 20) -> Optional[bytes]:
+        """Cover bytes for ``url``: memoized, revalidated on disk, else downloaded.
+
+        Returns None when the download fails and nothing is cached; a stale
+        cached copy is preferred over failing when the server is unreachable.
+        """
+        with self._lock:
+            hit = self._fetched.get(url)
+            if hit is not None:
+                self._fetched.move_to_end(url)
+                if time.monotonic() - hit[1] < FETCH_TTL:
+                    return hit[0]
+        data, _ = self._flight.do(url, lambda: self._download(url, timeout, hit))
+        return data
+
+    def _download(
+        self, url: str, timeout: float, stale: Optional[tuple] = None
+    ) -> Optional[bytes]:
+        rec = self._record(url)
+        cached = (
+            self._read(self._blob_path(rec["sha256"])) if rec.get("sha256") else None
+        )
+        if cached is None and stale is not None:
+            # Memory-only (or evicted on disk): revalidate the memoized copy
+            cached, rec = stale[0], stale[2]
+        data, rec = self._get(url, timeout, rec, cached)
+        if data:
+            with self._lock:
+                self._fetched[url] = (data, time.monotonic(), rec)
+                self._fetched.move_to_end(url)
+                while len(self._fetched) > MAX_MEMORY_COVERS:
+                    self._fetched.popitem(last=False)
+        return data
+
+    def _get(
+        self, url: str, timeout: float, rec: dict, cached: Optional[bytes]
+    ) -> tuple[Optional[bytes], dict]:
+        """Conditional GET against ``cached``; the body and its validators."""
+        headers = {}
+        if cached is not None:
+            if rec.get("etag"):
+                headers["If-None-Match"] = rec["etag"]
+            if rec.get("last_modified"):
+                headers["If-Modified-Since"] = rec["last_modified"]
+        try:
+            import requests  # type: ignore
+
+            r = requests.get(url, headers=headers, timeout=timeout)
+            if r.status_code == 304 and cached is not None:
+                return cached, rec
+            r.raise_for_status()
+            data = r.content
+        except Exception:
+            return cached, rec
+        if not data:
+            return cached, rec
+        digest = content_hash(data)
+        rec = {
+            "url": url,
+            "sha256": digest,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        }
+        if self.root is not None:
+            try:
+                blob = self._blob_path(digest)
+                if not blob.exists():
+                    self._store(blob, data)
+                _write_atomic(self._record_path(url), json.dumps(rec).encode("utf-8"))
+            except OSError:
+                pass  # the cover itself is fine; only caching failed
+        return data, rec
+
+    # -- variants --------------------------------------------------------
+    def variant(
+        self,
+        data: bytes,
+        max_size: tuple[int, int] = EPUB_SIZE,
+        quality: int = JPEG_QUALITY,
+    ) -> bytes:
+        """``data`` resized into ``max_size`` as JPEG, computed once per content."""
+        key = (content_hash(data), tuple(max_size), int(quality))
+        with self._lock:
+            out = self._variants.get(key)
+            if out is not None:
+                self._variants.move_to_end(key)
+                return out
+        out = self._read(self._variant_path(key)) if self.root is not None else None
+        if out is None:
+            out = resize_jpeg(data, key[1], key[2])
+            if out is not data and self.root is not None:
+                try:
+                    self._store(self._variant_path(key), out)
+                except OSError:
+                    pass
+        with self._lock:
+            self._variants[key] = out
+            while len(self._variants) > MAX_MEMORY_VARIANTS:
+                self._variants.popitem(last=False)
+        return out
+
+
+def get_cover_cache(cache_dir: Optional[str] = None) -> CoverCache:
+    """Process-wide cache for ``cache_dir`` (default ``<cache>/covers``)."""
+    if not enabled():
+        root = None
+    elif cache_dir:
+        root = str(Path(cache_dir))
+    else:
+        from .cache import _default_cache_dir
+
+        root = str(_default_cache_dir() / "covers")
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = CoverCache(Path(root) if root else None)
+        return cache
+
+
+def fetch_cover(url: str, timeout: float = 20) -> Optional[bytes]:
+    return get_cover_cache().fetch(url, timeout=timeout)
+
+
+def cover_variant(
+    data: bytes, max_size: tuple[int, int] = EPUB_SIZE, quality: int = JPEG_QUALITY
+) -> bytes:
+    return get_cover_cache().variant(data, max_size, quality)
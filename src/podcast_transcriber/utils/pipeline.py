@@ -0,0 +1,172 @@
+"""Small staged pipeline executor with bounded queues between stages.
+
+Each stage runs ``workers`` threads that pull items from a bounded input queue,
+apply the stage function and push the result to the next stage. A full queue
+blocks the producing stage (backpressure), so a fast downloader cannot run far
+ahead of a slow transcriber. CPU-heavy stages can hand their work to an
+``Executor`` (e.g. a ``ProcessPoolExecutor``); the stage threads then only
+wait on the pool, and their count bounds the number of tasks in flight.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    executor: Optional[Executor] = None
+
+
+@dataclass
+class StageMetrics:
+    workers: int
+    items: int = 0
+    errors: int = 0
+    busy_s: float = 0.0
+    idle_s: float = 0.0  # waiting for input
+    blocked_s: float = 0.0  # waiting for room downstream (backpressure)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, busy: float, idle: float, blocked: float, error: bool) -> None:
+        with self._lock:
+            self.items += 1
+            self.errors += int(error)
+            self.busy_s += busy
+            self.idle_s += idle
+            self.blocked_s += blocked
+
+    def as_dict(self, wall_s: float) -> dict:
+        capacity = max(wall_s * self.workers, 1e-9)
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_s": round(self.busy_s, 3),
+            "idle_s": round(self.idle_s, 3),
+            "blocked_s": round(self.blocked_s, 3),
+            "utilization": round(min(self.busy_s / capacity, 1.0), 3),
+        }
+
+
+class PipelineError(RuntimeError):
+    """Raised after the pipeline drained when any stage failed."""
+
+    def __init__(self, stage: str, index: int, error: BaseException):
+        super().__init__(f"Stage '{stage}' failed for item {index}: {error}")
+        self.stage = stage
+        self.index = index
+        self.error = error
+        self.metrics: dict = {}
+
+
+def run_pipeline(
+    items: Iterable[Any],
+    stages: list[Stage],
+    queue_size: int = 2,
+    on_result: Optional[Callable[[int, Any], None]] = None,
+) -> tuple[list[Any], dict]:
+    """Push ``items`` through ``stages`` and return ``(results, metrics)``.
+
+    ``results`` is in input order; ``metrics`` holds the wall time and, per
+    stage, item counts, busy/idle/blocked seconds and utilization.
+    ``on_result(index, value)`` is called (one call at a time) as soon as an
+    item leaves the last stage. After the first failure no new items enter the
+    pipeline, items already in flight finish, and a ``PipelineError`` is
+    raised once everything has drained.
+    """
+    if not stages:
+        raise ValueError("run_pipeline requires at least one stage")
+    items = list(items)
+    results: list[Any] = [None] * len(items)
+    queues = [queue.Queue(maxsize=max(1, int(queue_size))) for _ in stages]
+    metrics = {s.name: StageMetrics(workers=max(1, int(s.workers))) for s in stages}
+    remaining = [max(1, int(s.workers)) for s in stages]
+    state_lock = threading.Lock()
+    result_lock = threading.Lock()
+    failures: list[PipelineError] = []
+    abort = threading.Event()
+
+    def _worker(pos: int) -> None:
+        stage = stages[pos]
+        m = metrics[stage.name]
+        in_q = queues[pos]
+        out_q = queues[pos + 1] if pos + 1 < len(stages) else None
+        while True:
+            t0 = time.perf_counter()
+            entry = in_q.get()
+            idle = time.perf_counter() - t0
+            if entry is _DONE:
+                break
+            idx, value = entry
+            t1 = time.perf_counter()
+            error = None
+            try:
+                if stage.executor is not None:
+                    value = stage.executor.submit(stage.fn, value).result()
+                else:
+                    value = stage.fn(value)
+            except Exception as e:  # recorded; surfaced after drain
+                error = e
+            busy = time.perf_counter() - t1
+            blocked = 0.0
+            if error is None and out_q is not None:
+                t2 = time.perf_counter()
+                out_q.put((idx, value))
+                blocked = time.perf_counter() - t2
+            elif error is None:
+                results[idx] = value
+                if on_result is not None:
+                    try:
+                        with result_lock:
+                            on_result(idx, value)
+                    except Exception as e:
+                        error = e
+            if error is not None:
+                with state_lock:
+                    failures.append(PipelineError(stage.name, idx, error))
+                abort.set()
+            m.add(busy, idle, blocked, error is not None)
+        with state_lock:
+            remaining[pos] -= 1
+            last = remaining[pos] == 0
+        if last and out_q is not None:
+            for _ in range(remaining[pos + 1]):
+                out_q.put(_DONE)
+
+    threads = []
+    for pos, stage in enumerate(stages):
+        for n in range(max(1, int(stage.workers))):
+            t = threading.Thread(
+                target=_worker, args=(pos,), name=f"{stage.name}-{n}", daemon=True
+            )
+            t.start()
+            threads.append(t)
+    start = time.perf_counter()
+    for idx, item in enumerate(items):
+        if abort.is_set():
+            break
+        queues[0].put((idx, item))
+    for _ in range(remaining[0]):
+        queues[0].put(_DONE)
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+    report = {
+        "wall_s": round(wall, 3),
+        "stages": {name: m.as_dict(wall) for name, m in metrics.items()},
+    }
+    if failures:
+        failures[0].metrics = report
+        raise failures[0]
+    return results, report
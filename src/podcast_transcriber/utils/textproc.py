@@ -1,14 +1,18 @@
 import re
 
+_SPACES = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
 
 def normalize_text(text: str) -> str:
     # Collapse multiple spaces and lines, ensure space after punctuation
-    t = re.sub(r"[ \t]+", " ", text)
-    t = re.sub(r"\n{3,}", "\n\n", t)
+    t = _SPACES.sub(" ", text)
+    t = _BLANK_LINES.sub("\n\n", t)
     return t.strip()
 
 
-def summarize_text(text: str, max_sentences: int = 5) -> str:
-    # Naive: take first N sentences.
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    return " ".join(parts[:max_sentences]).strip()
+def summarize_text(text: str, max_sentences: int = 5, method: str = "textrank") -> str:
+    # Extractive: the most central sentences (TextRank), in original order.
+    from ..nlp.summarize import summarize
+
+    return summarize(text, max_sentences=max_sentences, method=method)
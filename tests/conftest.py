@@ -5,3 +5,12 @@ ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_transcript_cache(tmp_path_factory, monkeypatch):
+    # Keep the transcript cache out of ~/.cache and fresh for every test
+    cache_dir = tmp_path_factory.mktemp("transcript-cache")
+    monkeypatch.setenv("PODCAST_TRANSCRIBER_CACHE", str(cache_dir))
@@ -12,11 +12,11 @@ class DummyService:
 
 
 def test_cli_batch_combine_into_epub(tmp_path, monkeypatch):
-    # Create two local audio placeholders
+    # Create two local audio placeholders (distinct audio, distinct cache keys)
     a1 = tmp_path / "a1.wav"
-    a1.write_bytes(b"RIFF..")
+    a1.write_bytes(b"RIFF.1")
     a2 = tmp_path / "a2.wav"
-    a2.write_bytes(b"RIFF..")
+    a2.write_bytes(b"RIFF.2")
     lst = tmp_path / "list.txt"
     lst.write_text(f"{a1}\n{a2}\n", encoding="utf-8")
 
@@ -47,3 +47,33 @@ def test_cli_batch_outputs_to_directory(tmp_path, monkeypatch):
     # Expect per-item outputs in directory
     assert (out_dir / "a1.txt").exists()
     assert (out_dir / "a2.txt").exists()
+
+
+def test_cli_batch_reuses_cached_transcripts(tmp_path, monkeypatch):
+    a1 = tmp_path / "a1.wav"
+    a1.write_bytes(b"RIFF..")
+    lst = tmp_path / "list.txt"
+    lst.write_text(f"{a1}\n", encoding="utf-8")
+    monkeypatch.setattr(
+        "podcast_transcriber.utils.downloader.ensure_local_audio",
+        lambda s: str(Path(s)),
+    )
+    calls = []
+
+    class CountingService(DummyService):
+        def transcribe(self, audio_path: str, language=None) -> str:
+            calls.append(audio_path)
+            return super().transcribe(audio_path, language)
+
+    monkeypatch.setattr(
+        "podcast_transcriber.services.get_service", lambda name: CountingService()
+    )
+    base = ["--service", "whisper", "--input-file", str(lst)]
+    base += ["--cache-dir", str(tmp_path / "cache")]
+    # A new output format for the same audio does not transcribe again
+    assert cli.main(base + ["--output", str(tmp_path / "o1"), "--format", "txt"]) == 0
+    assert cli.main(base + ["--output", str(tmp_path / "o2"), "--format", "md"]) == 0
+    assert len(calls) == 1
+    assert "BATCH:a1" in (tmp_path / "o2" / "a1.md").read_text(encoding="utf-8")
+    assert cli.main(base + ["--output", str(tmp_path / "o3"), "--no-cache"]) == 0
+    assert len(calls) == 2
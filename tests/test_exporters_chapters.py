@@ -0,0 +1,85 @@
+import zipfile
+
+from podcast_transcriber.exporters import chapters as chapters_mod
+from podcast_transcriber.exporters.chapters import (
+    ENV_CHAPTER_CACHE,
+    ChapterCache,
+    get_chapter_cache,
+    render_chapter,
+    render_chapters,
+)
+from podcast_transcriber.exporters.exporter import export_book
+
+CHAPTERS = [
+    {"title": f"Ep <{i}>", "text": f"Para {i}\nline\n\nNext {i}", "start": i * 60.0}
+    for i in range(6)
+]
+
+
+def test_pool_keeps_reading_order():
+    inline = list(render_chapters(CHAPTERS, workers=1))
+    assert list(render_chapters(CHAPTERS, workers=2)) == inline
+    assert inline[0] == render_chapter(CHAPTERS[0], 1)
+    assert inline[2].startswith("<h1>Ep &lt;2&gt;</h1>\n<p class='chapter-time'>")
+    assert "<p>Para 2<br/>line</p>\n<p>Next 2</p>" in inline[2]
+
+
+def test_cache_renders_only_new_chapters(tmp_path, monkeypatch):
+    rendered = []
+    real = chapters_mod._render_job
+
+    def counting(job):
+        rendered.append(job[1])
+        return real(job)
+
+    monkeypatch.setattr(chapters_mod, "_render_job", counting)
+    cache = ChapterCache(tmp_path)
+    first = list(render_chapters(CHAPTERS[:4], workers=1, cache=cache))
+    assert rendered == [1, 2, 3, 4]
+    rendered.clear()
+    again = list(render_chapters(CHAPTERS, workers=1, cache=cache))
+    assert rendered == [5, 6] and again[:4] == first
+
+
+def test_export_book_output_matches_with_pool_and_cache(tmp_path):
+    def chapter_files(path):
+        with zipfile.ZipFile(path) as zf:
+            names = sorted(n for n in zf.namelist() if "chapter_" in n)
+            return [zf.read(n) for n in names]
+
+    base, other = tmp_path / "a.epub", tmp_path / "b.epub"
+    export_book(CHAPTERS, str(base), "epub", epub_writer="native", render_workers=1)
+    export_book(
+        CHAPTERS,
+        str(other),
+        "epub",
+        epub_writer="native",
+        render_workers=2,
+        chapter_cache=str(tmp_path / "cache"),
+    )
+    assert chapter_files(other) == chapter_files(base)
+    assert len(list((tmp_path / "cache").rglob("*.xhtml"))) == len(CHAPTERS)
+
+
+def test_cache_setting_from_env(tmp_path, monkeypatch):
+    monkeypatch.delenv(ENV_CHAPTER_CACHE, raising=False)
+    assert get_chapter_cache() is None
+    monkeypatch.setenv(ENV_CHAPTER_CACHE, str(tmp_path))
+    assert get_chapter_cache().root == tmp_path
+    monkeypatch.setenv(ENV_CHAPTER_CACHE, "1")
+    assert get_chapter_cache().root.name == "chapters"
+    assert get_chapter_cache(False) is None
+
+
+def test_fully_cached_book_starts_no_pool(tmp_path, monkeypatch):
+    cache = ChapterCache(tmp_path)
+    first = list(render_chapters(CHAPTERS, workers=1, cache=cache))
+
+    def no_pool(*a, **kw):
+        raise AssertionError("pool started for cached chapters")
+
+    monkeypatch.setattr(chapters_mod, "ProcessPoolExecutor", no_pool)
+    assert list(render_chapters(CHAPTERS, workers=4, cache=cache)) == first
+    # The pool is sized for the misses only: one new chapter renders inline
+    extra = [*CHAPTERS, {"title": "New", "text": "Fresh"}]
+    assert list(render_chapters(extra, workers=4, cache=cache))[:-1] == first
@@ -0,0 +1,105 @@
+import sys
+import zipfile
+
+from lxml import etree
+
+from podcast_transcriber.exporters.epub_writer import (
+    ENV_EPUB_WRITER,
+    EpubWriter,
+    resolve_writer,
+)
+from podcast_transcriber.exporters.exporter import export_book, export_transcript
+
+OPF_NS = {"opf": "http://www.idpf.org/2007/opf"}
+
+
+def test_native_book_is_a_valid_epub(tmp_path):
+    out = tmp_path / "book.epub"
+    chapters = [
+        {"title": "Intro & <hello>", "text": "First para.\n\nSecond", "start": 0.0},
+        {"title": "Main", "text": "Body text", "start": 65.0, "end": 120.0},
+    ]
+    export_book(
+        chapters,
+        str(out),
+        "epub",
+        title="Show",
+        author="Host",
+        cover_image_bytes=b"\x89PNG\r\n\x1a\n" + b"0" * 16,
+        metadata={"language": "sv", "description": "Desc"},
+        epub_writer="native",
+    )
+    with zipfile.ZipFile(out) as zf:
+        first = zf.infolist()[0]
+        assert first.filename == "mimetype"
+        assert first.compress_type == zipfile.ZIP_STORED
+        assert zf.read("mimetype") == b"application/epub+zip"
+        names = set(zf.namelist())
+        assert "META-INF/container.xml" in names
+        # Every XML part parses
+        for name in names:
+            if name.endswith((".xhtml", ".opf", ".ncx", ".xml")):
+                etree.fromstring(zf.read(name))
+        opf = etree.fromstring(zf.read("EPUB/content.opf"))
+        nav = zf.read("EPUB/nav.xhtml").decode("utf-8")
+        chapter = zf.read("EPUB/chapter_1.xhtml").decode("utf-8")
+    (cover,) = opf.xpath(
+        "//opf:item[@properties='cover-image']/@href", namespaces=OPF_NS
+    )
+    assert f"EPUB/{cover}" in names
+    spine = opf.xpath("//opf:itemref/@idref", namespaces=OPF_NS)
+    assert spine[:2] == ["cover", "nav"] and len(spine) == 4
+    assert "00:00:00 Intro &amp; &lt;hello&gt;" in nav and "00:01:05 Main" in nav
+    assert "<p>First para.</p>" in chapter and "<p>Second</p>" in chapter
+
+
+def test_native_transcript_splits_segments(tmp_path):
+    out = tmp_path / "t.epub"
+    segments = [
+        {"start": 0.0, "end": 1.0, "text": "a" * 30},
+        {"start": 1.0, "end": 2.0, "text": "b" * 30},
+    ]
+    export_transcript(
+        "x",
+        str(out),
+        "epub",
+        title="T",
+        segments=segments,
+        epub_writer="native",
+        auto_toc=True,
+    )
+    with zipfile.ZipFile(out) as zf:
+        assert b"aaaa" in zf.read("EPUB/section_1.xhtml")
+        assert b"Section 1 (00:00:00)" in zf.read("EPUB/nav.xhtml")
+
+
+def test_resolve_writer_falls_back_without_ebooklib(monkeypatch):
+    monkeypatch.delenv(ENV_EPUB_WRITER, raising=False)
+    monkeypatch.setitem(sys.modules, "ebooklib", None)
+    assert resolve_writer() == "native"
+    assert resolve_writer("ebooklib") == "native"
+    monkeypatch.setenv(ENV_EPUB_WRITER, "native")
+    monkeypatch.delitem(sys.modules, "ebooklib")
+    assert resolve_writer() == "native"
+
+
+def test_failed_write_leaves_destination_untouched(tmp_path):
+    out = tmp_path / "book.epub"
+    out.write_bytes(b"previous book")
+
+    def body():
+        yield "<p>partial</p>"
+        raise RuntimeError("render failed")
+
+    try:
+        with EpubWriter(str(out), "T") as book:
+            book.add_chapter("One", body())
+    except RuntimeError:
+        pass
+    assert out.read_bytes() == b"previous book"
+    assert [p.name for p in tmp_path.iterdir()] == ["book.epub"]
+    # A successful write replaces it atomically
+    with EpubWriter(str(out), "T") as book:
+        book.add_chapter("One", ["<p>ok</p>"])
+    assert zipfile.is_zipfile(out)
+    assert [p.name for p in tmp_path.iterdir()] == ["book.epub"]
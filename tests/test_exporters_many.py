@@ -0,0 +1,123 @@
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+from podcast_transcriber.exporters import exporter as ex
+from podcast_transcriber.exporters.rendered import RenderedDocument
+from podcast_transcriber.utils import covers
+
+
+def _fake_epub(monkeypatch, seen):
+    class FakeBook:
+        def __init__(self):
+            self.items = []
+
+        def set_title(self, t):
+            pass
+
+        def add_author(self, a):
+            pass
+
+        def set_cover(self, name, data):
+            seen["cover"] = (name, data)
+
+        def add_item(self, item):
+            self.items.append(item)
+
+    class FakeHtml:
+        def __init__(self, title, file_name, lang):
+            self.title, self.file_name, self.content = title, file_name, ""
+
+    def write_epub(path, book):
+        seen["html"] = [it.content for it in book.items if isinstance(it, FakeHtml)]
+        Path(path).write_bytes(b"EPUB")
+
+    fake = types.SimpleNamespace(
+        EpubBook=FakeBook,
+        EpubHtml=FakeHtml,
+        EpubNav=object,
+        EpubNcx=object,
+        write_epub=write_epub,
+    )
+    monkeypatch.setitem(sys.modules, "ebooklib", types.SimpleNamespace(epub=fake))
+    monkeypatch.setitem(sys.modules, "ebooklib.epub", fake)
+
+
+def test_rendered_document_pieces():
+    doc = RenderedDocument("a <b>\nc\n\n d ", segments=[{"start": 1.5, "text": "x"}])
+    assert doc.paragraphs == ["a <b>\nc", "d"]
+    assert doc.html_paragraphs == ["<p>a &lt;b&gt;<br/>c</p>", "<p> d </p>"]
+    assert doc.toc == ["[00:00:01,500] x"]
+    assert RenderedDocument("t").cover is None
+
+
+def test_export_many_shares_one_build(tmp_path, monkeypatch):
+    seen = {}
+    _fake_epub(monkeypatch, seen)
+    cover = tmp_path / "c.jpg"
+    cover.write_bytes(b"JPG")
+    calls = []
+    monkeypatch.setattr(
+        covers, "resize_jpeg", lambda data, size, q: calls.append(size) or data
+    )
+    targets = [
+        ("md", str(tmp_path / "o.md"), {"title": "T"}),
+        ("epub", str(tmp_path / "o.epub"), {"title": "T"}),
+        ("txt", str(tmp_path / "o.txt"), {}),
+        ("srt", str(tmp_path / "o.srt"), {}),
+        ("nope", str(tmp_path / "o.nope"), {}),
+    ]
+    errors = ex.export_many(
+        "Hello <you>\n\nWorld", targets, cover_image=str(cover), max_workers=3
+    )
+    assert errors[:4] == [None] * 4
+    assert isinstance(errors[4], ValueError)  # one failure does not stop the rest
+    assert len(calls) == 1  # cover prepared once
+    assert seen["cover"][0] == "c.jpg"
+    assert "<p>Hello &lt;you&gt;</p>" in seen["html"][0]
+    assert (tmp_path / "o.md").read_text(encoding="utf-8").startswith("# T")
+    assert (tmp_path / "o.txt").read_text(encoding="utf-8") == "Hello <you>\n\nWorld"
+
+
+def test_kindle_converts_the_epub_target(tmp_path, monkeypatch):
+    _fake_epub(monkeypatch, {})
+    monkeypatch.setattr(ex.shutil, "which", lambda name: "/bin/ebook-convert")
+    run = mock.MagicMock(
+        side_effect=lambda cmd, check: Path(cmd[2]).write_bytes(b"MOBI")
+    )
+    monkeypatch.setattr(ex.subprocess, "run", run)
+    epub_path = str(tmp_path / "o.epub")
+    targets = [
+        ("mobi", str(tmp_path / "o.mobi"), {}),
+        ("epub", epub_path, {}),
+    ]
+    assert ex.export_many("Hi", targets, max_workers=1) == [None, None]
+    assert run.call_args.args[0][1] == epub_path
+
+
+def test_kindle_with_own_title_builds_its_own_epub(tmp_path, monkeypatch):
+    seen = {}
+    _fake_epub(monkeypatch, seen)
+    titles = []
+    monkeypatch.setattr(ex.shutil, "which", lambda name: "/bin/ebook-convert")
+    run = mock.MagicMock(
+        side_effect=lambda cmd, check: Path(cmd[2]).write_bytes(b"MOBI")
+    )
+    monkeypatch.setattr(ex.subprocess, "run", run)
+    real = ex._write_epub
+    monkeypatch.setattr(
+        ex,
+        "_write_epub",
+        lambda out, sections, title, **kw: (
+            titles.append(title) or real(out, sections, title, **kw)
+        ),
+    )
+    epub_path = str(tmp_path / "o.epub")
+    targets = [
+        ("epub", epub_path, {"title": "Book"}),
+        ("azw3", str(tmp_path / "o.azw3"), {"title": "Kindle edition"}),
+    ]
+    assert ex.export_many("Hi", targets, max_workers=1) == [None, None]
+    assert run.call_args.args[0][1] != epub_path
+    assert sorted(titles) == ["Book", "Kindle edition"]
@@ -0,0 +1,77 @@
+import json
+
+from podcast_transcriber.exporters.exporter import (
+    SUPPORTED_FORMATS,
+    export_transcript,
+    infer_format_from_path,
+)
+
+SEGS = [
+    {"start": 0.0, "end": 1.5, "text": " Hej på dig ", "speaker": "A"},
+    {"start": 1.5, "end": 3.25, "text": "World"},
+    {"start": 4.0, "text": "no end, skipped"},
+]
+WORDS = [{"start": 0.0, "end": 0.4, "word": "Hej"}]
+
+
+def _gen(items):
+    yield from items
+
+
+def test_srt_and_vtt_stream_from_iterators(tmp_path):
+    srt, vtt = tmp_path / "t.srt", tmp_path / "t.vtt"
+    export_transcript("x", str(srt), "srt", segments=_gen(SEGS))
+    export_transcript("x", str(vtt), "vtt", segments=_gen(SEGS))
+    assert srt.read_text(encoding="utf-8") == (
+        "1\n00:00:00,000 --> 00:00:01,500\nA: Hej på dig\n\n"
+        "2\n00:00:01,500 --> 00:00:03,250\nWorld\n"
+    )
+    assert vtt.read_text(encoding="utf-8") == (
+        "WEBVTT\n\n00:00:00.000 --> 00:00:01.500\nA: Hej på dig\n\n"
+        "00:00:01.500 --> 00:00:03.250\nWorld\n"
+    )
+
+
+def test_json_matches_dumped_payload(tmp_path):
+    out = tmp_path / "t.json"
+    meta = {"language": "sv", "tags": ["a"]}
+    export_transcript(
+        "Hej\nWorld",
+        str(out),
+        "json",
+        title="T",
+        segments=_gen(SEGS),
+        words=_gen(WORDS),
+        metadata=meta,
+    )
+    expected = {
+        "title": "T",
+        "author": None,
+        "text": "Hej\nWorld",
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": "Hej på dig", "speaker": "A"},
+            {"start": 1.5, "end": 3.25, "text": "World", "speaker": None},
+        ],
+        "words": WORDS,
+        "source": meta,
+    }
+    assert out.read_text(encoding="utf-8") == json.dumps(
+        expected, ensure_ascii=False, indent=2
+    )
+    # No segments and no words: single fallback segment, no "words" key
+    export_transcript("Only text", str(out), "json", words=_gen([]))
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["segments"] == [{"start": 0.0, "end": 0.0, "text": "Only text"}]
+    assert "words" not in data
+
+
+def test_jsonl_emits_one_record_per_line(tmp_path):
+    out = tmp_path / "t.jsonl"
+    assert "jsonl" in SUPPORTED_FORMATS and infer_format_from_path(str(out)) == "jsonl"
+    export_transcript(
+        "x", str(out), "jsonl", title="T", segments=_gen(SEGS), words=_gen(WORDS)
+    )
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["type"] for r in rows] == ["transcript", "segment", "segment", "word"]
+    assert rows[0]["title"] == "T" and rows[1]["text"] == "Hej på dig"
+    assert rows[3]["word"] == "Hej"
@@ -0,0 +1,75 @@
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from podcast_transcriber.nlp import analyze as an  # noqa: E402
+from podcast_transcriber.nlp import document  # noqa: E402
+
+TEXT = " ".join(
+    ["The rocket launch put a satellite into orbit today."] * 4
+    + ["Bake the bread with flour, butter and a hot oven."] * 4
+    + ["Stock markets fell as bond interest rates climbed."] * 4
+)
+
+
+def test_text_is_split_and_tokenized_once(monkeypatch):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    counts = {"split": 0, "scan": 0}
+    split, scan = document.split_sentences, document.tokenize
+
+    def counting_split(text):
+        counts["split"] += 1
+        return split(text)
+
+    def counting_scan(text):
+        counts["scan"] += 1
+        return scan(text)
+
+    monkeypatch.setattr(document, "split_sentences", counting_split)
+    monkeypatch.setattr(document, "tokenize", counting_scan)
+    res = an.analyze(TEXT, summary=True, semantic=True, takeaways=True)
+    assert counts == {"split": 1, "scan": 1}
+    assert res["summary"] and res["takeaways"]
+    assert len(res["chapters"]) == len(res["topics"]) >= 2
+    assert set(res["timings"]) == {
+        "tokenize",
+        "summary",
+        "topics",
+        "chapters",
+        "takeaways",
+    }
+
+
+def test_semantic_topics_are_not_overridden_by_fallback_chapter():
+    res = an.analyze(
+        "Body text.",
+        semantic=True,
+        segment=lambda text: [
+            {"title": "C1", "text": "A"},
+            {"title": "C2", "text": "B"},
+        ],
+    )
+    assert [c["title"] for c in res["chapters"]] == ["C1", "C2"]
+
+
+def test_failed_segmentation_falls_back_to_minute_buckets():
+    def boom(text):
+        raise RuntimeError("no model")
+
+    segs = [
+        {"start": 0.0, "end": 40.0, "text": "A"},
+        {"start": 40.0, "end": 85.0, "text": "B"},
+        {"start": 85.0, "end": 100.0, "text": "C"},
+    ]
+    res = an.analyze("A B C", segs, semantic=True, segment=boom, chapter_minutes=1)
+    assert [c["text"] for c in res["chapters"]] == ["A B", "C"]
+    assert res["topics"] is None
+
+
+def test_single_chapter_uses_title_and_normalized_text():
+    res = an.analyze("Hello   world.\n\n\n\nBye.", title="Ep 1")
+    assert res["chapters"] == [{"title": "Ep 1", "text": "Hello world.\n\nBye."}]
+    assert res["summary"] is None and res["takeaways"] is None
+    assert set(res["timings"]) == {"tokenize", "chapters"}
@@ -0,0 +1,93 @@
+from podcast_transcriber.exporters.exporter import export_book
+from podcast_transcriber.kindle.epub_builder import Chapter
+from podcast_transcriber.nlp.chapterize import chapter_span, chapterize, format_clock
+
+SEGS = [
+    {"start": 0.0, "end": 40.0, "text": "A", "speaker": "S1"},
+    {"start": 40.0, "end": 85.0, "text": "B", "speaker": "S1"},
+    {"start": 85.0, "end": 100.0, "text": "C", "speaker": "S2"},
+    {"start": 100.0, "end": 130.0, "text": " ", "speaker": "S2"},
+    {"start": 130.0, "end": 150.0, "text": "D", "speaker": "S2"},
+]
+
+
+def test_time_policy_keeps_start_and_end():
+    chapters = chapterize(SEGS, minutes=1)
+    assert [(c["text"], c["start"], c["end"]) for c in chapters] == [
+        ("A B", 0.0, 85.0),
+        ("C D", 85.0, 150.0),
+    ]
+    assert [c["title"] for c in chapters] == ["Chapter 1", "Chapter 2"]
+
+
+def test_char_budget_policy():
+    chapters = chapterize(SEGS, max_chars=1)
+    assert [c["text"] for c in chapters] == ["A B", "C D"]
+
+
+def test_speaker_change_policy_and_title():
+    chapters = chapterize(SEGS, speaker_change=True, title="{n}. {speaker}")
+    assert [(c["title"], c["text"]) for c in chapters] == [
+        ("1. S1", "A B"),
+        ("2. S2", "C D"),
+    ]
+    assert chapters[1]["speaker"] == "S2" and chapters[1]["start"] == 85.0
+
+
+def test_empty_input_and_clock_labels():
+    assert chapterize([], minutes=10) == []
+    assert format_clock(3725.9) == "01:02:05"
+    assert chapter_span({"start": 0.0, "end": 90.0}) == "00:00:00 - 00:01:30"
+    assert chapter_span({"title": "x"}) is None
+
+
+def test_book_exports_chapter_timings(tmp_path):
+    chapters = [
+        Chapter("Intro", "Hello").as_dict(),
+        Chapter("Part", "World", 60.0, 125.0).as_dict(),
+    ]
+    out = tmp_path / "book.md"
+    export_book(chapters, str(out), "md", title="T")
+    md = out.read_text(encoding="utf-8")
+    assert "- 00:01:00 Part" in md  # contents list of timed chapters
+    assert "_00:01:00 - 00:02:05_" in md
+    assert "00:00:00 Intro" not in md  # untimed chapters stay out of it
+
+
+def test_book_epub_navigation_uses_start_times(tmp_path, monkeypatch):
+    import sys
+    import types
+
+    written = {}
+
+    class FakeBook:
+        def __init__(self):
+            self.items = []
+
+        def set_title(self, t):
+            pass
+
+        def add_item(self, item):
+            self.items.append(item)
+
+    class FakeHtml:
+        def __init__(self, title, file_name, lang):
+            self.title, self.file_name, self.content = title, file_name, ""
+
+    def write_epub(path, book):
+        written["toc"] = [(c.title, c.content) for c in book.toc]
+
+    fake = types.SimpleNamespace(
+        EpubBook=FakeBook,
+        EpubHtml=FakeHtml,
+        EpubNav=object,
+        EpubNcx=object,
+        write_epub=write_epub,
+    )
+    monkeypatch.setitem(sys.modules, "ebooklib", types.SimpleNamespace(epub=fake))
+    monkeypatch.setitem(sys.modules, "ebooklib.epub", fake)
+    chapters = chapterize(SEGS, minutes=1)
+    export_book(chapters, str(tmp_path / "b.epub"), "epub", title="T")
+    titles = [t for t, _ in written["toc"]]
+    assert titles == ["00:00:00 Chapter 1", "00:01:25 Chapter 2"]
+    assert "00:01:25 - 00:02:30" in written["toc"][1][1]
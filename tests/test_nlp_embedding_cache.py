@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from podcast_transcriber.nlp import embedding_cache as ec  # noqa: E402
+
+
+def _encoder(calls):
+    def encode(sents):
+        calls.append(list(sents))
+        return np.asarray([[len(s), 1.0, 0.5] for s in sents], dtype=np.float32)
+
+    return encode
+
+
+def test_only_unseen_sentences_are_encoded(tmp_path):
+    cache = ec.EmbeddingCache(tmp_path, "fake/model")
+    calls = []
+    first = cache.encode(["Hello there.", "Bye."], _encoder(calls))
+    second = cache.encode(["Bye.", "  Hello   there. ", "New one."], _encoder(calls))
+    assert calls == [["Hello there.", "Bye."], ["New one."]]
+    assert first.dtype == np.float32 and first.shape == (2, 3)
+    # Whitespace-normalized sentences share a row
+    assert second[1].tolist() == first[0].tolist()
+    assert second[0].tolist() == first[1].tolist()
+    assert len(cache) == 3
+
+
+def test_cache_persists_across_instances_and_dedupes(tmp_path):
+    calls = []
+    ec.EmbeddingCache(tmp_path, "m").encode(["A.", "A.", "B."], _encoder(calls))
+    assert calls == [["A.", "B."]]
+    again = ec.EmbeddingCache(tmp_path, "m")
+    out = again.encode(["B.", "A."], _encoder(calls))
+    assert len(calls) == 1
+    assert out[:, 0].tolist() == [2.0, 2.0]
+    vectors = next(tmp_path.glob("m-*/vectors.f16"))
+    assert vectors.stat().st_size == 2 * 3 * 2  # two float16 rows of dim 3
+
+
+def test_models_are_kept_apart_and_dim_checked(tmp_path):
+    calls = []
+    ec.EmbeddingCache(tmp_path, "a").encode(["X."], _encoder(calls))
+    ec.EmbeddingCache(tmp_path, "b").encode(["X."], _encoder(calls))
+    assert len(calls) == 2
+    with pytest.raises(ValueError):
+        ec.EmbeddingCache(tmp_path, "a").add(["k"], np.zeros((1, 4)))
+
+
+def test_partial_row_from_interrupted_append_is_dropped(tmp_path):
+    cache = ec.EmbeddingCache(tmp_path, "m")
+    calls = []
+    cache.encode(["A."], _encoder(calls))
+    vectors = cache.root / ec.VECTORS_NAME
+    with open(vectors, "ab") as fh:
+        fh.write(b"\x00\x01")  # half-written row
+    out = cache.encode(["B.", "A."], _encoder(calls))
+    assert out[:, 0].tolist() == [2.0, 2.0]
+    assert vectors.stat().st_size == 2 * 3 * 2
+
+
+def test_open_cache_defaults_under_transcript_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_TRANSCRIBER_CACHE", str(tmp_path))
+    cache = ec.open_cache("m")
+    assert cache is ec.open_cache("m")
+    assert cache.root.parent == tmp_path / "embeddings"
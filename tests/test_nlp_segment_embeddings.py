@@ -0,0 +1,71 @@
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from podcast_transcriber.nlp import segment_topics as st  # noqa: E402
+
+# Sentences about cats point one way, sentences about rockets another
+VECTORS = {"cat": [1.0, 0.0], "rocket": [0.0, 1.0]}
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    calls = {"init": 0, "batch_sizes": []}
+
+    class FakeModel:
+        def __init__(self, name):
+            calls["init"] += 1
+            self.name = name
+
+        def encode(self, sents, batch_size=32, **kwargs):
+            calls["batch_sizes"].append(batch_size)
+            rows = []
+            for s in sents:
+                key = "cat" if "cat" in s.lower() else "rocket"
+                rows.append([v * 3 for v in VECTORS[key]])  # not unit length
+            return np.asarray(rows)
+
+    mod = types.ModuleType("sentence_transformers")
+    mod.SentenceTransformer = FakeModel
+    monkeypatch.setitem(sys.modules, "sentence_transformers", mod)
+    monkeypatch.setattr(st, "_models", {})
+    return calls
+
+
+def test_model_loaded_once_and_batch_size_passed(fake_st):
+    text = "Cats purr. The cat sleeps. Rockets launch. A rocket flies."
+    first = st.segment_with_embeddings(text, batch_size=8)
+    second = st.segment_with_embeddings(text)
+    assert fake_st["init"] == 1
+    # The second run is served from the embedding cache
+    assert fake_st["batch_sizes"] == [8]
+    assert [c["text"] for c in first] == [
+        "Cats purr. The cat sleeps.",
+        "Rockets launch. A rocket flies.",
+    ]
+    assert first == second
+
+
+def test_model_reused_without_embedding_cache(fake_st, monkeypatch):
+    monkeypatch.setenv("PODCAST_TRANSCRIBER_EMBEDDING_CACHE", "0")
+    text = "Cats purr. Rockets launch."
+    st.segment_with_embeddings(text, batch_size=8)
+    st.segment_with_embeddings(text)
+    assert fake_st["init"] == 1
+    assert fake_st["batch_sizes"] == [8, st.DEFAULT_BATCH_SIZE]
+
+
+def test_long_runs_split_on_chunk_budget(fake_st):
+    text = " ".join(["The cat naps."] * 6)
+    chunks = st.segment_with_embeddings(text, max_chunk_chars=20)
+    assert len(chunks) == 3
+    assert [c["title"] for c in chunks] == ["Topic 1", "Topic 2", "Topic 3"]
+    assert " ".join(c["text"] for c in chunks) == text
+
+
+def test_adjacent_similarities_normalizes_rows():
+    sims = st.adjacent_similarities([[2.0, 0.0], [5.0, 0.0], [0.0, 1.0]])
+    assert sims.tolist() == pytest.approx([1.0, 0.0])
@@ -0,0 +1,82 @@
+import sys
+import types
+
+from podcast_transcriber.nlp import segment_topics as st
+
+
+class _Span:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Doc:
+    def __init__(self, text):
+        # Treat capitalized words as noun chunks
+        self.noun_chunks = [
+            _Span(w.strip(".,")) for w in text.split() if w[0].isupper()
+        ]
+
+
+class _NLP:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def has_pipe(self, name):
+        return name == "tagger"
+
+    def pipe(self, texts, batch_size=1, n_process=1):
+        texts = list(texts)
+        self.calls["pipe"].append((texts, batch_size, n_process))
+        return (_Doc(t) for t in texts)
+
+
+def _fake_spacy(monkeypatch, fail=False):
+    calls = {"load": [], "pipe": []}
+    mod = types.ModuleType("spacy")
+
+    def load(name, exclude=()):
+        calls["load"].append((name, tuple(exclude)))
+        if fail:
+            raise OSError("model not installed")
+        return _NLP(calls)
+
+    mod.load = load
+    monkeypatch.setitem(sys.modules, "spacy", mod)
+    monkeypatch.setattr(st, "_spacy_pipelines", {})
+    return calls
+
+
+def test_pipeline_is_loaded_once_per_language(monkeypatch):
+    calls = _fake_spacy(monkeypatch)
+    st.key_takeaways_better("Alpha met Beta.")
+    st.key_takeaways_better("Beta again.")
+    st.key_takeaways_better("Gamma talar.", language="sv-SE")
+    names = [name for name, _ in calls["load"]]
+    assert names == ["en_core_web_sm", "sv_core_news_sm"]
+    assert "ner" in calls["load"][0][1]
+
+
+def test_paragraphs_are_streamed_and_counts_merged(monkeypatch):
+    calls = _fake_spacy(monkeypatch)
+    text = "Alpha and Beta.\n\nAlpha returns.\n\nGamma, Alpha and Beta."
+    kws = st.key_takeaways_better(text, max_points=2, batch_size=4, n_process=2)
+    assert kws == ["alpha", "beta"]
+    ((texts, batch_size, n_process),) = calls["pipe"]
+    assert len(texts) == 3 and (batch_size, n_process) == (4, 2)
+
+
+def test_long_paragraphs_are_cut_at_sentence_ends():
+    para = " ".join(f"Sentence number {i} here." for i in range(50))
+    chunks = list(st._spacy_chunks(para, max_chars=120))
+    assert all(len(c) <= 120 for c in chunks)
+    assert all(c.endswith(".") for c in chunks)
+    assert " ".join(chunks) == para
+
+
+def test_failed_load_is_not_cached(monkeypatch):
+    calls = _fake_spacy(monkeypatch, fail=True)
+    kws = st.key_takeaways_better("OpenAI Research improves Developer Experience.")
+    assert kws  # regex fallback
+    st.key_takeaways_better("Again.")
+    assert len(calls["load"]) == 2
+    assert st._spacy_pipelines == {}
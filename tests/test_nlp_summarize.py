@@ -0,0 +1,67 @@
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from podcast_transcriber.nlp import summarize as sm  # noqa: E402
+from podcast_transcriber.utils.textproc import summarize_text  # noqa: E402
+
+TEXT = (
+    "Welcome back to the show everyone. "
+    "Today the rocket launch put a satellite into orbit. "
+    "The rocket engine burned fuel for the orbit insertion. "
+    "My cat knocked over a plant. "
+    "Engineers watched the satellite reach orbit after launch. "
+    "Yeah. "
+    "Thanks for listening and see you next week."
+)
+
+
+def test_textrank_picks_central_sentences_in_order():
+    out = sm.summarize(TEXT, max_sentences=2)
+    assert out == (
+        "Today the rocket launch put a satellite into orbit. "
+        "Engineers watched the satellite reach orbit after launch."
+    )
+
+
+def test_summarize_text_delegates_and_lead_mode():
+    assert summarize_text(TEXT, max_sentences=2) == sm.summarize(TEXT, 2)
+    assert summarize_text(TEXT, max_sentences=1, method="lead") == (
+        "Welcome back to the show everyone."
+    )
+    with pytest.raises(ValueError):
+        sm.summarize(TEXT, method="bogus")
+
+
+def test_matrix_free_rank_matches_dense_pagerank():
+    rnd = random.Random(7)
+    words = "alpha beta gamma delta epsilon zeta theta kappa lambda sigma".split()
+    sents = [" ".join(rnd.sample(words, 4)) + "." for _ in range(40)]
+    scores = sm.rank(sm._tfidf_operator(sents), len(sents), tol=1e-12)
+    # Same graph built explicitly
+    row, term, size = sm.term_ids(sents)
+    x = np.zeros((len(sents), size))
+    np.add.at(x, (row, term), 1.0)
+    x *= sm.inverse_document_frequency(row, term, len(sents), size)
+    x /= np.linalg.norm(x, axis=1, keepdims=True)
+    s = x @ x.T
+    np.fill_diagonal(s, 0.0)
+    m = s / s.sum(axis=1, keepdims=True)
+    p = np.full(len(sents), 1 / len(sents))
+    for _ in range(500):
+        p = 0.15 / len(sents) + 0.85 * m.T @ p
+    assert scores == pytest.approx(p, abs=1e-8)
+
+
+def test_embedding_mode_uses_given_vectors_and_falls_back(monkeypatch):
+    sents = [f"Sentence number {i} is here." for i in range(6)]
+    vectors = [[1.0, 0.0]] * 4 + [[0.0, 1.0]] * 2
+    out = sm.summarize(
+        "", max_sentences=1, method="embedding", embeddings=vectors, sentences=sents
+    )
+    assert out == sents[0]
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    assert sm.summarize(TEXT, 2, method="embedding") == sm.summarize(TEXT, 2)
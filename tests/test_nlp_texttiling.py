@@ -0,0 +1,73 @@
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from podcast_transcriber.nlp import segment_topics as st  # noqa: E402
+from podcast_transcriber.nlp import texttiling as tt  # noqa: E402
+from podcast_transcriber.nlp.tokenize import split_sentences  # noqa: E402
+
+TOPICS = [
+    "rocket orbit launch satellite astronaut moon mars engine fuel gravity",
+    "recipe oven flour butter sugar garlic onion pasta sauce kitchen",
+    "market stock bond interest inflation budget bank investor price dividend",
+]
+
+
+def _transcript(blocks, per_block=12, seed=3):
+    rnd = random.Random(seed)
+    sents = []
+    for b in range(blocks):
+        words = TOPICS[b % len(TOPICS)].split()
+        for _ in range(per_block):
+            sents.append("We talk about " + " ".join(rnd.sample(words, 4)) + ".")
+    return " ".join(sents)
+
+
+def test_segments_follow_topic_shifts():
+    chunks = tt.segment_texttiling(_transcript(6))
+    sizes = [len(split_sentences(c["text"])) for c in chunks]
+    starts = np.cumsum(sizes)[:-1]
+    assert len(chunks) == 6
+    assert np.abs(starts - np.arange(12, 72, 12)).max() <= 1
+    assert chunks[0]["title"] == "Topic 1"
+
+
+def test_depth_scores_climb_to_peaks():
+    depth = tt.depth_scores([0.9, 0.5, 0.2, 0.6, 0.8, 0.7])
+    # gap 2 sits 0.7 below the left peak and 0.6 below the right one
+    assert depth.tolist() == pytest.approx([0.0, 0.4, 1.3, 0.2, 0.0, 0.1])
+
+
+def test_boundaries_respect_min_sentences():
+    scores = [0.9, 0.1, 0.9, 0.2, 0.9, 0.9, 0.9, 0.9]
+    assert tt.boundaries(scores, min_sentences=1) == [2, 4]
+    assert tt.boundaries(scores, min_sentences=3) == [4]
+
+
+def test_precomputed_vectors_and_chunk_budget():
+    sents = ["a."] * 8 + ["b."] * 8
+    vectors = [[1.0, 0.0]] * 8 + [[0.0, 1.0]] * 8
+    chunks = tt.segment_texttiling(
+        "", vectors=vectors, sentences=sents, smoothing=0, window=3
+    )
+    assert [c["text"].count(".") for c in chunks] == [8, 8]
+    small = tt.segment_texttiling(
+        "", max_chunk_chars=5, vectors=vectors, sentences=sents
+    )
+    assert all(c["text"].count(".") <= 4 for c in small)
+
+
+def test_scores_are_independent_of_slicing(monkeypatch):
+    sents = split_sentences(_transcript(12, per_block=5))
+    whole = tt.gap_scores(sents)
+    monkeypatch.setattr(tt, "_SLICE", 7)
+    assert tt.gap_scores(sents) == pytest.approx(whole)
+
+
+def test_embedding_fallback_uses_texttiling(monkeypatch):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    chunks = st.segment_with_embeddings(_transcript(3))
+    assert len(chunks) == 3
@@ -0,0 +1,45 @@
+import pytest
+
+from podcast_transcriber.nlp.tokenize import split_sentences, tokenize
+
+TRICKY = (
+    "  Hello there, Anna Lindqvist! Is it 3.5 degrees?\n\n"
+    "New paragraph without an end\n \n"
+    "OpenAI Research and Chat Completions improve Developer Experience. "
+    "It's done... Really?! Yes.  "
+)
+
+
+def test_single_scan_streams():
+    tokens = tokenize(TRICKY)
+    assert tokens.phrases == [
+        "Hello",
+        "Anna Lindqvist",
+        "Is",
+        "New",
+        "Research",
+        "Chat Completions",
+        "Developer Experience",
+        "Really",
+        "Yes",
+    ]
+    assert "OpenAI" in tokens.words and "It's" in tokens.words
+    assert tokens.words[:4] == ["Hello", "there", "Anna", "Lindqvist"]
+
+
+def test_sentence_rows_match_split_sentences():
+    tokens = tokenize(TRICKY)
+    sents = split_sentences(TRICKY)
+    assert tokens.sentences == len(sents)
+    for word, row in zip(tokens.words, tokens.rows):
+        assert word in sents[row]
+
+
+def test_document_terms_match_per_sentence_terms():
+    np = pytest.importorskip("numpy")
+    from podcast_transcriber.nlp.document import Document
+    from podcast_transcriber.nlp.texttiling import term_ids
+
+    doc = Document(TRICKY)
+    for fused, per_sentence in zip(doc.terms, term_ids(split_sentences(TRICKY))):
+        assert np.array_equal(fused, per_sentence)
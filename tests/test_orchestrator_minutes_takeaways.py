@@ -64,3 +64,25 @@ def test_orchestrator_takeaways(monkeypatch, tmp_path):
         nlp_cfg={"takeaways": True},
     )
     assert res.get("takeaways") == ["K1", "K2"]
+
+
+def test_orchestrator_unknown_summary_method_falls_back(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    orch = importlib.import_module("podcast_transcriber.orchestrator")
+    monkeypatch.setattr(orch, "pick_quality_settings", lambda q: {"summarize": True})
+    monkeypatch.setattr(
+        "podcast_transcriber.services.get_service", lambda name: SegService(None)
+    )
+    monkeypatch.setattr(
+        "podcast_transcriber.orchestrator.ensure_local_audio",
+        lambda s: str(tmp_path / "a.wav"),
+    )
+    res = orch._process_episode(
+        {"source": str(tmp_path / "a.wav"), "title": "T"},
+        "whisper",
+        "standard",
+        None,
+        nlp_cfg={"summary": "textrnk"},
+    )
+    assert res["summary"] is not None
+    assert "Unknown nlp.summary 'textrnk'" in capsys.readouterr().err
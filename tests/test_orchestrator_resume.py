@@ -0,0 +1,108 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+class CountingService:
+    last_segments = None
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def transcribe(self, audio_path, language=None):
+        self.calls.append(str(audio_path))
+        return f"Text {audio_path}"
+
+
+def test_cmd_process_resume_skips_finished_stages(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    orch = importlib.import_module("podcast_transcriber.orchestrator")
+    transcribed = []
+    monkeypatch.setattr(
+        "podcast_transcriber.services.get_service",
+        lambda name: CountingService(transcribed),
+    )
+    fetched = []
+    monkeypatch.setattr(orch, "ensure_local_audio", lambda s: fetched.append(s) or s)
+    exported = []
+    fail_on = {"b"}
+
+    def fake_export_book(chapters, out_path, **kwargs):
+        stem = Path(out_path).stem
+        if stem in fail_on:
+            raise RuntimeError("disk full")
+        Path(out_path).write_text("epub", encoding="utf-8")
+        exported.append(stem)
+
+    monkeypatch.setattr(orch, "export_book", fake_export_book)
+
+    from podcast_transcriber.storage.state import StateStore
+
+    out_dir = tmp_path / "out"
+    cfg = {"service": "dummy", "quality": "quick", "output_dir": str(out_dir)}
+    job = StateStore().create_job_with_episodes(
+        cfg,
+        [
+            {"title": n.upper(), "slug": n, "source": n, "guid": f"g-{n}"}
+            for n in ("a", "b", "c")
+        ],
+    )
+    args = type("A", (), {"job_id": job["id"], "semantic": False})()
+    with pytest.raises(RuntimeError, match="disk full"):
+        orch.cmd_process(args)
+    assert transcribed == ["a", "b"] and exported == ["a"]
+
+    # Episode a is fully done, b failed in export, c never started
+    cps = StateStore().get_checkpoints(job["id"])
+    assert set(cps["g-a"]) == {"downloaded", "transcribed", "analyzed", "export:epub"}
+    assert set(cps["g-b"]) == {"downloaded", "transcribed", "analyzed"}
+    assert "g-c" not in cps
+
+    fail_on.clear()
+    transcribed.clear()
+    fetched.clear()
+    args.resume = True
+    assert orch.cmd_process(args) == 0
+    assert transcribed == ["c"]
+    assert fetched == ["c"]
+    assert exported == ["a", "b", "c"]
+    saved = StateStore().get_job(job["id"])
+    assert saved["status"] == "processed"
+    assert [a["output"] for a in saved["artifacts"]] == [
+        str(out_dir / f"{n}.epub") for n in ("a", "b", "c")
+    ]
+
+    # A run without --resume starts over; transcripts come from the cache
+    transcribed.clear()
+    exported.clear()
+    args.resume = False
+    assert orch.cmd_process(args) == 0
+    assert transcribed == [] and exported == ["a", "b", "c"]
+    args.no_cache = True
+    assert orch.cmd_process(args) == 0
+    assert transcribed == ["a", "b", "c"]
+
+
+def test_state_store_checkpoint_payloads(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    from podcast_transcriber.storage.state import StateStore
+
+    store = StateStore(journal=True)
+    job = store.create_job({"service": "dummy"})
+    store.save_checkpoint(job["id"], "ep-1", "downloaded", {"local_path": "/x"})
+    store.save_checkpoint(
+        job["id"], "ep-1", "transcribed", payload={"text": "hi", "segments": []}
+    )
+    store.close()
+
+    fresh = StateStore(journal=True)
+    cps = fresh.get_checkpoints(job["id"])["ep-1"]
+    assert cps["downloaded"]["local_path"] == "/x"
+    payload = fresh.load_checkpoint_payload(job["id"], cps["transcribed"])
+    assert payload == {"text": "hi", "segments": []}
+
+    fresh.clear_checkpoints(job["id"])
+    assert fresh.get_checkpoints(job["id"]) == {}
+    assert not (tmp_path / ".state" / "checkpoints" / job["id"]).exists()
+    assert StateStore(journal=True).get_checkpoints(job["id"]) == {}
@@ -37,9 +37,8 @@ def test_process_semantic_true(monkeypatch, tmp_path):
         language=None,
         nlp_cfg={"semantic": True},
     )
-    # Current implementation overrides semantic chapters due to fallback branch;
-    # ensure it still returns a list with at least one chapter.
-    assert isinstance(res["chapters"], list) and len(res["chapters"]) >= 1
+    # Semantic chapters are kept (no longer replaced by the single-chapter fallback)
+    assert [c["title"] for c in res["chapters"]] == ["C1", "C2"]
 
 
 def test_process_semantic_false_default_single(monkeypatch, tmp_path):
@@ -0,0 +1,95 @@
+import importlib
+import time
+
+
+class SlowService:
+    last_segments = None
+
+    def transcribe(self, audio_path, language=None):
+        # Later episodes finish first so completion order != episode order
+        delay = {"a": 0.15, "b": 0.05, "c": 0.0}[str(audio_path)]
+        time.sleep(delay)
+        return f"Text {audio_path}"
+
+
+def test_cmd_process_workers_keep_episode_order(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    orch = importlib.import_module("podcast_transcriber.orchestrator")
+    monkeypatch.setattr(
+        "podcast_transcriber.services.get_service", lambda name: SlowService()
+    )
+    monkeypatch.setattr(orch, "ensure_local_audio", lambda s: s)
+
+    from podcast_transcriber.storage.state import StateStore
+
+    store = StateStore()
+    out_dir = tmp_path / "out"
+    cfg = {
+        "service": "dummy",
+        "quality": "quick",
+        "output_dir": str(out_dir),
+        "workers": 1,
+        "outputs": [{"fmt": "txt"}],
+    }
+    job = store.create_job_with_episodes(
+        cfg,
+        [{"title": n.upper(), "slug": n, "source": n} for n in ("a", "b", "c")],
+    )
+    saves = []
+    real_update = StateStore.update_job
+
+    def spy(self, job_id, mutate):
+        out = real_update(self, job_id, mutate)
+        saves.append([a["output"] for a in out.get("artifacts", [])])
+        return out
+
+    monkeypatch.setattr(StateStore, "update_job", spy)
+
+    # CLI --workers overrides config workers: 1
+    args = type("A", (), {"job_id": job["id"], "semantic": False, "workers": 3})()
+    assert orch.cmd_process(args) == 0
+
+    expected = [str(out_dir / f"{n}.txt") for n in ("a", "b", "c")]
+    saved = StateStore().get_job(job["id"])
+    assert saved["status"] == "processed"
+    assert [a["output"] for a in saved["artifacts"]] == expected
+    # Saved after each episode, then once more when the job completes
+    assert len(saves) == 4 and saves[0] == [expected[2]]
+    assert (out_dir / "b.txt").read_text(encoding="utf-8").find("Text b") >= 0
+
+
+def test_cmd_process_staged_pipeline(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    orch = importlib.import_module("podcast_transcriber.orchestrator")
+    monkeypatch.setattr(
+        "podcast_transcriber.services.get_service", lambda name: SlowService()
+    )
+    fetched = []
+    monkeypatch.setattr(orch, "ensure_local_audio", lambda s: fetched.append(s) or s)
+
+    from podcast_transcriber.storage.state import StateStore
+
+    out_dir = tmp_path / "out"
+    cfg = {
+        "service": "dummy",
+        "quality": "quick",
+        "output_dir": str(out_dir),
+        "pipeline": {"transcribe": 2, "queue_size": 1},
+        "outputs": [{"fmt": "txt"}, {"fmt": "md"}],
+    }
+    job = StateStore().create_job_with_episodes(
+        cfg,
+        [{"title": n.upper(), "slug": n, "source": n} for n in ("a", "b", "c")],
+    )
+    args = type("A", (), {"job_id": job["id"], "semantic": False})()
+    assert orch.cmd_process(args) == 0
+
+    saved = StateStore().get_job(job["id"])
+    assert [a["output"] for a in saved["artifacts"]] == [
+        str(out_dir / f"{n}.{ext}") for n in ("a", "b", "c") for ext in ("txt", "md")
+    ]
+    assert sorted(fetched) == ["a", "b", "c"]  # downloaded once, by the I/O stage
+    stages = saved["pipeline_metrics"]["stages"]
+    assert set(stages) == {"download", "transcribe", "nlp", "export"}
+    assert stages["transcribe"]["workers"] == 2
+    assert all(m["items"] == 3 for m in stages.values())
@@ -23,3 +23,170 @@ def test_state_store_basic_ops(monkeypatch, tmp_path):
     ).isoformat()
     recent = store.list_recent(days=7, feed_name=None)
     assert isinstance(recent, list)
+
+
+def test_state_store_journal_replay_and_compaction(monkeypatch, tmp_path):
+    state_dir = tmp_path / ".state"
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(state_dir))
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    store = st_mod.StateStore(journal=True, fsync_every=2, compact_after=100)
+
+    job = store.create_job({"service": "echo"})
+    job["status"] = "processed"
+    store.save_job(job)
+    store.mark_seen("feed", "k1")
+    store.close()
+    journal = state_dir / "state.journal.jsonl"
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+    assert not (state_dir / "state.json").exists()
+
+    # Simulate a torn append from a crash; replay ignores and trims it
+    with open(journal, "a", encoding="utf-8") as fh:
+        fh.write('{"op": "seen", "feed": "feed", "ke')
+    reopened = st_mod.StateStore(journal=True)
+    assert reopened.get_job(job["id"])["status"] == "processed"
+    assert reopened.has_seen("feed", "k1") is True
+    assert journal.read_text(encoding="utf-8").endswith("\n")
+
+    # Reaching the threshold on open folds the journal into state.json
+    compacted = st_mod.StateStore(journal=True, compact_after=2)
+    assert not journal.exists()
+    assert (state_dir / "state.json").exists()
+    assert compacted.get_job(job["id"])["status"] == "processed"
+    plain = st_mod.StateStore(journal=False)
+    assert plain.has_seen("feed", "k1") is True
+
+
+def test_state_store_merges_concurrent_writers(monkeypatch, tmp_path):
+    import pytest
+
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    for journal in (False, True):
+        monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / f".state-{journal}"))
+        a = st_mod.StateStore(journal=journal)
+        b = st_mod.StateStore(journal=journal)
+        a.mark_seen(f"feed-{journal}", "ka")
+        b.mark_seen(f"feed-{journal}", "kb")  # must not drop "ka"
+        job = a.create_job({"service": "echo"})
+        # Same-second job ids from different writers stay unique
+        assert b.create_job({"service": "echo"})["id"] != job["id"]
+        b.update_job(job["id"], lambda j: j.__setitem__("status", "processing"))
+
+        # a still holds the version it created; b moved the job on
+        job["status"] = "stale"
+        with pytest.raises(st_mod.StateConflictError):
+            a.save_job(job)
+
+        fresh = st_mod.StateStore(journal=journal)
+        assert fresh.has_seen(f"feed-{journal}", "ka")
+        assert fresh.has_seen(f"feed-{journal}", "kb")
+        assert fresh.get_job(job["id"])["status"] == "processing"
+        fresh_job = fresh.get_job(job["id"])
+        fresh_job["status"] = "processed"
+        fresh.save_job(fresh_job)
+        assert fresh_job["version"] == 3
+        for s in (a, b, fresh):
+            s.close()
+
+
+def test_state_store_shared_between_threads(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    store = st_mod.StateStore(journal=True)
+    job = store.create_job({"service": "echo"})
+
+    def bump(i):
+        store.update_job(job["id"], lambda j: j.__setitem__("n", j.get("n", 0) + 1))
+        store.mark_seen("feed", f"k{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(bump, range(200)))
+    store.close()
+    fresh = st_mod.StateStore(journal=True)
+    assert fresh.get_job(job["id"])["n"] == 200
+    assert all(fresh.has_seen("feed", f"k{i}") for i in range(200))
+
+
+def test_state_store_journal_records_only_changes(monkeypatch, tmp_path):
+    import json
+
+    state_dir = tmp_path / ".state"
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(state_dir))
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    store = st_mod.StateStore(journal=True)
+    job = store.create_job({"service": "echo", "big": "x" * 5000})
+    job["episodes"] = [{"slug": f"e{i}", "status": "new"} for i in range(50)]
+    store.save_job(job)
+    store.update_job(job["id"], lambda j: j["episodes"][7].update(status="done"))
+    job = store.get_job(job["id"])
+    job["status"] = "processed"
+    job.pop("config")
+    store.save_job(job)
+    store.close()
+
+    lines = (state_dir / "state.journal.jsonl").read_text(encoding="utf-8")
+    records = [json.loads(line) for line in lines.splitlines()]
+    assert [r["op"] for r in records] == ["job", "set", "set", "set"]
+    assert records[2]["fields"] == {"version": 3}
+    assert records[2]["episodes"] == {"7": {"slug": "e7", "status": "done"}}
+    assert records[3]["fields"] == {"status": "processed", "version": 4}
+    assert records[3]["unset"] == ["config"]
+    assert all(len(line) < 300 for line in lines.splitlines()[2:])
+
+    replayed = st_mod.StateStore(journal=True).get_job(job["id"])
+    assert replayed == job
+
+
+def test_state_store_journal_detects_conflicts_across_stores(monkeypatch, tmp_path):
+    import pytest
+
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    a = st_mod.StateStore(journal=True)
+    job_id = a.create_job({"service": "echo"})["id"]
+    b = st_mod.StateStore(journal=True)
+    job_a, job_b = a.get_job(job_id), b.get_job(job_id)
+    job_a["status"] = "A-done"
+    a.save_job(job_a)
+    job_b["status"] = "B-done"
+    with pytest.raises(st_mod.StateConflictError):
+        b.save_job(job_b)
+    # The stale handle was not rewritten behind the caller's back
+    assert job_b["status"] == "B-done" and job_b["version"] == 1
+    assert st_mod.StateStore(journal=True).get_job(job_id)["status"] == "A-done"
+    for s in (a, b):
+        s.close()
+
+
+def test_state_store_reads_see_other_stores(monkeypatch, tmp_path):
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / ".state"))
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    for journal in (False, True):
+        reader = st_mod.StateStore(journal=journal)
+        writer = st_mod.StateStore(journal=journal)
+        eps = [{"feed": "feed", "title": f"ep-{journal}"}]
+        job_id = writer.create_job_with_episodes({"service": "echo"}, eps)["id"]
+        writer.mark_seen("feed", f"k-{journal}")
+        writer.save_checkpoint(job_id, "ep", "transcribe", data={"ok": 1})
+        assert reader.get_job(job_id)["id"] == job_id
+        assert reader.has_seen("feed", f"k-{journal}")
+        assert reader.get_checkpoints(job_id)["ep"]["transcribe"]["ok"] == 1
+        recent = reader.list_recent(days=1, feed_name="feed")
+        assert f"ep-{journal}" in [ep["title"] for ep in recent]
+        for s in (reader, writer):
+            s.close()
+
+
+def test_state_store_shared_per_state_dir(monkeypatch, tmp_path):
+    st_mod = importlib.import_module("podcast_transcriber.storage.state")
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / "a"))
+    shared = st_mod.StateStore.shared()
+    assert st_mod.StateStore.shared() is shared
+    # Writes by other stores are still seen
+    job_id = st_mod.StateStore().create_job({"service": "echo"})["id"]
+    shared.save_checkpoint(job_id, "ep", "transcribed", data={"n": 1})
+    assert st_mod.StateStore().get_checkpoints(job_id)["ep"]["transcribed"]["n"] == 1
+    monkeypatch.setenv("PODCAST_STATE_DIR", str(tmp_path / "b"))
+    assert st_mod.StateStore.shared() is not shared
@@ -11,3 +11,122 @@ def test_cache_compute_get_set(tmp_path):
     c.set(str(tmp_path), key, {"text": "hello", "segments": []})
     got = c.get(str(tmp_path), key)
     assert got and got["text"] == "hello"
+
+
+def test_transcribe_cached_keys_on_transcription_options(tmp_path):
+    f = tmp_path / "a.wav"
+    f.write_bytes(b"RIFF..")
+    calls = []
+
+    class Svc:
+        model_name = "small"
+        last_segments = None
+
+        def transcribe(self, path, language=None):
+            calls.append(language)
+            self.last_segments = [{"start": 0.0, "end": 1.0, "text": language}]
+            return f"text-{language}"
+
+    svc = Svc()
+    kw = dict(service_name="whisper", cache_dir=str(tmp_path / "cache"))
+    assert c.transcribe_cached(svc, str(f), language="en", **kw) == "text-en"
+    svc.last_segments = None
+    assert c.transcribe_cached(svc, str(f), language="en", **kw) == "text-en"
+    assert svc.last_segments == [{"start": 0.0, "end": 1.0, "text": "en"}]
+    assert calls == ["en"]
+    # Each option that changes the transcript is part of the key
+    c.transcribe_cached(svc, str(f), language="sv", **kw)
+    c.transcribe_cached(svc, str(f), language="en", clip_minutes=5, **kw)
+    c.transcribe_cached(svc, str(f), language="en", translate=True, **kw)
+    c.transcribe_cached(svc, str(f), language="en", speakers=2, **kw)
+    svc.model_name = "large"
+    c.transcribe_cached(svc, str(f), language="en", **kw)
+    assert len(calls) == 6
+    c.transcribe_cached(svc, str(f), language="en", enabled=False, **kw)
+    assert len(calls) == 7
+
+
+def test_compute_key_follows_audio_content(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    a = tmp_path / "a.mp3"
+    a.write_bytes(b"ID3" + bytes(range(256)) * 40)
+    moved = tmp_path / "sub" / "renamed.mp3"
+    moved.parent.mkdir()
+    moved.write_bytes(a.read_bytes())
+
+    def key(path, source="src", **kw):
+        return c.compute_key(
+            source, "svc", ("o",), str(path), cache_dir=cache_dir, **kw
+        )
+
+    # Same audio from another URL/path (e.g. a fresh temp download) -> same key
+    assert key(a, source="https://x/1.mp3") == key(moved, source="/tmp/dl.mp3")
+
+    hashed = []
+    real_hash = c._hash_file
+    monkeypatch.setattr(
+        c, "_hash_file", lambda p, full: hashed.append(p) or real_hash(p, full)
+    )
+    # Unchanged file: served from the sidecar index without re-reading
+    key(a)
+    assert hashed == []
+    a.write_bytes(b"ID3" + bytes(range(256)) * 41)
+    assert key(a) != key(moved)
+    assert len(hashed) == 1
+
+    # Large files hash only sampled blocks unless a full hash is requested
+    monkeypatch.setattr(c, "SAMPLE_BLOCK_SIZE", 16)
+    monkeypatch.setattr(c, "SAMPLE_BLOCKS", 4)
+    big = tmp_path / "big.mp3"
+    big.write_bytes(bytes(range(256)) * 8)
+    assert c.content_hash(str(big), cache_dir=cache_dir).startswith("sampled:")
+    assert key(big, full_hash=True) != key(big)
+
+
+def test_memory_tier_serves_hot_entries_without_disk(tmp_path, monkeypatch):
+    from podcast_transcriber.utils.cache_store import DiskCache
+
+    monkeypatch.setattr(c, "_memory", None)
+    monkeypatch.setenv("PODCAST_TRANSCRIBER_MEMORY_CACHE", "1M")
+    key = "ab" * 32
+    c.set(str(tmp_path), key, {"text": "hot", "words": [{"w": "hot", "t": 0.5}]})
+
+    def no_disk(self, key):
+        raise AssertionError("served from memory")
+
+    monkeypatch.setattr(DiskCache, "get", no_disk)
+    got = c.get(str(tmp_path), key)
+    assert got["text"] == "hot" and got["words"] == [{"w": "hot", "t": 0.5}]
+    assert c.memory_tier().stats()["hits"] == 1
+    # Another cache dir never sees this process's entries for the key
+    assert c.get(str(tmp_path / "other"), key) is None
+    c.configure_memory(0)
+    assert c.get(str(tmp_path), key) is None  # disk path (patched) -> miss
+
+
+def test_text_only_hit_leaves_word_arrays_encoded(tmp_path):
+    import pickle
+
+    f = tmp_path / "a.wav"
+    f.write_bytes(b"RIFF..")
+    words = [
+        {"start": 0.1 * i, "end": 0.1 * i + 0.1, "word": f"w{i}"} for i in range(50)
+    ]
+
+    class Svc:
+        last_segments = last_words = None
+
+        def transcribe(self, path, language=None):
+            self.last_segments = [{"start": 0.0, "end": 5.0, "text": "hi"}]
+            self.last_words = words
+            return "hi"
+
+    kw = dict(service_name="whisper", cache_dir=str(tmp_path / "cache"))
+    c.transcribe_cached(Svc(), str(f), **kw)
+    svc = Svc()
+    assert c.transcribe_cached(svc, str(f), **kw) == "hi"
+    assert not svc.last_words.decoded and not svc.last_segments.decoded
+    # Reading them decodes on demand and behaves like the original lists
+    assert svc.last_segments == [{"start": 0.0, "end": 5.0, "text": "hi"}]
+    assert svc.last_segments.decoded and not svc.last_words.decoded
+    assert pickle.loads(pickle.dumps(svc.last_words)) == words
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from podcast_transcriber.utils import cache_codec
+from podcast_transcriber.utils.cache_store import DiskCache
+
+
+def _payload(n=200):
+    return {
+        "text": " ".join(f"word{i}" for i in range(n)),
+        "segments": [
+            {"start": i * 1.5, "end": i * 1.5 + 1.5, "text": f"seg {i}", "spk": None}
+            for i in range(n // 10)
+        ],
+        "words": [
+            {"start": i * 0.5, "end": i * 0.5 + 0.4, "word": f"word{i}"}
+            for i in range(n)
+        ],
+        "meta": {"lang": "sv", "n": n},
+    }
+
+
+def test_codec_roundtrip_is_columnar_compact_and_lazy():
+    payload = _payload()
+    payload["mixed"] = [{"a": 1}, {"b": 2}]  # not columnar-friendly: kept as JSON
+    data = cache_codec.encode(payload, codec=cache_codec.CODEC_GZIP)
+    assert cache_codec.is_encoded(data)
+    assert len(data) < len(json.dumps(payload, indent=2)) / 3
+    lazy = cache_codec.decode(data)
+    assert list(lazy) == list(payload)
+    assert lazy["text"] == payload["text"]
+    # Only the requested section has been decoded
+    assert set(lazy._values) == {"text"}
+    assert dict(lazy) == payload
+    assert lazy.get("missing") is None and "words" in lazy
+
+
+def test_codec_rejects_unknown_versions():
+    data = bytearray(cache_codec.encode({"text": "hi"}))
+    data[3] = 99
+    with pytest.raises(cache_codec.CodecError):
+        cache_codec.decode(bytes(data))
+
+
+def test_disk_cache_migrates_json_entries(tmp_path):
+    key_flat, key_shard = "aa" * 32, "bb" * 32
+    payload = _payload(20)
+    (tmp_path / f"{key_flat}.json").write_text(json.dumps(payload), encoding="utf-8")
+    dc = DiskCache(tmp_path)
+    # A 1.x-style sharded JSON entry already tracked by the manifest
+    shard = tmp_path / "bb" / "bb" / f"{key_shard}.json"
+    shard.parent.mkdir(parents=True)
+    shard.write_text(json.dumps(payload), encoding="utf-8")
+    with dc._db() as conn:
+        conn.execute(
+            "INSERT INTO entries VALUES(?, ?, ?, 0, 0, 0)",
+            (key_shard, f"bb/bb/{key_shard}.json", shard.stat().st_size),
+        )
+    for key in (key_flat, key_shard):
+        assert dict(dc.get(key)) == payload
+        bin_path = tmp_path / key[:2] / key[2:4] / f"{key}.bin"
+        assert cache_codec.is_encoded(bin_path.read_bytes())
+        assert dict(dc.get(key)) == payload
+    assert not (tmp_path / f"{key_flat}.json").exists() and not shard.exists()
+    assert dc.stats()["entries"] == 2
+
+
+def test_codec_keeps_number_types_and_hands_out_row_copies():
+    segments = [
+        {"start": 0, "end": 1.5, "id": 1},
+        {"start": 1.5, "end": 3, "id": 2},
+    ]
+    lazy = cache_codec.decode(cache_codec.encode({"segments": segments}))
+    rows = lazy["segments"]
+    assert rows == segments
+    assert [type(r["start"]) for r in rows] == [int, float]
+    assert [type(r["end"]) for r in rows] == [float, int]
+    # Edits by one reader never reach the shared decoded payload
+    rows[0]["start"] = 99
+    view = lazy.lazy("segments")
+    view[1]["id"] = 7
+    assert view[1]["id"] == 7
+    assert lazy["segments"] == segments and lazy.lazy("segments") == segments
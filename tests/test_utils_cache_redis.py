@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from podcast_transcriber.utils import cache as c  # noqa: E402
+from podcast_transcriber.utils import cache_codec  # noqa: E402
+from podcast_transcriber.utils.cache_redis import RedisCache  # noqa: E402
+
+
+def _node(server, **kw):
+    return RedisCache(
+        "redis://cache:6379/0", client=fakeredis.FakeRedis(server=server), **kw
+    )
+
+
+def test_redis_cache_roundtrip_stats_and_eviction():
+    server = fakeredis.FakeServer()
+    node = _node(server)
+    node.set("k1", {"text": "hello", "segments": [{"start": 0.0, "text": "hello"}]})
+    # Another node sees the same entry
+    got = _node(server).get("k1")
+    assert got["text"] == "hello" and got["segments"][0]["start"] == 0.0
+    assert node.get("missing") is None
+    size = len(cache_codec.encode({"text": "x" * 50}))
+    node.max_bytes = size * 3
+    for k in ("k2", "k3", "k4"):
+        node.set(k, {"text": "x" * 50})
+    stats = node.stats()
+    assert stats["evictions"] >= 1 and stats["bytes"] <= node.max_bytes
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert node.get("k1") is None  # least recently used went first
+    assert node.prune(max_bytes=0)["evicted"] == stats["entries"]
+
+
+def test_redis_lock_is_exclusive_and_owner_released():
+    server = fakeredis.FakeServer()
+    a, b = _node(server, lock_ttl=0.3), _node(server)
+    with a.lock("key") as held:
+        assert held
+        with b.lock("key", timeout=0.5) as other:  # outlives a's lease: renewed
+            assert not other
+    with b.lock("key", timeout=0.5) as held:
+        assert held
+
+
+def test_redis_lock_with_decoded_responses():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    node = RedisCache("redis://cache:6379/0", client=client, lock_ttl=0.2)
+    with node.lock("key") as held:
+        assert held
+        time.sleep(0.3)  # renewed while held
+        assert client.exists(node._k("lock", "key"))
+    assert not client.exists(node._k("lock", "key"))
+
+
+def test_transcribe_cached_single_flight_across_nodes(tmp_path, monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(c, "RedisCache", lambda url: _node(server))
+    monkeypatch.setattr(c, "_stores", {})
+    audio = tmp_path / "ep.mp3"
+    audio.write_bytes(b"ID3 audio")
+    calls = []
+
+    class SlowService:
+        def transcribe(self, path, language=None):
+            calls.append(path)
+            time.sleep(0.3)
+            return "transcript"
+
+    results = []
+
+    def worker():
+        results.append(
+            c.transcribe_cached(
+                SlowService(),
+                str(audio),
+                service_name="whisper",
+                cache_dir="redis://cache:6379/0",
+            )
+        )
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["transcript"] * 3
+    assert len(calls) == 1
@@ -0,0 +1,121 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+
+import podcast_transcriber.cli as cli
+from podcast_transcriber.utils import cache_codec, cache_store
+from podcast_transcriber.utils.cache_store import DiskCache
+
+
+def _key(n):
+    return f"{n:02x}" * 32
+
+
+def test_disk_cache_shards_and_counts(tmp_path):
+    dc = DiskCache(tmp_path)
+    dc.set(_key(1), {"text": "one"})
+    assert (tmp_path / "01" / "01" / f"{_key(1)}.bin").exists()
+    assert dc.get(_key(1)) == {"text": "one"}
+    assert dc.get(_key(2)) is None
+    stats = dc.stats()
+    assert stats["entries"] == 1 and stats["bytes"] > 0
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.parametrize("policy,survivor", [("lru", 1), ("lfu", 2)])
+def test_disk_cache_evicts_under_byte_budget(tmp_path, monkeypatch, policy, survivor):
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(cache_store.time, "time", lambda: next(clock))
+    payload = {"text": "x" * 100}
+    budget = int(len(cache_codec.encode(payload)) * 2.5)
+    dc = DiskCache(tmp_path, max_bytes=budget, policy=policy)
+    dc.set(_key(1), payload)
+    dc.set(_key(2), payload)
+    dc.get(_key(2))
+    dc.get(_key(2))
+    dc.get(_key(1))  # most recent, but used less often than key 2
+    dc.set(_key(3), payload)  # over budget: one of 1/2 must go
+    assert dc.get(_key(3)) is not None
+    assert dc.get(_key(survivor)) is not None
+    assert dc.get(_key(3 - survivor)) is None
+    assert dc.stats()["evictions"] == 1
+    assert dc.stats()["bytes"] <= budget
+
+
+def test_disk_cache_ttl_prune_and_legacy_entries(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_store.time, "time", lambda: now[0])
+    # Entries written by older versions sit flat in the cache dir
+    (tmp_path / f"{_key(9)}.json").write_text('{"text": "old"}', encoding="utf-8")
+    dc = DiskCache(tmp_path, ttl=60)
+    assert dc.get(_key(9)) == {"text": "old"}
+    assert not (tmp_path / f"{_key(9)}.json").exists()
+    dc.set(_key(1), {"text": "a"})
+    now[0] += 61
+    assert dc.get(_key(1)) is None
+    dc.set(_key(2), {"text": "b"})
+    assert dc.prune() == {"expired": 1, "missing": 0, "evicted": 0}  # key 9
+    assert dc.prune(max_bytes=0)["evicted"] == 1
+    assert dc.stats()["entries"] == 0
+
+
+def test_disk_cache_imports_legacy_entries_once(tmp_path):
+    (tmp_path / f"{_key(9)}.json").write_text('{"text": "old"}', encoding="utf-8")
+    (tmp_path / "notes.json").write_text("{}", encoding="utf-8")
+    dc = DiskCache(tmp_path)
+    assert dc.stats()["entries"] == 1 and (tmp_path / "notes.json").exists()
+    # Misses no longer probe for flat files; the import is recorded
+    (tmp_path / f"{_key(8)}.json").write_text('{"text": "late"}', encoding="utf-8")
+    assert dc.get(_key(8)) is None
+    assert DiskCache(tmp_path).get(_key(8)) is None
+    assert dc.get(_key(9)) == {"text": "old"}
+
+
+def test_cache_backend_requires_core_methods():
+    class Partial(cache_store.CacheBackend):
+        location = "x"
+
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_cli_cache_stats_and_prune(tmp_path):
+    from podcast_transcriber.utils import cache as c
+
+    c.set(str(tmp_path), _key(1), {"text": "hello"})
+    c.get(str(tmp_path), _key(1))
+    buf = io.StringIO()
+    with mock.patch("sys.stdout", buf):
+        code = cli.main(["cache", "stats", "--cache-dir", str(tmp_path), "--json"])
+    assert code == 0
+    stats = json.loads(buf.getvalue())
+    assert stats["entries"] == 1 and stats["hits"] == 1
+    buf = io.StringIO()
+    with mock.patch("sys.stdout", buf):
+        code = cli.main(
+            ["cache", "prune", "--cache-dir", str(tmp_path), "--max-bytes", "0"]
+        )
+    assert code == 0
+    assert "1 evicted" in buf.getvalue() and "entries: 0" in buf.getvalue()
+
+
+def test_memory_cache_is_lru_bounded_by_bytes():
+    from podcast_transcriber.utils.cache_store import MemoryCache
+
+    mem = MemoryCache(max_bytes=100)
+    mem.put("a", {"text": "x" * 30})
+    mem.put("b", {"text": "y" * 30})
+    assert mem.get("a") is not None  # b is now least recently used
+    mem.put("c", {"text": "z" * 30})
+    assert mem.get("b") is None and mem.get("c") is not None
+    mem.put("huge", {"text": "h" * 500})  # larger than the budget: not kept
+    assert mem.get("huge") is None
+    stats = mem.stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= 100
+    assert stats["evictions"] == 1
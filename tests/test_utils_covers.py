@@ -0,0 +1,101 @@
+import sys
+import types
+
+from podcast_transcriber.utils import covers
+
+
+class FakeResp:
+    def __init__(self, status, content=b"", headers=None):
+        self.status_code = status
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+def _fake_requests(monkeypatch, responses, calls):
+    def get(url, headers=None, timeout=None):
+        calls.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(get=get))
+
+
+def test_fetch_is_memoized_and_revalidated(tmp_path, monkeypatch):
+    calls = []
+    _fake_requests(
+        monkeypatch,
+        [FakeResp(200, b"IMG", {"ETag": '"v1"'}), FakeResp(304)],
+        calls,
+    )
+    cache = covers.CoverCache(tmp_path)
+    assert cache.fetch("https://x/cover.jpg") == b"IMG"
+    assert cache.fetch("https://x/cover.jpg") == b"IMG"  # same process: no request
+    assert calls == [{}]
+    # A later run revalidates with the stored ETag and reuses the body on 304
+    again = covers.CoverCache(tmp_path)
+    assert again.fetch("https://x/cover.jpg") == b"IMG"
+    assert calls[1] == {"If-None-Match": '"v1"'}
+
+
+def test_fetch_falls_back_to_stale_copy(tmp_path, monkeypatch):
+    calls = []
+    _fake_requests(monkeypatch, [FakeResp(200, b"IMG"), FakeResp(500)], calls)
+    covers.CoverCache(tmp_path).fetch("https://x/a.jpg")
+    assert covers.CoverCache(tmp_path).fetch("https://x/a.jpg") == b"IMG"
+    _fake_requests(monkeypatch, [FakeResp(404)], calls)
+    assert covers.CoverCache(tmp_path).fetch("https://x/missing.jpg") is None
+
+
+def test_variants_are_memoized_per_size(tmp_path, monkeypatch):
+    sizes = []
+
+    def fake_resize(data, size, quality):
+        sizes.append(size)
+        return b"JPEG" + bytes(str(size), "ascii")
+
+    monkeypatch.setattr(covers, "resize_jpeg", fake_resize)
+    cache = covers.CoverCache(tmp_path)
+    epub = cache.variant(b"IMG", covers.EPUB_SIZE)
+    assert cache.variant(b"IMG", covers.EPUB_SIZE) == epub
+    assert cache.variant(b"IMG", covers.PDF_SIZE) != epub
+    assert sizes == [covers.EPUB_SIZE, covers.PDF_SIZE]
+    # Variants persist on disk for other processes and runs
+    assert covers.CoverCache(tmp_path).variant(b"IMG", covers.EPUB_SIZE) == epub
+    assert len(sizes) == 2
+
+
+def test_get_cover_cache_memory_only_when_disabled(monkeypatch):
+    monkeypatch.setenv(covers.ENV_COVER_CACHE, "0")
+    assert covers.get_cover_cache().root is None
+    assert covers.docx_size(2) == (600, 1200)
+
+
+def test_memoized_covers_expire_and_revalidate(monkeypatch):
+    calls = []
+    _fake_requests(
+        monkeypatch,
+        [FakeResp(200, b"IMG", {"ETag": '"v1"'}), FakeResp(304), FakeResp(200, b"B")],
+        calls,
+    )
+    monkeypatch.setattr(covers, "FETCH_TTL", 0.0)
+    monkeypatch.setattr(covers, "MAX_MEMORY_COVERS", 1)
+    cache = covers.CoverCache(None)
+    assert cache.fetch("https://x/a.jpg") == b"IMG"
+    # Expired: conditional GET with the remembered ETag, body reused on 304
+    assert cache.fetch("https://x/a.jpg") == b"IMG"
+    assert calls[1] == {"If-None-Match": '"v1"'}
+    cache.fetch("https://x/b.jpg")
+    assert list(cache._fetched) == ["https://x/b.jpg"]
+
+
+def test_disk_budget_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(covers, "resize_jpeg", lambda data, size, q: data * 2)
+    cache = covers.CoverCache(tmp_path, max_bytes=10)
+    cache.variant(b"AAA")
+    cache.variant(b"BBB")  # 12 bytes on disk: the older variant goes
+    files = [p.read_bytes() for p in (tmp_path / "variants").glob("*/*")]
+    assert files == [b"BBBBBB"]
+    assert cache.prune(0) == 0
@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from podcast_transcriber.utils.pipeline import PipelineError, Stage, run_pipeline
+
+
+def test_run_pipeline_orders_results_and_reports_metrics():
+    active = {"n": 0, "max": 0}
+    lock = threading.Lock()
+
+    def slow_square(x):
+        with lock:
+            active["n"] += 1
+            active["max"] = max(active["max"], active["n"])
+        time.sleep(0.02 * (5 - x))
+        with lock:
+            active["n"] -= 1
+        return x * x
+
+    seen = []
+    results, metrics = run_pipeline(
+        range(5),
+        [Stage("add", lambda x: x + 1, 1), Stage("square", slow_square, 3)],
+        queue_size=1,
+        on_result=lambda i, v: seen.append(i),
+    )
+    assert results == [1, 4, 9, 16, 25]
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+    assert active["max"] > 1  # stage pool ran items concurrently
+    square = metrics["stages"]["square"]
+    assert square["items"] == 5 and square["workers"] == 3
+    assert 0 < square["utilization"] <= 1
+    assert metrics["stages"]["add"]["blocked_s"] >= 0
+
+
+def test_run_pipeline_raises_after_drain():
+    def boom(x):
+        if x == 1:
+            raise ValueError("bad item")
+        return x
+
+    with pytest.raises(PipelineError) as ei:
+        run_pipeline([0, 1, 2], [Stage("s1", boom), Stage("s2", lambda x: x)])
+    assert ei.value.stage == "s1" and ei.value.index == 1
+    assert isinstance(ei.value.error, ValueError)
+    assert ei.value.metrics["stages"]["s1"]["errors"] == 1
@@ -0,0 +1,83 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from podcast_transcriber.utils import cache as c
+from podcast_transcriber.utils.singleflight import SingleFlight
+
+
+def test_single_flight_shares_result_and_errors():
+    flight = SingleFlight()
+    runs = []
+    gate = threading.Event()
+
+    def slow():
+        runs.append(1)
+        gate.wait(2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(runs) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 3
+    assert flight.in_flight() == 0
+
+    def boom():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        flight.do("k", boom)
+    assert flight.do("k", lambda: "again") == ("again", False)
+
+
+class _SlowService:
+    def __init__(self, log):
+        self.log = log
+        self.last_segments = None
+
+    def transcribe(self, path, language=None):
+        with open(self.log, "a", encoding="utf-8") as fh:
+            fh.write("run\n")
+        time.sleep(0.4)
+        self.last_segments = [{"start": 0.0, "end": 1.0, "text": "hi"}]
+        return "shared transcript"
+
+
+def _transcribe_in_child(audio, cache_dir, log, out):
+    svc = _SlowService(log)
+    text = c.transcribe_cached(svc, audio, service_name="whisper", cache_dir=cache_dir)
+    out.put((text, svc.last_segments))
+
+
+def test_identical_transcriptions_run_once_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    audio = tmp_path / "ep.mp3"
+    audio.write_bytes(b"ID3 cross-posted episode")
+    log = tmp_path / "runs.log"
+    out = ctx.Queue()
+    args = (str(audio), str(tmp_path / "cache"), str(log), out)
+    procs = [ctx.Process(target=_transcribe_in_child, args=args) for _ in range(3)]
+    for p in procs:
+        p.start()
+    results = [out.get(timeout=20) for _ in procs]
+    for p in procs:
+        p.join(timeout=20)
+    assert log.read_text(encoding="utf-8").count("run") == 1
+    # Waiters get the first run's transcript and segments
+    assert (
+        results
+        == [("shared transcript", [{"start": 0.0, "end": 1.0, "text": "hi"}])] * 3
+    )